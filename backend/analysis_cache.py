@@ -0,0 +1,129 @@
+"""
+Analysis Cache - Memoizes analyzer results per resume
+Results are keyed by (resume id, result kind, target, career DB version), so a
+catalogue update invalidates everything and a resume can be invalidated on its own.
+The *_json variants keep the serialized response bytes of each result as well,
+in a second LRU bounded by total bytes so they never crowd out the results.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, List, Set, Tuple
+
+from models import ResumeData, ResumeAnalysis, SkillGap, CareerPath, LearningRoadmap
+from json_response import json_bytes
+from career_analyzer import (
+    analyze_resume, detect_skill_gaps, match_career_paths,
+    generate_learning_roadmap, career_db_version
+)
+
+
+class AnalysisCache:
+    """Bounded LRU of analyzer outputs with per-resume invalidation"""
+
+    def __init__(self, max_entries: int, max_json_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max(max_entries, 1)
+        self.max_json_bytes = max(max_json_bytes, 0)
+        self._entries: "OrderedDict[Tuple, object]" = OrderedDict()
+        self._fragments: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._fragment_bytes = 0
+        # Keys of both LRUs per resume, for invalidation
+        self._keys_by_resume: Dict[str, Set[Tuple]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _memoize(self, resume: ResumeData, kind: str, target: str, compute: Callable):
+        key = (resume.id, kind, target, career_db_version())
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        self._keys_by_resume.setdefault(resume.id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+        return result
+
+    def _memoize_json(self, resume: ResumeData, kind: str, target: str, compute: Callable[[], bytes]) -> bytes:
+        key = (resume.id, kind + ".json", target, career_db_version())
+        if key in self._fragments:
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return self._fragments[key]
+        self.misses += 1
+        data = compute()
+        if len(data) > self.max_json_bytes:
+            # Larger than the whole budget: serve it without evicting everything else
+            return data
+        self._fragments[key] = data
+        self._fragment_bytes += len(data)
+        self._keys_by_resume.setdefault(resume.id, set()).add(key)
+        while self._fragment_bytes > self.max_json_bytes:
+            self._discard(next(iter(self._fragments)))
+        return data
+
+    def _discard(self, key: Tuple):
+        self._entries.pop(key, None)
+        data = self._fragments.pop(key, None)
+        if data is not None:
+            self._fragment_bytes -= len(data)
+        keys = self._keys_by_resume.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_resume[key[0]]
+
+    def analysis(self, resume: ResumeData) -> ResumeAnalysis:
+        return self._memoize(resume, "analysis", "", lambda: analyze_resume(resume))
+
+    def skill_gaps(self, resume: ResumeData, target_role: str = "") -> List[SkillGap]:
+        return self._memoize(resume, "gaps", target_role, lambda: detect_skill_gaps(resume, target_role))
+
+    def career_paths(self, resume: ResumeData) -> List[CareerPath]:
+        return self._memoize(resume, "paths", "", lambda: match_career_paths(resume))
+
+    def roadmap(self, resume: ResumeData, target_career: str = "") -> LearningRoadmap:
+        # Reuse the memoized gaps/paths instead of letting the roadmap recompute them
+        return self._memoize(resume, "roadmap", target_career, lambda: generate_learning_roadmap(
+            resume, target_career,
+            gaps=self.skill_gaps(resume, target_career),
+            paths=self.career_paths(resume) if not target_career else None
+        ))
+
+    # Serialized once per result. The resume itself is not cached: it is cheap to
+    # encode per request and its JSON (with raw_text) is what CompactResume saves
+
+    def analysis_json(self, resume: ResumeData) -> bytes:
+        return self._memoize_json(resume, "analysis", "", lambda: self.analysis(resume).model_dump_json().encode())
+
+    def skill_gaps_json(self, resume: ResumeData, target_role: str = "") -> bytes:
+        return self._memoize_json(resume, "gaps", target_role, lambda: json_bytes(self.skill_gaps(resume, target_role)))
+
+    def career_paths_json(self, resume: ResumeData) -> bytes:
+        return self._memoize_json(resume, "paths", "", lambda: json_bytes(self.career_paths(resume)))
+
+    def roadmap_json(self, resume: ResumeData, target_career: str = "") -> bytes:
+        return self._memoize_json(resume, "roadmap", target_career,
+                                  lambda: self.roadmap(resume, target_career).model_dump_json().encode())
+
+    def invalidate(self, resume_id: str):
+        """Drop every cached result for a resume (e.g. after it is replaced)"""
+        for key in list(self._keys_by_resume.get(resume_id, ())):
+            self._discard(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._fragments.clear()
+        self._fragment_bytes = 0
+        self._keys_by_resume.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "json_entries": len(self._fragments),
+            "json_bytes": self._fragment_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,231 @@
+"""
+Batch Ingestion - Parses whole cohorts of resumes in the background
+A batch (zip archive or multipart file list) becomes a job whose members are
+streamed through a bounded set of workers; each file succeeds or fails on its own
+and clients can poll the job or stream its per-file results as they complete
+"""
+import asyncio
+import time
+import uuid
+import zipfile
+import zlib
+from collections import OrderedDict
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from upload_ingest import spool_stream, UploadTooLarge, UnsupportedContent
+from extraction_pool import ExtractionQueueFull
+
+
+ALLOWED_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt')
+
+# (spooled content, filename) pairs fed to the workers
+BatchMember = Tuple[SpooledTemporaryFile, str]
+# Parses one member and returns a per-file result dict
+MemberHandler = Callable[[SpooledTemporaryFile, str], Awaitable[Dict]]
+
+
+def file_extension(filename: str) -> str:
+    return '.' + filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+
+
+def iter_zip_members(archive: SpooledTemporaryFile, max_members: int, max_bytes: int,
+                     chunk_size: int, spool_bytes: int) -> Iterator[Tuple[Optional[BatchMember], str, Optional[str]]]:
+    """Yield (member, filename, error) for each resume file in a zip, one at a time
+
+    Members are decompressed into their own size-capped spool only when reached, so
+    the archive is never expanded in memory as a whole.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        infos = [info for info in zf.infolist()
+                 if not info.is_dir() and not info.filename.startswith('__MACOSX/')]
+        for count, info in enumerate(infos):
+            filename = info.filename.rsplit('/', 1)[-1]
+            if count >= max_members:
+                yield None, filename, f"Batch exceeds the {max_members} file limit"
+                continue
+            file_ext = file_extension(filename)
+            if file_ext not in ALLOWED_EXTENSIONS:
+                yield None, filename, f"Unsupported file type: {file_ext or 'none'}"
+                continue
+            if info.file_size > max_bytes:
+                yield None, filename, f"File exceeds the {max_bytes / (1024 * 1024):g} MB upload limit"
+                continue
+            try:
+                with zf.open(info) as stream:
+                    # The spool limit also guards against lying size headers (zip bombs)
+                    spool = spool_stream(stream, file_ext, max_bytes, chunk_size, spool_bytes)
+            except (UploadTooLarge, UnsupportedContent, zipfile.BadZipFile, RuntimeError,
+                    zlib.error, NotImplementedError, EOFError) as e:
+                # Corrupt deflate data, unsupported compression methods and truncated
+                # members fail that member only, like any other bad file
+                yield None, filename, str(e) or f"Unreadable archive member ({type(e).__name__})"
+                continue
+            yield (spool, filename), filename, None
+
+
+class BatchJob:
+    """Progress, per-file results and throughput of one batch upload"""
+
+    def __init__(self, total: Optional[int] = None):
+        self.id = str(uuid.uuid4())
+        self.status = "queued"
+        self.total = total
+        self.results: List[Dict] = []
+        self.bytes_processed = 0
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._changed = asyncio.Condition()
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r["status"] == "success")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r["status"] == "error")
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    async def add_result(self, result: Dict):
+        async with self._changed:
+            self.results.append(result)
+            self._changed.notify_all()
+
+    async def finish(self, status: str):
+        async with self._changed:
+            self.status = status
+            self.finished_at = time.time()
+            if self.total is None:
+                self.total = len(self.results)
+            self._changed.notify_all()
+
+    def metrics(self) -> Dict:
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0.0
+        processed = len(self.results)
+        return {
+            "processed": processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "bytes_processed": self.bytes_processed,
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(processed / elapsed, 2) if elapsed else 0.0,
+            "mb_per_second": round(self.bytes_processed / (1024 * 1024) / elapsed, 3) if elapsed else 0.0,
+        }
+
+    def summary(self, include_results: bool = True) -> Dict:
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "total": self.total,
+            "metrics": self.metrics(),
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
+
+    async def stream_results(self) -> AsyncIterator[Dict]:
+        """Yield each per-file result as it lands, then return once the job is done"""
+        sent = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.results) > sent or self.done)
+                pending = self.results[sent:]
+                finished = self.done
+            for result in pending:
+                yield result
+            sent += len(pending)
+            if finished and sent >= len(self.results):
+                return
+
+
+class BatchIngestor:
+    """Runs batch jobs with a fixed number of concurrent member workers"""
+
+    def __init__(self, handler: MemberHandler, concurrency: int, max_jobs: int):
+        self.handler = handler
+        self.concurrency = max(concurrency, 1)
+        self.max_jobs = max(max_jobs, 1)
+        self.jobs: "OrderedDict[str, BatchJob]" = OrderedDict()
+        self._tasks = set()
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        return self.jobs.get(job_id)
+
+    def submit(self, members: Iterator[Tuple[Optional[BatchMember], str, Optional[str]]],
+               total: Optional[int] = None) -> BatchJob:
+        """Register a job and start processing its members in the background"""
+        job = BatchJob(total)
+        self.jobs[job.id] = job
+        # Forget the oldest finished jobs beyond the retention limit
+        for old_id in [jid for jid, old in self.jobs.items() if old.done][:max(len(self.jobs) - self.max_jobs, 0)]:
+            del self.jobs[old_id]
+
+        task = asyncio.create_task(self._run(job, members))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: BatchJob, members):
+        job.status = "running"
+        job.started_at = time.time()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._worker(job, queue)) for _ in range(self.concurrency)]
+        try:
+            while True:
+                # Reading/decompressing the next member is blocking file IO
+                item = await asyncio.to_thread(next, members, None)
+                if item is None:
+                    break
+                member, filename, error = item
+                if error is not None:
+                    await job.add_result({"filename": filename, "status": "error", "error": error})
+                    continue
+                await queue.put(member)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            await job.finish("completed")
+        except Exception as e:
+            for worker in workers:
+                worker.cancel()
+            # Members still waiting for a worker own spooled (possibly on-disk) copies
+            while not queue.empty():
+                member = queue.get_nowait()
+                if member is not None:
+                    member[0].close()
+            await job.add_result({"filename": None, "status": "error", "error": f"Batch aborted: {e}"})
+            await job.finish("failed")
+        finally:
+            # Release the archive if the member generator was not exhausted
+            close = getattr(members, "close", None)
+            if close is not None:
+                close()
+
+    async def _worker(self, job: BatchJob, queue: asyncio.Queue):
+        while True:
+            member = await queue.get()
+            if member is None:
+                return
+            spool, filename = member
+            with spool:
+                size = spool.seek(0, 2)
+                spool.seek(0)
+                result = await self._process(spool, filename)
+            job.bytes_processed += size
+            await job.add_result(result)
+
+    async def _process(self, spool: SpooledTemporaryFile, filename: str) -> Dict:
+        delay = 0.05
+        while True:
+            try:
+                return await self.handler(spool, filename)
+            except ExtractionQueueFull:
+                # Share the extraction pool with interactive uploads: back off, don't fail
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+            except Exception as e:
+                return {"filename": filename, "status": "error", "error": str(e)}
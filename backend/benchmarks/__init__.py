@@ -0,0 +1,14 @@
+"""
+Benchmarks - Performance and robustness harnesses for the backend
+Run modules from the backend directory:
+
+    python -m benchmarks.micro       # hot-path micro-benchmarks (parse, analysis, mentor)
+    python -m benchmarks.load        # in-process ASGI load driver (p50/p95/p99, req/s)
+    python -m benchmarks.memory      # bytes per resident resume, per representation
+    python -m benchmarks.serialization  # share of dashboard latency spent encoding JSON
+    python -m benchmarks.regex_fuzz  # adversarial inputs against the field extractors
+    python -m benchmarks.parse_cases # resume layouts that must keep parsing correctly
+
+micro, load, memory and serialization compare against the baselines in benchmarks/baselines/;
+re-record them with --save-baseline after an intended performance change.
+"""
@@ -0,0 +1,92 @@
+"""
+Baseline - Stored benchmark results and regression checks
+Each harness saves its results as benchmarks/baselines/<name>.json together
+with the machine they were measured on; later runs are compared metric by
+metric and anything worse than the tolerance is reported as a regression.
+"""
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+Results = Dict[str, Dict[str, float]]
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": str(os.cpu_count() or 1),
+    }
+
+
+def baseline_path(name: str) -> str:
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name: str, results: Results, settings: Optional[Dict] = None) -> str:
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = baseline_path(name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": environment(),
+            "settings": settings or {},
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def load_baseline(name: str) -> Optional[Dict]:
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: Results, baseline: Results, metrics: Dict[str, bool],
+            tolerance: float) -> List[Tuple[str, str, float, float]]:
+    """(case, metric, baseline, current) for every metric worse than the tolerance
+
+    ``metrics`` maps metric name -> True if higher is better (throughput),
+    False if lower is better (latency). Cases missing on either side are skipped.
+    """
+    regressions = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if not previous:
+            continue
+        for metric, higher_is_better in metrics.items():
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            worse = after < before / (1 + tolerance) if higher_is_better else after > before * (1 + tolerance)
+            if worse:
+                regressions.append((case, metric, before, after))
+    return regressions
+
+
+def check_against_baseline(name: str, results: Results, metrics: Dict[str, bool], tolerance: float) -> bool:
+    """Print regressions against the stored baseline; False if there are any"""
+    stored = load_baseline(name)
+    if stored is None:
+        print(f"\nNo baseline at {baseline_path(name)}; run with --save-baseline first")
+        return True
+    if stored.get("environment") != environment():
+        print(f"\nNote: baseline was recorded on {stored.get('environment')}, this is {environment()}")
+    regressions = compare(results, stored["results"], metrics, tolerance)
+    if not regressions:
+        print(f"\nPASS: no regression beyond {tolerance:.0%} against the {stored.get('recorded_at', '')} baseline")
+        return True
+    print(f"\nFAIL: {len(regressions)} regression(s) beyond {tolerance:.0%}:")
+    for case, metric, before, after in regressions:
+        print(f"  {case:44} {metric:10} {before:12.2f} -> {after:12.2f} ({after / before:.2f}x)")
+    return False
@@ -0,0 +1,121 @@
+"""
+Corpus - Deterministic synthetic resumes for benchmarks
+Resumes come in three sizes (small: one page, medium: a full multi-section
+resume, huge: a long CV with many roles and projects) and can be rendered as
+TXT, DOCX (python-docx) or PDF (a minimal built-in writer, one text line per
+row, paginated), so the whole upload pipeline can be exercised.
+"""
+import io
+import random
+from typing import Dict, List, Tuple
+
+SIZES = {
+    # roles, projects, skill lines, summary sentences
+    "small": (1, 1, 1, 1),
+    "medium": (4, 3, 2, 3),
+    "huge": (60, 40, 12, 20),
+}
+FORMATS = ("txt", "docx", "pdf")
+
+_NAMES = ["Jane Doe", "John Smith", "Priya Patel", "Wei Zhang", "Maria Garcia", "Ahmed Khan"]
+_ROLES = ["Senior Software Engineer", "Backend Developer", "Data Analyst", "Product Manager",
+          "Cloud Architect", "QA Specialist", "Machine Learning Engineer", "DevOps Engineer"]
+_COMPANIES = ["Acme Corp", "Widgets Inc", "Globex", "Initech", "Umbrella Labs", "Hooli"]
+_SKILLS = ["Python", "JavaScript", "TypeScript", "React", "Node.js", "AWS", "Docker", "Kubernetes", "SQL",
+           "PostgreSQL", "Redis", "Go", "Java", "TensorFlow", "PyTorch", "pandas", "Git", "Linux",
+           "Terraform", "GraphQL", "machine learning", "CI/CD", "Agile", "leadership", "communication"]
+_VERBS = ["Developed", "Led", "Built", "Designed", "Implemented", "Optimized", "Improved", "Delivered"]
+_LEVELS = ["expert in", "proficient with", "familiar with", "learning", "experienced with"]
+_DEGREES = ["Bachelor of Science in Computer Science, MIT 2016", "MS in Statistics, Stanford 2018",
+            "B.Tech Electronics, IIT 2015", "MBA, Wharton 2020"]
+
+
+def resume_text(size: str, seed: int = 0) -> str:
+    """One synthetic resume as plain text"""
+    roles, projects, skill_lines, sentences = SIZES[size]
+    rng = random.Random(f"{size}-{seed}")
+    lines = [rng.choice(_NAMES), "jane.doe@example.com | +1 (555) 123-4567 | github.com/janedoe", "Summary"]
+    for _ in range(sentences):
+        lines.append(f"Engineer {rng.choice(_LEVELS)} {rng.choice(_SKILLS)} and {rng.choice(_SKILLS)} "
+                     f"with {rng.randint(2, 15)} years of experience shipping production systems.")
+    lines.append("Experience")
+    for _ in range(roles):
+        lines.append(f"{rng.choice(_ROLES)} at {rng.choice(_COMPANIES)} {rng.randint(2005, 2024)}")
+        for _ in range(3):
+            lines.append(f"- {rng.choice(_VERBS)} services with {rng.choice(_SKILLS)} and {rng.choice(_SKILLS)}, "
+                         f"improving latency by {rng.randint(10, 60)}%.")
+    lines.append("Education")
+    lines.append(rng.choice(_DEGREES))
+    lines.append("Skills")
+    for _ in range(skill_lines):
+        lines.append(", ".join(rng.sample(_SKILLS, 8)))
+    lines.append("Projects")
+    for _ in range(projects):
+        lines.append(f"{rng.choice(_VERBS)} a {rng.choice(_SKILLS)} platform used by {rng.randint(1, 90)}k users.")
+    lines.append("Certifications")
+    lines.append("AWS Certified Solutions Architect")
+    return "\n".join(lines) + "\n"
+
+
+def render_docx(text: str) -> bytes:
+    from docx import Document
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1", "replace").decode("latin-1")
+
+
+def render_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """Minimal PDF: Helvetica, one text line per row, uncompressed content streams"""
+    rows = text.split("\n")
+    pages = [rows[i:i + lines_per_page] for i in range(0, max(len(rows), 1), lines_per_page)]
+    objects: List[bytes] = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    kids = []
+    for page in pages:
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 780 Td"]
+        ops.extend(f"({_pdf_escape(line)}) Tj T*" for line in page)
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % content_id)
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref)
+    return bytes(out)
+
+
+def render(text: str, fmt: str) -> Tuple[bytes, str]:
+    """(file bytes, filename) for a resume in the given format"""
+    if fmt == "pdf":
+        return render_pdf(text), "resume.pdf"
+    if fmt == "docx":
+        return render_docx(text), "resume.docx"
+    return text.encode("utf-8"), "resume.txt"
+
+
+def build_corpus(per_size: int = 3) -> Dict[Tuple[str, str], List[Tuple[bytes, str]]]:
+    """(size, format) -> list of rendered resumes"""
+    corpus = {}
+    for size in SIZES:
+        texts = [resume_text(size, seed) for seed in range(per_size)]
+        for fmt in FORMATS:
+            corpus[(size, fmt)] = [render(text, fmt) for text in texts]
+    return corpus
@@ -0,0 +1,173 @@
+"""
+Load - In-process ASGI load driver for the API
+Runs the app's lifespan and drives it through httpx's ASGI transport (no
+sockets), with a fixed number of concurrent clients per scenario. Reports
+p50/p95/p99 latency, throughput and error counts per endpoint.
+
+    python -m benchmarks.load [--requests N] [--concurrency C] [--scenario NAME]
+                              [--save-baseline] [--check] [--tolerance 0.5]
+"""
+import argparse
+import asyncio
+import itertools
+import math
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+from benchmarks.baseline import Results, check_against_baseline, save_baseline
+from benchmarks.corpus import FORMATS, SIZES, render, resume_text
+from benchmarks.micro import MENTOR_MESSAGES
+
+BASELINE = "load"
+METRICS = {"p50_ms": False, "p95_ms": False, "rps": True}
+
+# Request builder: (request number, uploaded resume ids) -> httpx request arguments
+RequestFactory = Callable[[int, List[str]], Tuple[str, str, Dict]]
+
+
+def _upload(i: int, ids: List[str]) -> Tuple[str, str, Dict]:
+    # A fresh resume per request so the parse cache does not short-circuit extraction
+    size = ("small", "medium", "huge")[i % 3]
+    text = resume_text(size, seed=1000 + i)
+    return "POST", "/api/upload-resume", {"files": {"file": (f"resume-{i}.txt", text.encode(), "text/plain")}}
+
+
+def _get(path: str) -> RequestFactory:
+    return lambda i, ids: ("GET", path.format(id=ids[i % len(ids)]), {})
+
+
+def _chat(i: int, ids: List[str]) -> Tuple[str, str, Dict]:
+    messages = list(MENTOR_MESSAGES.values())
+    return "POST", "/api/chat", {"json": {"message": messages[i % len(messages)], "resume_id": ids[i % len(ids)]}}
+
+
+SCENARIOS: Dict[str, RequestFactory] = {
+    "health": _get("/health"),
+    "upload-resume": _upload,
+    "resume": _get("/api/resume/{id}"),
+    "analyze": _get("/api/analyze/{id}"),
+    "skill-gaps": _get("/api/skill-gaps/{id}"),
+    "career-paths": _get("/api/career-paths/{id}"),
+    "learning-roadmap": _get("/api/learning-roadmap/{id}"),
+    "dashboard": _get("/api/dashboard/{id}"),
+    "chat": _chat,
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+async def drive(client: httpx.AsyncClient, factory: RequestFactory, ids: List[str],
+                requests: int, concurrency: int) -> Dict[str, float]:
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while True:
+            i = next(counter)
+            if i >= requests:
+                return
+            method, url, kwargs = factory(i, ids)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except Exception:
+                # A transport failure is one failed request, not the end of the scenario
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "rps": round(len(latencies) / wall, 1),
+        "errors": errors,
+    }
+
+
+async def seed_resumes(client: httpx.AsyncClient) -> List[str]:
+    """Upload one resume per size and format; their ids feed the read scenarios"""
+    ids = []
+    for size in SIZES:
+        for fmt in FORMATS:
+            data, filename = render(resume_text(size), fmt)
+            response = await client.post("/api/upload-resume", files={"file": (filename, data)})
+            response.raise_for_status()
+            ids.append(response.json()["resume_id"])
+    return ids
+
+
+async def wait_for_warmup(client: httpx.AsyncClient, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if (await client.get("/health")).json().get("warmup") not in ("pending", "running"):
+            return
+        await asyncio.sleep(0.05)
+
+
+async def run(scenarios: List[str], requests: int, concurrency: int) -> Results:
+    from main import app
+
+    results: Results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            await wait_for_warmup(client)
+            ids = await seed_resumes(client)
+            print(f"{'scenario':18} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9} {'req/s':>9} {'errors':>7}")
+            for name in scenarios:
+                factory = SCENARIOS[name]
+                # A short warm-up pass, then the measured run
+                await drive(client, factory, ids, min(concurrency, requests), concurrency)
+                row = await drive(client, factory, ids, requests, concurrency)
+                results[name] = row
+                print(f"{name:18} {row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {row['p99_ms']:9.2f} "
+                      f"{row['mean_ms']:9.2f} {row['rps']:9.1f} {row['errors']:7d}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="run only these scenarios (repeatable)")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions or errors")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = 50%%")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.scenario or list(SCENARIOS), args.requests, args.concurrency))
+    failed = any(row["errors"] for row in results.values())
+    if failed:
+        print("\nFAIL: some requests failed or returned an error status")
+    if args.save_baseline:
+        settings = {"requests": args.requests, "concurrency": args.concurrency}
+        print(f"\nBaseline saved to {save_baseline(BASELINE, results, settings)}")
+    elif not check_against_baseline(BASELINE, results, METRICS, args.tolerance):
+        failed = True
+    if failed and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
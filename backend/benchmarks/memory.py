@@ -0,0 +1,102 @@
+"""
+Memory - Bytes per resident resume for each in-memory representation
+Parses synthetic resumes and keeps N of them as full ResumeData models, as the
+previous store entries (ResumeData without raw_text + compressed text) and as
+CompactResume records, measuring retained bytes with tracemalloc and the
+cost of reading one back as ResumeData.
+
+    python -m benchmarks.memory [--resumes N] [--size small|medium|huge] [--save-baseline] [--check]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.baseline import Results, check_against_baseline, save_baseline
+from benchmarks.corpus import SIZES, resume_text
+from compact_resume import CompactResume, compress_text, decompress_text
+from models import ResumeData
+from resume_parser import build_resume
+
+BASELINE = "memory"
+METRICS = {"bytes_per_resume": False}
+
+
+def _pydantic_entry(resume: ResumeData):
+    return resume.model_copy(update={"raw_text": ""}), compress_text(resume.raw_text)
+
+
+def _pydantic_read(entry) -> ResumeData:
+    resume, blob = entry
+    return resume.model_copy(update={"raw_text": decompress_text(blob)})
+
+
+REPRESENTATIONS: Dict[str, Callable[[ResumeData], object]] = {
+    "resume_data": lambda resume: resume,
+    "pydantic_store_entry": _pydantic_entry,
+    "compact": CompactResume,
+}
+READERS: Dict[str, Callable[[object], ResumeData]] = {
+    "resume_data": lambda resume: resume.model_copy(),
+    "pydantic_store_entry": _pydantic_read,
+    "compact": lambda compact: compact.to_resume(),
+}
+
+
+def retained_bytes(texts: List[str], make: Callable[[ResumeData], object]) -> float:
+    """Bytes still allocated per resume once N parsed resumes are held in one form"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [make(build_resume(text)) for text in texts]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / len(texts)
+
+
+def read_us(texts: List[str], make: Callable, read: Callable, loops: int = 5) -> float:
+    held = [make(build_resume(text)) for text in texts[:200]]
+    start = time.perf_counter()
+    for _ in range(loops):
+        for item in held:
+            read(item)
+    return (time.perf_counter() - start) / (loops * len(held)) * 1e6
+
+
+def run(count: int, size: str) -> Results:
+    texts = [resume_text(size, seed) for seed in range(count)]
+    results: Results = {}
+    print(f"{count} {size} resumes ({sum(map(len, texts)) // count} chars of text each)\n")
+    print(f"{'representation':24} {'bytes/resume':>14} {'read us':>10}")
+    for name, make in REPRESENTATIONS.items():
+        row = {
+            "bytes_per_resume": round(retained_bytes(texts, make)),
+            "read_us": round(read_us(texts, make, READERS[name]), 2),
+        }
+        results[f"{name}[{size}]"] = row
+        print(f"{name:24} {row['bytes_per_resume']:14,d} {row['read_us']:10.1f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed growth, 0.1 = 10%%")
+    args = parser.parse_args()
+
+    results = run(args.resumes, args.size)
+    if args.save_baseline:
+        print(f"\nBaseline saved to {save_baseline(BASELINE, results, {'resumes': args.resumes})}")
+    elif not check_against_baseline(BASELINE, results, METRICS, args.tolerance) and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Micro - Hot-path micro-benchmarks over the synthetic corpus
+Times parse_resume (every size and format), extract_skills, analyze_resume,
+match_career_paths, generate_learning_roadmap and AIMentor.generate_response
+(one case per intent), reporting per-resume min/median/max in microseconds.
+
+    python -m benchmarks.micro [--filter TEXT] [--quick] [--save-baseline] [--check] [--tolerance 0.5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from benchmarks.baseline import Results, check_against_baseline, save_baseline
+from benchmarks.corpus import FORMATS, SIZES, build_corpus
+from resume_parser import build_resume, extract_skills, extract_text, parse_resume
+from career_analyzer import analyze_resume, generate_learning_roadmap, match_career_paths
+from ai_engine import AIMentor
+
+BASELINE = "micro"
+# Lower is better for every metric
+METRICS = {"median_us": False}
+
+MENTOR_MESSAGES = {
+    "greeting": "Hello there!",
+    "resume": "How can I improve my resume?",
+    "interview": "How should I prepare for interviews?",
+    "salary": "How do I negotiate my salary?",
+    "learning": "What should I learn next?",
+    "career": "Which career path suits me?",
+    "project": "Can you suggest some project ideas?",
+    "job_search": "How do I find a job faster?",
+    "general": "Thanks, anything else?",
+}
+
+
+def time_case(fn: Callable, inputs: Sequence, repeat: int, min_time: float) -> Dict[str, float]:
+    """Per-input timings of ``fn`` over ``inputs``: loops are calibrated to last at least min_time"""
+    def sample(loops: int) -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            for item in inputs:
+                fn(item)
+        return time.perf_counter() - start
+
+    loops = 1
+    while True:
+        elapsed = sample(loops)
+        if elapsed >= min_time or loops >= 1 << 16:
+            break
+        loops *= 2 if elapsed * 4 >= min_time else 10
+    per_op = sorted(sample(loops) / (loops * len(inputs)) * 1e6 for _ in range(repeat))
+    return {
+        "min_us": round(per_op[0], 2),
+        "median_us": round(statistics.median(per_op), 2),
+        "max_us": round(per_op[-1], 2),
+        "loops": loops,
+    }
+
+
+def build_cases(per_size: int) -> List[Tuple[str, Callable, Sequence]]:
+    corpus = build_corpus(per_size)
+    texts = {size: [extract_text(data, filename) for data, filename in corpus[(size, "txt")]] for size in SIZES}
+    resumes = {size: [build_resume(text) for text in texts[size]] for size in SIZES}
+
+    cases = []
+    for size in SIZES:
+        for fmt in FORMATS:
+            cases.append((f"parse_resume[{size}-{fmt}]", lambda doc: parse_resume(*doc), corpus[(size, fmt)]))
+    for size in SIZES:
+        cases.append((f"extract_skills[{size}]", extract_skills, texts[size]))
+        cases.append((f"analyze_resume[{size}]", analyze_resume, resumes[size]))
+        cases.append((f"match_career_paths[{size}]", match_career_paths, resumes[size]))
+        cases.append((f"generate_learning_roadmap[{size}]", generate_learning_roadmap, resumes[size]))
+
+    # No response cache: every call routes the intent and renders the templates
+    mentor = AIMentor()
+    for intent, message in MENTOR_MESSAGES.items():
+        cases.append((f"generate_response[{intent}]",
+                      lambda resume, message=message: mentor.generate_response(message, resume),
+                      resumes["medium"]))
+    return cases
+
+
+def run(name_filter: str, per_size: int, repeat: int, min_time: float) -> Results:
+    results: Results = {}
+    print(f"{'case':44} {'min us':>12} {'median us':>12} {'max us':>12} {'loops':>7}")
+    for name, fn, inputs in build_cases(per_size):
+        if name_filter and name_filter not in name:
+            continue
+        fn(inputs[0])  # warm caches and lazy imports outside the timing
+        row = time_case(fn, inputs, repeat, min_time)
+        results[name] = row
+        print(f"{name:44} {row['min_us']:12.1f} {row['median_us']:12.1f} {row['max_us']:12.1f} {row['loops']:7d}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only cases whose name contains this text")
+    parser.add_argument("--per-size", type=int, default=3, help="resumes per size in the corpus")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timing sample")
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter samples")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = 50%%")
+    args = parser.parse_args()
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.01
+
+    results = run(args.filter, args.per_size, args.repeat, args.min_time)
+    if args.save_baseline:
+        settings = {"per_size": args.per_size, "repeat": args.repeat, "min_time": args.min_time}
+        print(f"\nBaseline saved to {save_baseline(BASELINE, results, settings)}")
+    elif not check_against_baseline(BASELINE, results, METRICS, args.tolerance) and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Parse Cases - Resume layouts that once parsed wrongly, and what they must parse to
+Each case runs through build_resume and checks the extracted roles, degrees and
+section names; the run fails if any case regresses.
+
+    python -m benchmarks.parse_cases
+"""
+import sys
+from typing import Dict, List
+
+from resume_parser import build_resume
+
+CASES: List[Dict] = [
+    {
+        # "Technologies:"/"Tools:" lines inside a role used to end the experience section
+        "label": "entry_labels_inside_roles",
+        "text": (
+            "Jane Doe\njane@example.com\n\n"
+            "Experience\n"
+            "Senior Software Engineer | Acme Corp\n2020 - Present\nBuilt APIs.\nTechnologies: Python, Docker\n\n"
+            "Software Engineer | Beta Inc\n2017 - 2020\nTools: Java\n\n"
+            "Junior Developer | Gamma LLC\n2015 - 2017\nTechnologies: Go, Kubernetes\n\n"
+            "Skills: Python, Java, Docker\n"
+        ),
+        "companies": ["Acme Corp", "Beta Inc", "Gamma LLC"],
+        "sections": ["experience", "skills"],
+    },
+    {
+        # A second experience-type heading adds to the first instead of being ignored
+        "label": "repeated_experience_sections",
+        "text": (
+            "John Smith\n\n"
+            "Work Experience\nData Analyst | Northwind\n2019 - 2023\n\n"
+            "Education\nBachelor of Science in Statistics\n\n"
+            "Internships\nData Science Intern | Contoso\n2018\n"
+        ),
+        "companies": ["Northwind", "Contoso"],
+        "degrees": 1,
+        "sections": ["experience", "education"],
+    },
+]
+
+
+def check(case: Dict) -> List[str]:
+    resume = build_resume(case["text"])
+    problems = []
+    companies = [e.company for e in resume.experience]
+    if "companies" in case and companies != case["companies"]:
+        problems.append(f"companies {companies} != {case['companies']}")
+    if "degrees" in case and len(resume.education) != case["degrees"]:
+        problems.append(f"{len(resume.education)} degrees != {case['degrees']}")
+    if "sections" in case and resume.sections != case["sections"]:
+        problems.append(f"sections {resume.sections} != {case['sections']}")
+    return problems
+
+
+def main():
+    failed = 0
+    for case in CASES:
+        problems = check(case)
+        failed += bool(problems)
+        print(f"{'ok  ' if not problems else 'FAIL'} {case['label']}" + "".join(f"\n     {p}" for p in problems))
+    print(f"\n{len(CASES) - failed}/{len(CASES)} cases passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
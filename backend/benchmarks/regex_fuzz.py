@@ -0,0 +1,82 @@
+"""
+Regex Fuzz - Adversarial inputs against the resume field extractors
+Feeds ~1 MB inputs shaped to trigger backtracking in email, phone, role,
+degree and section patterns (plus random noise) through each extractor and
+build_resume, and fails if any of them exceeds the time bound.
+
+    python -m benchmarks.regex_fuzz [--size BYTES] [--max-seconds S] [--seed N]
+"""
+import argparse
+import random
+import string
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from resume_parser import (
+    build_resume, extract_education, extract_email, extract_experience, extract_name, extract_phone
+)
+
+
+def adversarial_inputs(size: int, seed: int = 0) -> Dict[str, str]:
+    """Named inputs of roughly ``size`` characters"""
+    rng = random.Random(seed)
+    half = size // 2
+
+    def repeat(unit: str) -> str:
+        return unit * max(size // len(unit), 1)
+
+    return {
+        "email_local_run": "a" * half + "@" + "a" * half,
+        "email_dotted_domain": "a" * half + "@" + "a." * (half // 2),
+        "email_at_chain": repeat("a@"),
+        "phone_digit_spaces": repeat("1 "),
+        "phone_parens": repeat("(1)"),
+        "role_capitalised_line": "Experience\n" + repeat("Aaaa "),
+        "role_suffix_spam": "Experience\n" + repeat("Senior Engineer Lead "),
+        "role_short_lines": "Experience\n" + repeat("Senior Software Engineer at Acme\n"),
+        "degree_spam": "Education\n" + repeat("Bachelor Master MS BS "),
+        "heading_spam": repeat("Experience\nEducation\nSkills: a\n"),
+        "unterminated_section": "experience " + "x" * size,
+        "random_printable": "".join(rng.choice(string.printable) for _ in range(size)),
+    }
+
+
+EXTRACTORS: List[Tuple[str, Callable[[str], object]]] = [
+    ("email", extract_email),
+    ("phone", extract_phone),
+    ("name", extract_name),
+    ("experience", extract_experience),
+    ("education", extract_education),
+    ("build_resume", build_resume),
+]
+
+
+def run(size: int, max_seconds: float, seed: int) -> bool:
+    ok = True
+    print(f"{'input':24} " + " ".join(f"{name:>12}" for name, _ in EXTRACTORS))
+    for label, text in adversarial_inputs(size, seed).items():
+        cells = []
+        for name, extractor in EXTRACTORS:
+            start = time.perf_counter()
+            extractor(text)
+            elapsed = time.perf_counter() - start
+            if elapsed > max_seconds:
+                ok = False
+            cells.append(f"{elapsed * 1000:10.1f}{'!!' if elapsed > max_seconds else 'ms'}")
+        print(f"{label:24} " + " ".join(cells))
+    print(f"\n{'PASS' if ok else 'FAIL'}: every extractor {'stayed' if ok else 'did not stay'} under {max_seconds:g}s")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1024 * 1024)
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.exit(0 if run(args.size, args.max_seconds, args.seed) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Serialization - Share of dashboard latency spent encoding the response
+For one resume per size, with analysis results already cached, times the
+non-serialization work (store read + cache lookups), the previous encoding
+(.dict() -> jsonable_encoder -> json.dumps), pydantic-core encoding without
+and with the cached JSON fragments, and GET /api/dashboard end to end for the
+current route and for a legacy-encoding copy of it mounted for the run.
+The share columns come from the same requests: the "serialize" span over the
+app time, both read from each response's Server-Timing header.
+
+    python -m benchmarks.serialization [--requests N] [--save-baseline] [--check]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from benchmarks.baseline import Results, check_against_baseline, save_baseline
+from benchmarks.corpus import SIZES, resume_text
+from json_response import json_bytes, json_object
+import metrics
+
+BASELINE = "serialization"
+METRICS = {"dashboard_p50_us": False, "encode_cached_us": False}
+
+
+def per_call_us(fn: Callable, loops: int = 200) -> float:
+    fn()
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops * 1e6)
+    return statistics.median(samples)
+
+
+def server_timing_ms(header: str) -> Dict[str, float]:
+    durations = {}
+    for part in header.split(","):
+        name, _, duration = part.strip().partition(";dur=")
+        durations[name] = float(duration)
+    return durations
+
+
+async def endpoint_p50_us(client: httpx.AsyncClient, url: str, requests: int) -> Tuple[float, float]:
+    """Median latency, and median share of the app time spent in the "serialize" span"""
+    await client.get(url)
+    latencies = []
+    shares = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(url)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        timing = server_timing_ms(response.headers["server-timing"])
+        shares.append(timing["serialize"] / timing["app"])
+    return statistics.median(latencies) * 1e6, statistics.median(shares)
+
+
+async def run(requests: int) -> Results:
+    import main
+    cache = main.analysis_cache
+
+    def legacy_payload(resume) -> Dict:
+        return {
+            "resume": resume.model_dump(),
+            "analysis": cache.analysis(resume).model_dump(),
+            "skill_gaps": [g.model_dump() for g in cache.skill_gaps(resume)],
+            "career_paths": [p.model_dump() for p in cache.career_paths(resume)],
+            "learning_roadmap": cache.roadmap(resume).model_dump()
+        }
+
+    async def legacy_dashboard(resume_id: str):
+        # What the route did before: plain dicts, encoded the way FastAPI encodes a returned dict
+        resume = main.get_resume_or_404(resume_id)
+        with metrics.span("serialize"):
+            return JSONResponse(jsonable_encoder(legacy_payload(resume)))
+
+    main.app.add_api_route("/benchmark/legacy-dashboard/{resume_id}", legacy_dashboard, methods=["GET"])
+
+    if not (metrics.ENABLED and main.config.SERVER_TIMING_HEADER):
+        raise SystemExit("The serialization benchmark reads Server-Timing: unset METRICS_ENABLED/SERVER_TIMING_HEADER")
+    results: Results = {}
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            print(f"{'size':7} {'bytes':>7} {'lookup':>8} {'legacy':>8} {'encode':>8} {'cached':>8} "
+                  f"{'e2e old':>9} {'share':>6} {'e2e new':>9} {'share':>6}   (us)")
+            for size in SIZES:
+                response = await client.post("/api/upload-resume", files={
+                    "file": (f"{size}.txt", resume_text(size, seed=7).encode(), "text/plain")
+                })
+                resume_id = response.json()["resume_id"]
+                resume = main.get_resume_or_404(resume_id)
+                body = main.dashboard_json(resume)
+
+                def lookup():
+                    r = main.get_resume_or_404(resume_id)
+                    cache.analysis(r), cache.skill_gaps(r), cache.career_paths(r), cache.roadmap(r)
+
+                def encode_uncached():
+                    json_object(
+                        resume=resume.model_dump_json().encode(),
+                        analysis=cache.analysis(resume).model_dump_json().encode(),
+                        skill_gaps=json_bytes(cache.skill_gaps(resume)),
+                        career_paths=json_bytes(cache.career_paths(resume)),
+                        learning_roadmap=cache.roadmap(resume).model_dump_json().encode()
+                    )
+
+                legacy_p50, legacy_share = await endpoint_p50_us(
+                    client, f"/benchmark/legacy-dashboard/{resume_id}", requests)
+                dashboard_p50, share = await endpoint_p50_us(client, f"/api/dashboard/{resume_id}", requests)
+                row = {
+                    "bytes": len(body),
+                    "lookup_us": per_call_us(lookup),
+                    "encode_legacy_us": per_call_us(lambda: JSONResponse(jsonable_encoder(legacy_payload(resume)))),
+                    "encode_uncached_us": per_call_us(encode_uncached),
+                    "encode_cached_us": per_call_us(lambda: main.dashboard_json(resume)),
+                    "legacy_p50_us": legacy_p50,
+                    "legacy_serialize_pct": legacy_share * 100,
+                    "dashboard_p50_us": dashboard_p50,
+                    "dashboard_serialize_pct": share * 100,
+                }
+                results[f"dashboard[{size}]"] = {k: round(v, 1) for k, v in row.items()}
+                print(f"{size:7} {row['bytes']:7d} {row['lookup_us']:8.1f} {row['encode_legacy_us']:8.1f} "
+                      f"{row['encode_uncached_us']:8.1f} {row['encode_cached_us']:8.1f} "
+                      f"{legacy_p50:9.1f} {legacy_share:6.0%} {dashboard_p50:9.1f} {share:6.0%}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="sequential requests per endpoint")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = 50%%")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests))
+    if args.save_baseline:
+        print(f"\nBaseline saved to {save_baseline(BASELINE, results, {'requests': args.requests})}")
+    elif not check_against_baseline(BASELINE, results, METRICS, args.tolerance) and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Bulk Scoring - Vectorized career path scoring for many resumes at once
+Encodes resumes and career paths as skill/keyword count matrices and computes the
+full resumes x paths score matrix with NumPy, using the same 70% skill / 30%
+keyword formula as match_career_paths. Intended for batch jobs such as a nightly
+recompute after a CAREER_PATHS_DB update.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models import ResumeData, CareerPath
+from career_analyzer import CAREER_PATHS_DB, career_db_version, get_career_index
+
+
+class PathMatrices:
+    """Column-per-path encodings of the career catalogue"""
+
+    def __init__(self):
+        index = get_career_index()
+        self.version = career_db_version()
+        self.names = index.names
+        self.skill_vocab = {skill: i for i, skill in enumerate(index.skill_paths)}
+        self.keyword_vocab = {keyword: i for i, keyword in enumerate(index.keyword_paths)}
+
+        # Counts (not booleans) so a skill listed twice weighs twice, as in the scalar code
+        self.required = np.zeros((len(self.skill_vocab), len(self.names)), dtype=np.float64)
+        self.keywords = np.zeros((len(self.keyword_vocab), len(self.names)), dtype=np.float64)
+        for skill, names in index.skill_paths.items():
+            for name in names:
+                self.required[self.skill_vocab[skill], index.order[name]] += 1
+        for keyword, names in index.keyword_paths.items():
+            for name in names:
+                self.keywords[self.keyword_vocab[keyword], index.order[name]] += 1
+
+        self.required_totals = np.array(
+            [max(len(CAREER_PATHS_DB[name]["required_skills"]), 1) for name in self.names],
+            dtype=np.float64
+        )
+
+
+_path_matrices: Optional[PathMatrices] = None
+
+
+def get_path_matrices() -> PathMatrices:
+    """Path encodings for the current catalogue, rebuilt after an update"""
+    global _path_matrices
+    if _path_matrices is None or _path_matrices.version != career_db_version():
+        _path_matrices = PathMatrices()
+    return _path_matrices
+
+
+def encode_resumes(resumes: List[ResumeData], matrices: PathMatrices) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (skill presence, keyword presence) matrices, one row per resume"""
+    skill_rows = np.zeros((len(resumes), len(matrices.skill_vocab)), dtype=np.float64)
+    keyword_rows = np.zeros((len(resumes), len(matrices.keyword_vocab)), dtype=np.float64)
+    scanner = get_career_index().keyword_scanner
+
+    for row, resume in enumerate(resumes):
+        for skill in {s.name.lower() for s in resume.skills}:
+            col = matrices.skill_vocab.get(skill)
+            if col is not None:
+                skill_rows[row, col] = 1
+        for keyword in scanner.find(resume.raw_text.lower()):
+            keyword_rows[row, matrices.keyword_vocab[keyword]] = 1
+
+    return skill_rows, keyword_rows
+
+
+def score_matrix(resumes: List[ResumeData]) -> Tuple[np.ndarray, List[str]]:
+    """Compute the resumes x paths match-score matrix and the path names per column"""
+    matrices = get_path_matrices()
+    skill_rows, keyword_rows = encode_resumes(resumes, matrices)
+
+    skill_score = (skill_rows @ matrices.required) / matrices.required_totals * 70
+    keyword_score = np.minimum((keyword_rows @ matrices.keywords) * 5, 30)
+    scores = np.round(np.minimum(skill_score + keyword_score, 98), 1)
+    return scores, matrices.names
+
+
+def top_k_career_paths(resumes: List[ResumeData], k: int = 6, threshold: float = 15) -> Dict[str, List[Tuple[str, float]]]:
+    """Best k (path, score) pairs above the threshold for each resume, keyed by resume id"""
+    scores, names = score_matrix(resumes)
+    # Stable sort keeps catalogue order among equal scores, like list.sort in the scalar path
+    ranking = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+    results = {}
+    for row, resume in enumerate(resumes):
+        results[resume.id] = [(names[col], float(scores[row, col]))
+                              for col in ranking[row] if scores[row, col] > threshold]
+    return results
+
+
+def bulk_match_career_paths(resumes: List[ResumeData], k: int = 6) -> Dict[str, List[CareerPath]]:
+    """Batch equivalent of match_career_paths for every resume, keyed by resume id"""
+    top = top_k_career_paths(resumes, k=k)
+    results = {}
+    for resume in resumes:
+        current_skills = {s.name.lower() for s in resume.skills}
+        paths = []
+        for name, score in top[resume.id]:
+            path_data = CAREER_PATHS_DB[name]
+            paths.append(CareerPath(
+                title=name,
+                match_score=score,
+                description=path_data["description"],
+                salary_range=path_data["salary_range"],
+                growth_outlook=path_data["growth_outlook"],
+                required_skills=[s.title() for s in path_data["required_skills"]],
+                current_match_skills=[s.title() for s in path_data["required_skills"] if s in current_skills],
+                gap_skills=[s.title() for s in path_data["required_skills"] if s not in current_skills][:5]
+            ))
+        results[resume.id] = paths
+    return results
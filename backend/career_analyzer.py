@@ -2,12 +2,18 @@
 Career Analyzer - AI-powered career analytics engine
 Provides resume analysis, skill gap detection, career matching, and learning roadmaps
 """
+import json
+import os
 import random
-from typing import List, Dict, Optional
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 from models import (
     ResumeData, ResumeAnalysis, SkillGap, CareerPath,
     LearningRoadmap, LearningResource, Skill, SkillLevel
 )
+from skill_matcher import TermScanner
+from resume_sections import segment_sections
+from metrics import timed
 
 
 # Career paths database
@@ -85,64 +91,149 @@ CAREER_PATHS_DB = {
 }
 
 
-LEARNING_RESOURCES_DB = {
-    "python": [
-        LearningResource(title="Python for Everybody Specialization", provider="Coursera", url="https://coursera.org/python", duration="8 months", skill_target="Python", priority="high", resource_type="course"),
-        LearningResource(title="Automate the Boring Stuff with Python", provider="Udemy", url="https://udemy.com/automate-python", duration="10 hours", skill_target="Python", priority="medium", resource_type="course"),
-    ],
-    "javascript": [
-        LearningResource(title="The Complete JavaScript Course", provider="Udemy", url="https://udemy.com/javascript", duration="69 hours", skill_target="JavaScript", priority="high", resource_type="course"),
-        LearningResource(title="JavaScript.info", provider="Free", url="https://javascript.info", duration="Self-paced", skill_target="JavaScript", priority="medium", resource_type="tutorial"),
-    ],
-    "react": [
-        LearningResource(title="React - The Complete Guide", provider="Udemy", url="https://udemy.com/react-complete", duration="48 hours", skill_target="React", priority="high", resource_type="course"),
-        LearningResource(title="Official React Documentation", provider="Meta", url="https://react.dev", duration="Self-paced", skill_target="React", priority="high", resource_type="documentation"),
-    ],
-    "machine learning": [
-        LearningResource(title="Machine Learning Specialization", provider="Coursera (Stanford)", url="https://coursera.org/ml", duration="3 months", skill_target="Machine Learning", priority="high", resource_type="course"),
-        LearningResource(title="Hands-On ML with Scikit-Learn", provider="O'Reilly", url="https://oreilly.com/ml-book", duration="Self-paced", skill_target="Machine Learning", priority="medium", resource_type="book"),
-    ],
-    "docker": [
-        LearningResource(title="Docker Mastery", provider="Udemy", url="https://udemy.com/docker-mastery", duration="20 hours", skill_target="Docker", priority="high", resource_type="course"),
-    ],
-    "aws": [
-        LearningResource(title="AWS Certified Solutions Architect", provider="A Cloud Guru", url="https://acloudguru.com/aws", duration="40 hours", skill_target="AWS", priority="high", resource_type="certification"),
-    ],
-    "sql": [
-        LearningResource(title="The Complete SQL Bootcamp", provider="Udemy", url="https://udemy.com/sql-bootcamp", duration="9 hours", skill_target="SQL", priority="high", resource_type="course"),
-    ],
-    "tensorflow": [
-        LearningResource(title="TensorFlow Developer Certificate", provider="Coursera", url="https://coursera.org/tensorflow", duration="4 months", skill_target="TensorFlow", priority="high", resource_type="certification"),
-    ],
-    "kubernetes": [
-        LearningResource(title="Kubernetes for Developers", provider="Linux Foundation", url="https://linuxfoundation.org/k8s", duration="30 hours", skill_target="Kubernetes", priority="high", resource_type="certification"),
-    ],
-    "typescript": [
-        LearningResource(title="Understanding TypeScript", provider="Udemy", url="https://udemy.com/typescript", duration="15 hours", skill_target="TypeScript", priority="medium", resource_type="course"),
-    ],
-    "deep learning": [
-        LearningResource(title="Deep Learning Specialization", provider="Coursera (DeepLearning.AI)", url="https://coursera.org/deep-learning", duration="5 months", skill_target="Deep Learning", priority="high", resource_type="course"),
-    ],
-}
+# Bumped whenever CAREER_PATHS_DB changes so memoized results can be discarded
+_career_db_version = 1
+
+
+def career_db_version() -> int:
+    """Current revision of CAREER_PATHS_DB"""
+    return _career_db_version
+
+
+def update_career_paths(paths: Dict[str, Dict]):
+    """Add or replace career paths and invalidate anything derived from the old catalogue"""
+    global _career_db_version, _career_index
+    CAREER_PATHS_DB.update(paths)
+    _career_db_version += 1
+    _career_index = CareerIndex(CAREER_PATHS_DB)
+
+
+class CareerIndex:
+    """Inverted index over the career catalogue: skill -> paths and keyword -> paths
+
+    Matching costs are proportional to the resume's skills and the keyword hits in
+    its text rather than to the number of paths in the catalogue.
+    """
+
+    def __init__(self, paths_db: Dict[str, Dict]):
+        self.names = list(paths_db)
+        self.order = {name: i for i, name in enumerate(self.names)}
+        # Lists keep duplicates so a repeated skill/keyword counts the same as before
+        self.skill_paths: Dict[str, List[str]] = {}
+        self.keyword_paths: Dict[str, List[str]] = {}
+        for name, data in paths_db.items():
+            for skill in data["required_skills"]:
+                self.skill_paths.setdefault(skill, []).append(name)
+            for keyword in data["keywords"]:
+                self.keyword_paths.setdefault(keyword, []).append(name)
+        # Keywords are matched as substrings of the resume text, as before
+        self.keyword_scanner = TermScanner(self.keyword_paths, word_boundary=False)
+
+    def skill_counts(self, current_skills) -> Counter:
+        """Number of each path's required skills present in current_skills"""
+        counts = Counter()
+        for skill in current_skills:
+            counts.update(self.skill_paths.get(skill, ()))
+        return counts
+
+    def keyword_counts(self, text_lower: str) -> Counter:
+        """Number of each path's keywords found anywhere in text_lower"""
+        counts = Counter()
+        for keyword in self.keyword_scanner.find(text_lower):
+            counts.update(self.keyword_paths[keyword])
+        return counts
+
+    def path_for_role(self, role_lower: str) -> Optional[str]:
+        """First path (catalogue order) whose name contains the role or whose keyword the role contains"""
+        candidates = [self.order[name]
+                      for keyword in self.keyword_scanner.find(role_lower)
+                      for name in self.keyword_paths[keyword]]
+        limit = min(candidates, default=len(self.names))
+        # Name containment is a short-string check, only needed before the first keyword hit
+        for i in range(limit):
+            if role_lower in self.names[i].lower():
+                return self.names[i]
+        return self.names[limit] if candidates else None
+
+
+_career_index = CareerIndex(CAREER_PATHS_DB)
+
 
+def get_career_index() -> CareerIndex:
+    """Index matching the current CAREER_PATHS_DB revision"""
+    return _career_index
 
+
+# Below this many paths a direct pass over the catalogue is faster than the index:
+# a few dozen C-level substring checks cost less than one regex scan of the resume
+CAREER_INDEX_MIN_PATHS = 30
+
+
+def _direct_counts(current_skills, text_lower: str) -> Tuple[Counter, Counter]:
+    """skill_counts/keyword_counts of CareerIndex, computed path by path"""
+    skill_counts = Counter()
+    keyword_counts = Counter()
+    for name, data in CAREER_PATHS_DB.items():
+        skill_counts[name] = sum(1 for s in data["required_skills"] if s in current_skills)
+        keyword_counts[name] = sum(1 for kw in data["keywords"] if kw in text_lower)
+    return skill_counts, keyword_counts
+
+
+# Curated resources per skill, stored as compact rows in data/learning_resources.json.
+# Rows stay plain tuples until a roadmap needs them; models are built once per skill.
+LEARNING_RESOURCES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "learning_resources.json")
+
+
+def _load_learning_resources(path: str) -> Tuple[Tuple[str, ...], Dict[str, List[Tuple[str, ...]]]]:
+    """(field names, rows per skill); the file's "fields" list names the row columns"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    fields = tuple(data["fields"])
+    unknown = set(fields) - set(LearningResource.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown learning resource fields in {path}: {', '.join(sorted(unknown))}")
+    return fields, {skill: [tuple(row) for row in rows] for skill, rows in data["resources"].items()}
+
+
+LEARNING_RESOURCES_FIELDS, LEARNING_RESOURCES_DB = _load_learning_resources(LEARNING_RESOURCES_FILE)
+_learning_resources: Dict[str, List[LearningResource]] = {}
+
+
+def learning_resources_for(skill_key: str) -> Optional[List[LearningResource]]:
+    """Curated resources for a lowercase skill name, or None if there are none"""
+    resources = _learning_resources.get(skill_key)
+    if resources is None:
+        rows = LEARNING_RESOURCES_DB.get(skill_key)
+        if rows is None:
+            return None
+        # Trusted static data: skip validation
+        resources = [LearningResource.model_construct(**dict(zip(LEARNING_RESOURCES_FIELDS, row))) for row in rows]
+        _learning_resources[skill_key] = resources
+    return resources
+
+
+EXPECTED_SECTIONS = ["experience", "education", "skills", "summary", "projects", "certifications"]
+
+
+@timed("analysis")
 def analyze_resume(resume: ResumeData) -> ResumeAnalysis:
     """Analyze resume quality and structure"""
     text = resume.raw_text.lower()
+    # Sections found by the parser; resumes stored before that was recorded are segmented here
+    sections = set(resume.sections or segment_sections(resume.raw_text).names())
     skills = resume.skills
     experience = resume.experience
     education = resume.education
 
-    # Structure score
+    # Structure score: which expected section headings are present
     has_sections = 0
-    sections = ["experience", "education", "skills", "summary", "projects", "certifications"]
     missing = []
-    for section in sections:
-        if section in text:
+    for section in EXPECTED_SECTIONS:
+        if section in sections:
             has_sections += 1
         else:
             missing.append(section.title())
-    structure_score = min(round((has_sections / len(sections)) * 100, 1), 100)
+    structure_score = min(round((has_sections / len(EXPECTED_SECTIONS)) * 100, 1), 100)
 
     # Content score
     content_factors = []
@@ -205,9 +296,9 @@ def analyze_resume(resume: ResumeData) -> ResumeAnalysis:
         improvements.append("Add more technical skills with proficiency levels")
     if verb_count < 4:
         improvements.append("Use more action verbs (developed, implemented, optimized) to describe achievements")
-    if "projects" not in text:
+    if "projects" not in sections:
         improvements.append("Add a Projects section to showcase hands-on work")
-    if "certification" not in text:
+    if "certifications" not in sections:
         improvements.append("Consider adding relevant certifications")
     if len(text) < 500:
         improvements.append("Expand resume content with more details about responsibilities and achievements")
@@ -225,29 +316,26 @@ def analyze_resume(resume: ResumeData) -> ResumeAnalysis:
     )
 
 
+@timed("gaps")
 def detect_skill_gaps(resume: ResumeData, target_role: str = "") -> List[SkillGap]:
     """Detect skill gaps based on resume and target role"""
     current_skills = {s.name.lower(): s for s in resume.skills}
     gaps = []
 
     # Find best matching career path
+    index = get_career_index()
     target_path = None
     if target_role:
-        for path_name, path_data in CAREER_PATHS_DB.items():
-            if target_role.lower() in path_name.lower() or any(kw in target_role.lower() for kw in path_data["keywords"]):
-                target_path = (path_name, path_data)
-                break
+        path_name = index.path_for_role(target_role.lower())
+        if path_name:
+            target_path = (path_name, CAREER_PATHS_DB[path_name])
 
     if not target_path:
-        # Auto-detect best matching path
-        best_score = 0
-        for path_name, path_data in CAREER_PATHS_DB.items():
-            score = sum(1 for skill in path_data["required_skills"] if skill in current_skills)
-            keyword_score = sum(1 for kw in path_data["keywords"] if kw in resume.raw_text.lower())
-            total = score + keyword_score
-            if total > best_score:
-                best_score = total
-                target_path = (path_name, path_data)
+        # Auto-detect best matching path; ties go to the earlier catalogue entry
+        totals = index.skill_counts(current_skills) + index.keyword_counts(resume.raw_text.lower())
+        if totals:
+            path_name = min(totals, key=lambda name: (-totals[name], index.order[name]))
+            target_path = (path_name, CAREER_PATHS_DB[path_name])
 
     if not target_path:
         target_path = ("Full Stack Developer", CAREER_PATHS_DB["Full Stack Developer"])
@@ -276,23 +364,31 @@ def detect_skill_gaps(resume: ResumeData, target_role: str = "") -> List[SkillGa
     return gaps
 
 
+@timed("career_matching")
 def match_career_paths(resume: ResumeData) -> List[CareerPath]:
     """Match user with suitable career paths"""
     current_skills = {s.name.lower() for s in resume.skills}
     text_lower = resume.raw_text.lower()
     matches = []
 
-    for path_name, path_data in CAREER_PATHS_DB.items():
-        # Skills match
-        matching_skills = [s for s in path_data["required_skills"] if s in current_skills]
-        # Keyword match
-        keyword_matches = sum(1 for kw in path_data["keywords"] if kw in text_lower)
-
-        skill_score = (len(matching_skills) / max(len(path_data["required_skills"]), 1)) * 70
-        keyword_score = min(keyword_matches * 5, 30)
+    index = get_career_index()
+    if len(index.names) < CAREER_INDEX_MIN_PATHS:
+        skill_counts, keyword_counts = _direct_counts(current_skills, text_lower)
+        candidates = index.names
+    else:
+        # Only paths sharing a skill or keyword with the resume can clear the threshold
+        skill_counts = index.skill_counts(current_skills)
+        keyword_counts = index.keyword_counts(text_lower)
+        candidates = sorted(set(skill_counts) | set(keyword_counts), key=index.order.get)
+
+    for path_name in candidates:
+        path_data = CAREER_PATHS_DB[path_name]
+        skill_score = (skill_counts[path_name] / max(len(path_data["required_skills"]), 1)) * 70
+        keyword_score = min(keyword_counts[path_name] * 5, 30)
         total_score = round(min(skill_score + keyword_score, 98), 1)
 
         if total_score > 15:
+            matching_skills = [s for s in path_data["required_skills"] if s in current_skills]
             gap_skills = [s.title() for s in path_data["required_skills"] if s not in current_skills]
             matches.append(CareerPath(
                 title=path_name,
@@ -309,14 +405,23 @@ def match_career_paths(resume: ResumeData) -> List[CareerPath]:
     return matches[:6]
 
 
-def generate_learning_roadmap(resume: ResumeData, target_career: str = "") -> LearningRoadmap:
-    """Generate personalized learning roadmap"""
-    gaps = detect_skill_gaps(resume, target_career)
+@timed("roadmap")
+def generate_learning_roadmap(resume: ResumeData, target_career: str = "",
+                              gaps: Optional[List[SkillGap]] = None,
+                              paths: Optional[List[CareerPath]] = None) -> LearningRoadmap:
+    """Generate personalized learning roadmap
+
+    Callers that already computed ``detect_skill_gaps(resume, target_career)`` or
+    ``match_career_paths(resume)`` can pass them in to avoid recomputing.
+    """
+    if gaps is None:
+        gaps = detect_skill_gaps(resume, target_career)
     current_skills = {s.name.lower() for s in resume.skills}
 
     # Determine target
     if not target_career:
-        paths = match_career_paths(resume)
+        if paths is None:
+            paths = match_career_paths(resume)
         target_career = paths[0].title if paths else "Full Stack Developer"
 
     # Build phases
@@ -374,8 +479,9 @@ def generate_learning_roadmap(resume: ResumeData, target_career: str = "") -> Le
     # Gather learning resources
     for gap in gaps:
         skill_key = gap.skill.lower()
-        if skill_key in LEARNING_RESOURCES_DB:
-            resources.extend(LEARNING_RESOURCES_DB[skill_key])
+        curated = learning_resources_for(skill_key)
+        if curated is not None:
+            resources.extend(curated)
         else:
             resources.append(LearningResource(
                 title=f"Learn {gap.skill} - Comprehensive Guide",
@@ -0,0 +1,130 @@
+"""
+Compact Resume - Memory-lean resident form of a parsed resume
+Stored resumes keep skills as interned ids into SKILL_DATABASE (the id fixes
+name and category) with levels as small ints in arrays, experience/education
+as plain tuples, the raw text zlib-compressed and the summary as a prefix
+length of that text instead of a second copy. ResumeData (Pydantic) is only
+materialised when a request reads the resume.
+"""
+import zlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from models import Education, Experience, ResumeData, Skill, SkillLevel
+from resume_parser import SKILL_DATABASE, skill_relevance
+
+# Interned skill table: id -> (display name, category), in taxonomy order
+SKILL_TABLE: Tuple[Tuple[str, str], ...] = tuple(
+    (term.title(), category) for category, terms in SKILL_DATABASE.items() for term in terms
+)
+SKILL_IDS = {entry: skill_id for skill_id, entry in enumerate(SKILL_TABLE)}
+LEVELS: Tuple[SkillLevel, ...] = tuple(SkillLevel)
+LEVEL_IDS = {level: i for i, level in enumerate(LEVELS)}
+
+# Skill id for entries kept verbatim in CompactResume.other_skills
+OTHER_SKILL = 0xFFFF
+
+# (skill id, level id) -> shared Skill; nothing mutates skills after parsing, and
+# stored resumes already shared Skill objects between reads before this
+_skill_models: Dict[Tuple[int, int], Skill] = {}
+
+# Largest UTF-8 encoding of one character, to bound partial decompression of the summary
+_MAX_CHAR_BYTES = 4
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode('utf-8')) if text else b""
+
+
+def decompress_text(blob: bytes, max_chars: int = -1) -> str:
+    """The stored text, or only its first max_chars characters"""
+    if not blob:
+        return ""
+    if max_chars < 0:
+        return zlib.decompress(blob).decode('utf-8')
+    head = zlib.decompressobj().decompress(blob, max_chars * _MAX_CHAR_BYTES)
+    # A character cut off at the byte limit lies past max_chars; drop it
+    return head.decode('utf-8', 'ignore')[:max_chars]
+
+
+class CompactResume:
+    """Slotted, array-backed copy of a ResumeData"""
+
+    __slots__ = ("id", "name", "email", "phone", "uploaded_at", "skill_ids", "skill_levels",
+                 "other_skills", "experience", "education", "sections", "raw_blob", "summary_chars",
+                 "summary")
+
+    def __init__(self, resume: ResumeData):
+        self.id = resume.id
+        self.name = resume.name
+        self.email = resume.email
+        self.phone = resume.phone
+        self.uploaded_at = resume.uploaded_at
+
+        self.skill_ids = array('H')
+        self.skill_levels = array('B')
+        # Skills outside the table (or with a custom score), in order of their OTHER_SKILL ids
+        self.other_skills: Optional[List[Tuple[str, str, str, float]]] = None
+        for skill in resume.skills:
+            skill_id = SKILL_IDS.get((skill.name, skill.category))
+            if skill_id is None or skill.relevance_score != skill_relevance(skill.level):
+                skill_id = OTHER_SKILL
+                if self.other_skills is None:
+                    self.other_skills = []
+                self.other_skills.append((skill.name, skill.category, skill.level.value, skill.relevance_score))
+            self.skill_ids.append(skill_id)
+            self.skill_levels.append(LEVEL_IDS[skill.level])
+
+        self.experience = tuple((e.title, e.company, e.duration, e.description) for e in resume.experience)
+        self.education = tuple((e.degree, e.institution, e.year, e.field) for e in resume.education)
+        self.sections = tuple(resume.sections)
+
+        self.raw_blob = compress_text(resume.raw_text)
+        # The parser's summary is a prefix of raw_text: keep its length, not a copy
+        if resume.summary and resume.raw_text.startswith(resume.summary):
+            self.summary_chars, self.summary = len(resume.summary), None
+        else:
+            self.summary_chars, self.summary = 0, resume.summary
+
+    def skills(self) -> List[Skill]:
+        skills = []
+        others = iter(self.other_skills or ())
+        for key in zip(self.skill_ids, self.skill_levels):
+            if key[0] == OTHER_SKILL:
+                name, category, level, relevance = next(others)
+                skills.append(Skill.model_construct(name=name, level=SkillLevel(level), category=category,
+                                                    relevance_score=relevance))
+                continue
+            skill = _skill_models.get(key)
+            if skill is None:
+                name, category = SKILL_TABLE[key[0]]
+                level = LEVELS[key[1]]
+                skill = _skill_models[key] = Skill.model_construct(
+                    name=name, level=level, category=category, relevance_score=skill_relevance(level)
+                )
+            skills.append(skill)
+        return skills
+
+    def to_resume(self, with_raw_text: bool = True) -> ResumeData:
+        """Materialise the API model; raw_text stays empty unless requested"""
+        raw_text = decompress_text(self.raw_blob) if with_raw_text else ""
+        if self.summary is not None:
+            summary = self.summary
+        elif with_raw_text:
+            summary = raw_text[:self.summary_chars]
+        else:
+            summary = decompress_text(self.raw_blob, self.summary_chars)
+        # Validating plain strings in pydantic-core is cheaper than model_construct's Python loop
+        return ResumeData(
+            id=self.id,
+            name=self.name,
+            email=self.email,
+            phone=self.phone,
+            summary=summary,
+            skills=self.skills(),
+            experience=[Experience(title=t, company=c, duration=d, description=s) for t, c, d, s in self.experience],
+            education=[Education(degree=d, institution=i, year=y, field=f) for d, i, y, f in self.education],
+            sections=list(self.sections),
+            raw_text=raw_text,
+            uploaded_at=self.uploaded_at
+        )
@@ -0,0 +1,128 @@
+"""
+Configuration - Runtime settings for the AI Career Mentor Platform
+Values are read from environment variables with sensible local defaults
+"""
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Text extraction worker pool (0 workers = run in a thread, useful for local dev)
+EXTRACTION_WORKERS = _env_int("EXTRACTION_WORKERS", os.cpu_count() or 1)
+EXTRACTION_QUEUE_SIZE = _env_int("EXTRACTION_QUEUE_SIZE", 32)
+EXTRACTION_TIMEOUT = _env_float("EXTRACTION_TIMEOUT", 30.0)
+
+# Import parsers and run one parse in the background once the app is up
+# (and in each extraction worker as it starts)
+WARMUP_ON_STARTUP = os.environ.get("WARMUP_ON_STARTUP", "1") != "0"
+
+# Request metrics: /metrics (Prometheus text), per-stage spans and a Server-Timing
+# header; "0" removes the middleware and the span timers entirely
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+SERVER_TIMING_HEADER = os.environ.get("SERVER_TIMING_HEADER", "1") != "0"
+
+# Slow-request profiler: requests over the threshold (seconds, 0 = off) keep a
+# stack-sampled profile, the last N of them listed under /api/admin/profiles
+SLOW_PROFILE_THRESHOLD = _env_float("SLOW_PROFILE_THRESHOLD", 0)
+SLOW_PROFILE_INTERVAL = _env_float("SLOW_PROFILE_INTERVAL", 0.01)
+SLOW_PROFILE_RETAINED = _env_int("SLOW_PROFILE_RETAINED", 20)
+# Required in the X-Admin-Token header of /api/admin/*; without it those endpoints answer 403
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+# Time budget per extracted field (email, phone, roles); a spent budget returns
+# what was found so far instead of scanning on
+PARSE_FIELD_BUDGET = _env_float("PARSE_FIELD_BUDGET", 0.5)
+
+# PDF extraction: longer documents are rejected (0 = no limit) and a page over
+# the timeout is left empty. Page workers run under the GIL, so more than one
+# only costs an extra parse of the document per worker
+PDF_MAX_PAGES = _env_int("PDF_MAX_PAGES", 50)
+PDF_PAGE_TIMEOUT = _env_float("PDF_PAGE_TIMEOUT", 5.0)
+PDF_PAGE_WORKERS = _env_int("PDF_PAGE_WORKERS", 1)
+
+# Upload ingestion
+MAX_UPLOAD_BYTES = _env_int("MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+UPLOAD_CHUNK_SIZE = _env_int("UPLOAD_CHUNK_SIZE", 64 * 1024)
+# Uploads larger than this spill from memory to a temporary file on disk
+UPLOAD_SPOOL_BYTES = _env_int("UPLOAD_SPOOL_BYTES", 1024 * 1024)
+
+# Content-hash dedup of repeat uploads
+PARSE_CACHE_ENTRIES = _env_int("PARSE_CACHE_ENTRIES", 10000)
+
+# Resume/profile storage: "memory" (per-process LRU) or "sqlite" (shared, durable)
+RESUME_STORE_BACKEND = os.environ.get("RESUME_STORE_BACKEND", "memory")
+RESUME_STORE_PATH = os.environ.get("RESUME_STORE_PATH", "resumes.db")
+# Both backends evict least recently used entries beyond this (sqlite: approximately, on write)
+RESUME_STORE_MAX_ENTRIES = _env_int("RESUME_STORE_MAX_ENTRIES", 10000)
+# Seconds since last access/write before an entry expires, in both backends (0 = never)
+RESUME_STORE_TTL = _env_float("RESUME_STORE_TTL", 0)
+
+# Memoized analyzer results (analysis, gaps, paths, roadmap per resume/target)
+ANALYSIS_CACHE_ENTRIES = _env_int("ANALYSIS_CACHE_ENTRIES", 20000)
+# Serialized response fragments of those results, bounded separately by total bytes
+ANALYSIS_JSON_CACHE_BYTES = _env_int("ANALYSIS_JSON_CACHE_BYTES", 64 * 1024 * 1024)
+
+# Batch uploads (/api/upload-resumes/batch)
+MAX_BATCH_UPLOAD_BYTES = _env_int("MAX_BATCH_UPLOAD_BYTES", 500 * 1024 * 1024)
+BATCH_MAX_FILES = _env_int("BATCH_MAX_FILES", 5000)
+BATCH_CONCURRENCY = _env_int("BATCH_CONCURRENCY", max(EXTRACTION_WORKERS, 1))
+BATCH_JOBS_RETAINED = _env_int("BATCH_JOBS_RETAINED", 100)
+
+# Background analysis jobs: "memory" broker, or "sqlite" as a local stand-in for a shared broker
+JOB_BROKER_BACKEND = os.environ.get("JOB_BROKER_BACKEND", "memory")
+JOB_BROKER_PATH = os.environ.get("JOB_BROKER_PATH", "jobs.db")
+JOB_CONCURRENCY = _env_int("JOB_CONCURRENCY", 2)
+JOB_MAX_RETRIES = _env_int("JOB_MAX_RETRIES", 2)
+JOB_RETAINED = _env_int("JOB_RETAINED", 10000)
+JOB_POLL_INTERVAL = _env_float("JOB_POLL_INTERVAL", 1.0)
+# sqlite broker: claimed jobs are requeued only after their owner stops renewing this lease
+JOB_LEASE_SECONDS = _env_float("JOB_LEASE_SECONDS", 30.0)
+# memory broker: total bytes of uploads waiting in queued jobs; beyond it submits get 429
+JOB_MAX_QUEUED_BYTES = _env_int("JOB_MAX_QUEUED_BYTES", 200 * 1024 * 1024)
+
+# Per-session chat memory for the AI mentor
+CHAT_SESSION_MAX_MESSAGES = _env_int("CHAT_SESSION_MAX_MESSAGES", 20)
+CHAT_SESSION_MAX_CHARS = _env_int("CHAT_SESSION_MAX_CHARS", 20000)
+CHAT_SESSION_IDLE_SECONDS = _env_float("CHAT_SESSION_IDLE_SECONDS", 1800)
+CHAT_MEMORY_MAX_CHARS = _env_int("CHAT_MEMORY_MAX_CHARS", 50_000_000)
+CHAT_MAX_SESSIONS = _env_int("CHAT_MAX_SESSIONS", 10000)
+
+# Optional JSON file with extra mentor intents ({"intents": [{"name", "keywords", "response"}]})
+MENTOR_INTENTS_FILE = os.environ.get("MENTOR_INTENTS_FILE", "")
+
+# Streaming chat (/api/chat/stream): pacing of the local fake token generator
+CHAT_STREAM_TOKEN_DELAY = _env_float("CHAT_STREAM_TOKEN_DELAY", 0.0)
+CHAT_STREAM_TOKENS_PER_CHUNK = _env_int("CHAT_STREAM_TOKENS_PER_CHUNK", 4)
+
+# Mentor text generation: "template" (built-in answers) or "http" (model server)
+LLM_BACKEND = os.environ.get("LLM_BACKEND", "template")
+LLM_BASE_URL = os.environ.get("LLM_BASE_URL", "http://127.0.0.1:8001")
+LLM_API_KEY = os.environ.get("LLM_API_KEY", "")
+LLM_TIMEOUT = _env_float("LLM_TIMEOUT", 10.0)
+LLM_MAX_CONCURRENCY = _env_int("LLM_MAX_CONCURRENCY", 8)
+LLM_MAX_CONNECTIONS = _env_int("LLM_MAX_CONNECTIONS", 20)
+LLM_BATCH_SIZE = _env_int("LLM_BATCH_SIZE", 8)
+LLM_BATCH_WINDOW = _env_float("LLM_BATCH_WINDOW", 0.01)
+LLM_MAX_TOKENS = _env_int("LLM_MAX_TOKENS", 800)
+# Prompts waiting to be batched; beyond this the template answer is returned at once
+LLM_MAX_QUEUE = _env_int("LLM_MAX_QUEUE", 256)
+
+# Mentor response cache (0 entries disables it); similarity 0 turns off near-duplicate lookup
+CHAT_RESPONSE_CACHE_ENTRIES = _env_int("CHAT_RESPONSE_CACHE_ENTRIES", 5000)
+CHAT_RESPONSE_CACHE_TTL = _env_float("CHAT_RESPONSE_CACHE_TTL", 3600)
+CHAT_RESPONSE_CACHE_SIMILARITY = _env_float("CHAT_RESPONSE_CACHE_SIMILARITY", 0.9)
+
+# Resumes whose rendered advice fragments (top skills, skill blocks) are kept
+MENTOR_FRAGMENT_CACHE_ENTRIES = _env_int("MENTOR_FRAGMENT_CACHE_ENTRIES", 1000)
@@ -0,0 +1,105 @@
+"""
+Conversation Memory - Bounded per-session chat history for the AI mentor
+Each session keeps a ring buffer of recent messages under a character budget;
+idle sessions expire and a global character ceiling evicts the least recently
+used sessions, so memory stays flat as traffic grows
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+from models import ChatMessage
+
+
+class ChatSession:
+    """Recent messages of one conversation"""
+
+    def __init__(self, max_messages: int):
+        self.messages: Deque[ChatMessage] = deque(maxlen=max_messages)
+        self.chars = 0
+        self.last_active = time.monotonic()
+
+    def append(self, message: ChatMessage):
+        if len(self.messages) == self.messages.maxlen:
+            self.chars -= len(self.messages[0].content)
+        self.messages.append(message)
+        self.chars += len(message.content)
+
+    def pop_oldest(self) -> int:
+        message = self.messages.popleft()
+        self.chars -= len(message.content)
+        return len(message.content)
+
+
+class ConversationMemory:
+    """Session id -> ChatSession, with per-session and global budgets"""
+
+    def __init__(self, max_messages: int = 20, max_chars_per_session: int = 20000,
+                 idle_seconds: float = 1800, max_total_chars: int = 50_000_000,
+                 max_sessions: int = 10000):
+        self.max_messages = max(max_messages, 1)
+        self.max_chars_per_session = max_chars_per_session
+        self.idle_seconds = idle_seconds
+        self.max_total_chars = max_total_chars
+        self.max_sessions = max(max_sessions, 1)
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+
+    def history(self, session_id: str) -> List[ChatMessage]:
+        """Messages of a live session, oldest first (empty if unknown or expired)"""
+        with self._lock:
+            session = self._live(session_id)
+            return list(session.messages) if session else []
+
+    def append(self, session_id: str, message: ChatMessage):
+        with self._lock:
+            session = self._live(session_id)
+            if session is None:
+                session = ChatSession(self.max_messages)
+                self._sessions[session_id] = session
+            before = session.chars
+            session.append(message)
+            # A single message larger than the budget is kept alone rather than dropped
+            while session.chars > self.max_chars_per_session and len(session.messages) > 1:
+                session.pop_oldest()
+            session.last_active = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            self._total_chars += session.chars - before
+            self._evict()
+
+    def clear(self, session_id: str):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._total_chars -= session.chars
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._evict()
+            return {"sessions": len(self._sessions), "total_chars": self._total_chars}
+
+    def _live(self, session_id: str) -> Optional[ChatSession]:
+        session = self._sessions.get(session_id)
+        if session is not None and self._idle(session, time.monotonic()):
+            self._drop(session_id)
+            return None
+        return session
+
+    def _idle(self, session: ChatSession, now: float) -> bool:
+        return bool(self.idle_seconds) and now - session.last_active > self.idle_seconds
+
+    def _drop(self, session_id: str):
+        self._total_chars -= self._sessions.pop(session_id).chars
+
+    def _evict(self):
+        # Sessions are kept in LRU order, so idle ones accumulate at the front
+        now = time.monotonic()
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            over_budget = (len(self._sessions) > self.max_sessions
+                           or self._total_chars > self.max_total_chars)
+            if not (over_budget or self._idle(oldest, now)):
+                break
+            self._drop(oldest_id)
@@ -0,0 +1,121 @@
+"""
+Extraction Pool - Runs CPU-bound text extraction and parsing off the event loop
+Each job extracts the text of an upload and builds its ResumeData in a
+ProcessPoolExecutor worker, behind a bounded admission queue with per-job
+timeouts. A pool broken by a crashed worker is replaced on the next job.
+"""
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from models import ResumeData
+from resume_parser import ResumeSource, parse_resume
+from request_profiler import attach_samples, profiled_parse_resume
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionQueueFull(Exception):
+    """Raised when the pool already has the maximum number of pending jobs"""
+
+
+class ExtractionTimeout(Exception):
+    """Raised when a single extraction job exceeds its time budget"""
+
+
+class ExtractionPool:
+    """Bounded, timeout-aware front end for a text extraction process pool"""
+
+    def __init__(self, workers: int, queue_size: int, timeout: float,
+                 initializer: Optional[Callable[[], None]] = None, profile_interval: float = 0):
+        self.workers = workers
+        self.queue_size = max(queue_size, 1)
+        self.timeout = timeout
+        # Runs once in each worker process, e.g. to import the parsers up front
+        self.initializer = initializer
+        # > 0: workers sample their own stacks and send them back for slow-request profiles
+        self.profile_interval = profile_interval
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Bumped whenever a broken executor is replaced
+        self._generation = 0
+        self._pending = 0
+
+    def start(self):
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=self.initializer)
+            # With fork, the first submit launches every worker; do it now, before
+            # background threads (warm-up) exist whose held locks a fork would copy
+            self._executor.submit(int)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def parse(self, source: ResumeSource, filename: str) -> ResumeData:
+        """Extract and parse an upload in a worker, rejecting immediately if the queue is full"""
+        if self._pending >= self.queue_size:
+            raise ExtractionQueueFull(f"{self._pending} extraction jobs already pending")
+
+        if self._executor is not None and not isinstance(source, bytes):
+            # File handles cannot cross a process boundary; ship the content once
+            source.seek(0)
+            source = source.read()
+        generation = self._generation
+        try:
+            return await self._run(source, filename)
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault in a parser): replace the pool, unless a
+            # concurrent job already did, and retry once
+            if self._generation == generation:
+                self._restart()
+            return await self._run(source, filename)
+
+    def _restart(self):
+        logger.warning("Extraction process pool is broken; starting a new one")
+        broken, self._executor = self._executor, None
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        self._generation += 1
+        self.start()
+
+    async def _run(self, source: ResumeSource, filename: str) -> ResumeData:
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            profiled = self._executor is not None and self.profile_interval > 0
+            if profiled:
+                future = loop.run_in_executor(self._executor, profiled_parse_resume, source, filename,
+                                              self.profile_interval)
+            else:
+                # executor=None falls back to the loop's default thread pool
+                future = loop.run_in_executor(self._executor, parse_resume, source, filename)
+        except BaseException:
+            self._pending -= 1
+            raise
+        # A job stays pending until its worker is free again, not just until the
+        # caller stops waiting, so stuck workers keep counting against queue_size
+        future.add_done_callback(self._job_done)
+
+        try:
+            # shield: a timeout or a cancelled request must not mark the job done early
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # The worker keeps running until it finishes; its result is discarded
+            raise ExtractionTimeout(f"Text extraction exceeded {self.timeout:.0f}s")
+        if profiled:
+            result, samples = result
+            attach_samples(samples)
+        return result
+
+    def _job_done(self, future: asyncio.Future):
+        self._pending -= 1
+        if not future.cancelled():
+            # Retrieve the outcome of abandoned jobs so it is not logged as unhandled
+            future.exception()
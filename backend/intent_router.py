@@ -0,0 +1,127 @@
+"""
+Intent Router - Precompiled, weighted intent classification for mentor chat
+All intent keywords are compiled once into a single word-boundary scanner, so a
+message is classified in one pass instead of a cascade of substring checks
+("pay" no longer fires on "display", nor "hi" on "this"). Extra intents can be
+loaded from a JSON data file.
+"""
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from skill_matcher import TermScanner
+
+
+# Default intents in priority order; earlier intents win ties
+DEFAULT_INTENTS = [
+    {"name": "resume", "keywords": ["resume", "cv", "improve", "review", "feedback"]},
+    {"name": "interview", "keywords": ["interview", "prepare", "question"]},
+    {"name": "salary", "keywords": ["salary", "negotiate", "compensation", "pay"]},
+    {"name": "learning", "keywords": ["skill", "learn", "course", "certification", "study"]},
+    {"name": "career", "keywords": ["career", "path", "transition", "switch", "change"]},
+    {"name": "project", "keywords": ["project", "portfolio", "github", "build"]},
+    {"name": "job_search", "keywords": ["job", "jobs", "apply", "application", "search", "hunt"]},
+    {"name": "greeting", "keywords": ["hello", "hi", "hey", "start", "help"]},
+]
+
+_SUFFIXES = ("s", "es", "ed", "ing", "er", "ers")
+# Shorter keywords are matched as written ("hi" must not become "his"); list
+# their other forms as keywords of their own, like "jobs"
+MIN_INFLECTED_LENGTH = 4
+
+
+def inflections(keyword: str) -> List[str]:
+    """Common English inflections so "skills", "preparing" or "studies" still match"""
+    forms = {keyword}
+    if " " in keyword or len(keyword) < MIN_INFLECTED_LENGTH:
+        return sorted(forms)
+    forms.update(keyword + suffix for suffix in _SUFFIXES)
+    if keyword.endswith("e"):
+        forms.update({keyword + "d", keyword[:-1] + "ing"})
+    if keyword.endswith("y") and len(keyword) > 2 and keyword[-2] not in "aeiou":
+        forms.update({keyword[:-1] + "ies", keyword[:-1] + "ied"})
+    return sorted(forms)
+
+
+class IntentRouter:
+    """Scores every intent for a message in one scan and picks the best"""
+
+    def __init__(self, intents: Optional[List[Dict]] = None):
+        self.intents: List[Dict] = []
+        self._scanner: Optional[TermScanner] = None
+        self._forms: Dict[str, List[Tuple[str, float]]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.total_ns = 0
+        self.add_intents(intents if intents is not None else DEFAULT_INTENTS)
+
+    def add_intents(self, intents: List[Dict]):
+        """Add intents ({"name", "keywords": [..] or {word: weight}, optional "response"})
+
+        Keywords of an intent that already exists are merged into it; new intents
+        rank after existing ones on ties. The scanner is recompiled once.
+        """
+        by_name = {intent["name"]: intent for intent in self.intents}
+        for definition in intents:
+            keywords = definition.get("keywords", {})
+            if isinstance(keywords, list):
+                keywords = {keyword: 1.0 for keyword in keywords}
+            intent = by_name.get(definition["name"])
+            if intent is None:
+                intent = {"name": definition["name"], "keywords": {}, "response": None}
+                self.intents.append(intent)
+                by_name[intent["name"]] = intent
+            intent["keywords"].update({k.lower(): float(w) for k, w in keywords.items()})
+            if definition.get("response"):
+                intent["response"] = definition["response"]
+        self._compile()
+
+    def load_intents(self, path: str):
+        """Load additional intents from a JSON file: {"intents": [...]} or a bare list"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.add_intents(data["intents"] if isinstance(data, dict) else data)
+
+    def _compile(self):
+        forms: Dict[str, List[Tuple[str, float]]] = {}
+        for intent in self.intents:
+            for keyword, weight in intent["keywords"].items():
+                for form in inflections(keyword):
+                    forms.setdefault(form, []).append((intent["name"], weight))
+        scanner = TermScanner(forms, word_boundary=True)
+        self._forms, self._scanner = forms, scanner
+        self._rank = {intent["name"]: i for i, intent in enumerate(self.intents)}
+
+    def scores(self, msg_lower: str) -> Dict[str, float]:
+        """Weighted score per intent; each distinct keyword form counts once"""
+        totals: Dict[str, float] = {}
+        for form in self._scanner.find(msg_lower):
+            for name, weight in self._forms[form]:
+                totals[name] = totals.get(name, 0.0) + weight
+        return totals
+
+    def classify(self, msg_lower: str) -> Optional[str]:
+        """Best-scoring intent name, or None when no keyword matches"""
+        start = time.perf_counter_ns()
+        totals = self.scores(msg_lower)
+        best = min(totals, key=lambda name: (-totals[name], self._rank[name])) if totals else None
+        elapsed = time.perf_counter_ns() - start
+        with self._lock:
+            self.calls += 1
+            self.total_ns += elapsed
+        return best
+
+    def response_template(self, name: str) -> Optional[str]:
+        for intent in self.intents:
+            if intent["name"] == name:
+                return intent["response"]
+        return None
+
+    def stats(self) -> Dict:
+        return {
+            "intents": len(self.intents),
+            "keyword_forms": len(self._forms),
+            "calls": self.calls,
+            "avg_classify_us": round(self.total_ns / self.calls / 1000, 2) if self.calls else 0.0
+        }
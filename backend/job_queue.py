@@ -0,0 +1,397 @@
+"""
+Job Queue - In-process asynchronous job subsystem for heavy analysis work
+Jobs are persisted through a pluggable broker (in-memory, or SQLite as a local
+stand-in for a real message broker) and executed by a fixed number of asyncio
+workers with priorities, retries and an optional executor for blocking handlers
+"""
+import asyncio
+import heapq
+import itertools
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple, Type
+
+from models import AnalysisJob, JobStatus
+
+
+class JobQueueFull(Exception):
+    """The broker cannot hold any more queued input"""
+
+
+class JobBroker(ABC):
+    """Storage and ordering of jobs; dequeue returns the highest priority queued job"""
+
+    # Seconds a claimed job stays owned without a heartbeat (brokers shared across processes)
+    lease_seconds = 30.0
+
+    @abstractmethod
+    def enqueue(self, job: AnalysisJob, data: Optional[bytes] = None):
+        """Persist a job (and optional binary input) and mark it queued"""
+
+    @abstractmethod
+    def requeue(self, job: AnalysisJob):
+        """Put an existing job back in the queue, keeping its binary input"""
+
+    @abstractmethod
+    def dequeue(self) -> Optional[AnalysisJob]:
+        """Atomically claim the next queued job, marking it running"""
+
+    @abstractmethod
+    def update(self, job: AnalysisJob):
+        """Persist status/result changes of a job"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Return a job by id"""
+
+    @abstractmethod
+    def load_data(self, job_id: str) -> Optional[bytes]:
+        """Return the binary input stored with a job"""
+
+    @abstractmethod
+    def recover(self) -> int:
+        """Requeue jobs whose owner stopped renewing their lease; returns how many"""
+
+    def heartbeat(self):
+        """Renew the leases of the jobs this broker instance has claimed"""
+
+    def close(self):
+        pass
+
+
+class MemoryBroker(JobBroker):
+    """Single-process broker: a priority heap plus a bounded job table
+
+    Uploaded inputs live in memory until their job finishes, so their total size
+    is capped by max_queued_bytes; enqueue raises JobQueueFull beyond it.
+    """
+
+    def __init__(self, max_jobs: int = 10000, max_queued_bytes: int = 200 * 1024 * 1024):
+        self.max_jobs = max(max_jobs, 1)
+        self.max_queued_bytes = max_queued_bytes
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._data: Dict[str, bytes] = {}
+        self._data_bytes = 0
+        self._heap = []
+        self._seq = itertools.count()
+
+    def enqueue(self, job: AnalysisJob, data: Optional[bytes] = None):
+        if data is not None:
+            if self._data_bytes + len(data) > self.max_queued_bytes:
+                raise JobQueueFull(f"{self._data_bytes} bytes of job input already queued")
+            self._data[job.id] = data
+            self._data_bytes += len(data)
+        self.requeue(job)
+        self._trim()
+
+    def requeue(self, job: AnalysisJob):
+        job.status = JobStatus.QUEUED
+        self._jobs[job.id] = job
+        heapq.heappush(self._heap, (-job.priority, next(self._seq), job.id))
+
+    def dequeue(self) -> Optional[AnalysisJob]:
+        while self._heap:
+            _, _, job_id = heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if job is not None and job.status == JobStatus.QUEUED:
+                job.status = JobStatus.RUNNING
+                return job
+        return None
+
+    def update(self, job: AnalysisJob):
+        self._jobs[job.id] = job
+        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            self._drop_data(job.id)
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        return self._jobs.get(job_id)
+
+    def load_data(self, job_id: str) -> Optional[bytes]:
+        return self._data.get(job_id)
+
+    def recover(self) -> int:
+        return 0
+
+    def _trim(self):
+        # Evict the oldest finished jobs once over capacity; queued work is never dropped
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, job in self._jobs.items()
+                    if job.status in (JobStatus.COMPLETED, JobStatus.FAILED)][:excess]
+        for job_id in finished:
+            del self._jobs[job_id]
+            self._drop_data(job_id)
+
+    def _drop_data(self, job_id: str):
+        data = self._data.pop(job_id, None)
+        if data is not None:
+            self._data_bytes -= len(data)
+
+
+class SQLiteBroker(JobBroker):
+    """Durable broker in a SQLite file (WAL mode); several processes can share it
+
+    A claimed job records its owner (this broker instance) and a lease that the
+    owner renews through heartbeat(); recover() only requeues running or
+    retrying jobs whose lease has expired, so jobs live processes are still
+    executing are left alone.
+    """
+
+    FINISHED = (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+    # Computed inside the writing statement, so concurrent processes never share a seq
+    _NEXT_SEQ = "(SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs)"
+
+    def __init__(self, path: str, max_jobs: int = 10000, lease_seconds: float = 30.0):
+        self.max_jobs = max(max_jobs, 1)
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, priority INTEGER NOT NULL, "
+                "seq INTEGER NOT NULL, record TEXT NOT NULL, data BLOB, owner TEXT, lease_until REAL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if column not in columns:
+                    # Files created before leases existed
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority DESC, seq)")
+
+    def enqueue(self, job: AnalysisJob, data: Optional[bytes] = None):
+        job.status = JobStatus.QUEUED
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, status, priority, seq, record, data) "
+                f"VALUES (?, ?, ?, {self._NEXT_SEQ}, ?, ?)",
+                (job.id, job.status.value, job.priority, job.model_dump_json(), data)
+            )
+            self._trim()
+
+    def requeue(self, job: AnalysisJob):
+        job.status = JobStatus.QUEUED
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET status = ?, seq = {self._NEXT_SEQ}, record = ?, owner = NULL, lease_until = NULL "
+                "WHERE id = ? AND owner = ?",
+                (job.status.value, job.model_dump_json(), job.id, self.owner)
+            )
+
+    def dequeue(self) -> Optional[AnalysisJob]:
+        with self._lock:
+            while True:
+                row = self._conn.execute(
+                    "SELECT id, record FROM jobs WHERE status = ? ORDER BY priority DESC, seq LIMIT 1",
+                    (JobStatus.QUEUED.value,)
+                ).fetchone()
+                if row is None:
+                    return None
+                job = AnalysisJob.model_validate_json(row[1])
+                job.status = JobStatus.RUNNING
+                # Conditional update: another process may have claimed it first
+                claimed = self._conn.execute(
+                    "UPDATE jobs SET status = ?, record = ?, owner = ?, lease_until = ? WHERE id = ? AND status = ?",
+                    (job.status.value, job.model_dump_json(), self.owner, time.time() + self.lease_seconds,
+                     job.id, JobStatus.QUEUED.value)
+                ).rowcount
+                if claimed:
+                    return job
+
+    def update(self, job: AnalysisJob):
+        finished = job.status.value in self.FINISHED
+        with self._lock:
+            # Only the current owner may write: a job whose lease lapsed may already run elsewhere
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, record = ?" + (", data = NULL" if finished else "") +
+                " WHERE id = ? AND owner = ?",
+                (job.status.value, job.model_dump_json(), job.id, self.owner)
+            )
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return AnalysisJob.model_validate_json(row[0]) if row else None
+
+    def load_data(self, job_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def heartbeat(self):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE owner = ? AND status IN (?, ?)",
+                (time.time() + self.lease_seconds, self.owner, JobStatus.RUNNING.value, JobStatus.RETRYING.value)
+            )
+
+    def recover(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE jobs SET status = ?, record = json_set(record, '$.status', ?), owner = NULL, "
+                "lease_until = NULL WHERE status IN (?, ?) AND COALESCE(lease_until, 0) < ?",
+                (JobStatus.QUEUED.value, JobStatus.QUEUED.value, JobStatus.RUNNING.value, JobStatus.RETRYING.value, time.time())
+            ).rowcount
+
+    def _trim(self):
+        # Same policy as MemoryBroker: drop the oldest finished jobs once over capacity
+        excess = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - self.max_jobs
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE id IN (SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY seq LIMIT ?)",
+                (*self.FINISHED, excess)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_broker(backend: str, path: str = "", max_jobs: int = 10000, lease_seconds: float = 30.0,
+                  max_queued_bytes: int = 200 * 1024 * 1024) -> JobBroker:
+    """Build the broker selected by configuration ("memory" or "sqlite")"""
+    if backend == "sqlite":
+        return SQLiteBroker(path, max_jobs=max_jobs, lease_seconds=lease_seconds)
+    if backend == "memory":
+        return MemoryBroker(max_jobs=max_jobs, max_queued_bytes=max_queued_bytes)
+    raise ValueError(f"Unknown job broker backend: {backend}")
+
+
+# A handler receives the job and its binary input and returns the JSON-able result.
+# Coroutine functions run on the event loop; plain functions run in the executor.
+JobHandler = Callable[[AnalysisJob, Optional[bytes]], object]
+
+
+class JobQueue:
+    """Runs brokered jobs on a fixed number of asyncio workers
+
+    Errors in ``non_retryable`` fail a job at once; errors in ``deferrable``
+    (shared capacity is busy) requeue it after a backoff without using up an attempt.
+    """
+
+    def __init__(self, broker: JobBroker, concurrency: int, poll_interval: float = 1.0,
+                 retry_backoff: float = 0.5, executor: Optional[Executor] = None,
+                 non_retryable: Tuple[Type[BaseException], ...] = (),
+                 deferrable: Tuple[Type[BaseException], ...] = ()):
+        self.broker = broker
+        self.concurrency = max(concurrency, 1)
+        self.poll_interval = poll_interval
+        self.retry_backoff = retry_backoff
+        self.executor = executor
+        self.non_retryable = non_retryable
+        self.deferrable = deferrable
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers = []
+        # Pending retry delays, cancelled on stop so none requeue on a closed broker
+        self._retries = set()
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def register(self, kind: str, handler: JobHandler):
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, payload: Dict, data: Optional[bytes] = None,
+               priority: int = 0, max_retries: int = 2) -> AnalysisJob:
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind: {kind}")
+        job = AnalysisJob(kind=kind, payload=payload, priority=priority, max_retries=max_retries)
+        self.broker.enqueue(job, data)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        return self.broker.get(job_id)
+
+    def start(self):
+        self.broker.recover()
+        self._wakeup = asyncio.Event()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._workers.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self):
+        tasks = self._workers + list(self._retries)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._retries.clear()
+        self.broker.close()
+
+    async def _heartbeat(self):
+        # Keep this process's leases alive and pick up jobs of processes that died
+        interval = self.broker.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            self.broker.heartbeat()
+            if self.broker.recover():
+                self._wakeup.set()
+
+    async def _worker(self):
+        while True:
+            job = self.broker.dequeue()
+            if job is None:
+                # Woken by a local submit, or poll for jobs enqueued by other processes
+                self._wakeup.clear()
+                # asyncio.wait, not wait_for: wait_for can swallow stop()'s cancel
+                # when the wakeup fires in the same loop iteration
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=self.poll_interval)
+                finally:
+                    waiter.cancel()
+                continue
+            await self._execute(job)
+
+    async def _execute(self, job: AnalysisJob):
+        job.attempts += 1
+        job.started_at = datetime.now().isoformat()
+        self.broker.update(job)
+        handler = self._handlers[job.kind]
+        try:
+            data = self.broker.load_data(job.id)
+            if asyncio.iscoroutinefunction(handler):
+                result = await handler(job, data)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(self.executor, handler, job, data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            if isinstance(e, self.deferrable):
+                # The job never ran: don't count the attempt
+                job.attempts -= 1
+                self._schedule_retry(job, self.retry_backoff)
+                return
+            if job.attempts <= job.max_retries and not isinstance(e, self.non_retryable):
+                self._schedule_retry(job, self.retry_backoff * 2 ** (job.attempts - 1))
+                return
+            job.status = JobStatus.FAILED
+        else:
+            job.status = JobStatus.COMPLETED
+            job.result = result
+            job.error = ""
+        job.finished_at = datetime.now().isoformat()
+        self.broker.update(job)
+
+    def _schedule_retry(self, job: AnalysisJob, delay: float):
+        job.status = JobStatus.RETRYING
+        self.broker.update(job)
+        retry = asyncio.create_task(self._retry_later(job, delay))
+        self._retries.add(retry)
+        retry.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, job: AnalysisJob, delay: float):
+        await asyncio.sleep(delay)
+        self.broker.requeue(job)
+        self._wakeup.set()
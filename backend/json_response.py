@@ -0,0 +1,31 @@
+"""
+JSON Response - Fast JSON encoding for large API responses
+Models are serialized straight to bytes by pydantic-core (model_dump_json /
+to_json) instead of .dict() -> jsonable_encoder -> json.dumps, and responses
+can be spliced together from fragments that were serialized (and cached) once.
+"""
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+def json_bytes(value: Any) -> bytes:
+    """Compact UTF-8 JSON for models, lists of models and plain data"""
+    return to_json(value)
+
+
+def json_object(**fields: bytes) -> bytes:
+    """A JSON object whose member values are already-serialized JSON fragments"""
+    return b"{" + b",".join(b'"%s":%s' % (name.encode(), value) for name, value in fields.items()) + b"}"
+
+
+class JSONBytesResponse(Response):
+    """Like ORJSONResponse: bytes are sent as-is, anything else goes through pydantic-core"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
@@ -0,0 +1,179 @@
+"""
+LLM Backends - Pluggable text generation behind the AI mentor
+TemplateBackend keeps the built-in canned answers; HTTPBackend calls a model
+server through a pooled async client with concurrency limits, timeouts and
+micro-batching of concurrent prompts, falling back to the template answer
+whenever the model is slow or unavailable
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+
+class LLMBackend(ABC):
+    """Produces the mentor's reply; ``fallback`` is the template answer for the prompt"""
+
+    name = "base"
+
+    @abstractmethod
+    async def complete(self, system_prompt: str, prompt: str, fallback: str) -> str:
+        """Return the reply to prompt, or fallback when no better answer is available"""
+
+    def stats(self) -> Dict:
+        return {"backend": self.name}
+
+    async def aclose(self):
+        pass
+
+
+class TemplateBackend(LLMBackend):
+    """The original behaviour: answer with the intent's canned template"""
+
+    name = "template"
+
+    async def complete(self, system_prompt: str, prompt: str, fallback: str) -> str:
+        return fallback
+
+
+class HTTPBackend(LLMBackend):
+    """Model server client with a pooled connection, concurrency cap and micro-batching
+
+    Wire format (served by llm_stub for local testing):
+    POST {base_url}/v1/batch {"system": str, "prompts": [str], "max_tokens": int}
+    -> {"completions": [str]} in prompt order.
+    """
+
+    name = "http"
+
+    def __init__(self, base_url: str, api_key: str = "", timeout: float = 10.0,
+                 max_concurrency: int = 8, max_connections: int = 20,
+                 batch_size: int = 8, batch_window: float = 0.01, max_tokens: int = 800,
+                 max_queue: int = 256, transport=None):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.batch_size = max(batch_size, 1)
+        self.batch_window = batch_window
+        self.max_tokens = max_tokens
+        self.max_queue = max(max_queue, 1)
+        self.transport = transport
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self._client = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._inflight = set()
+        self.requests = 0
+        self.batches = 0
+        self.batched = 0
+        self.fallbacks = 0
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.timeout,
+                transport=self.transport,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections)
+            )
+        return self._client
+
+    async def complete(self, system_prompt: str, prompt: str, fallback: str) -> str:
+        if self._batcher is None or self._batcher.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._batcher = asyncio.create_task(self._collect_batches())
+        future = asyncio.get_running_loop().create_future()
+        self.requests += 1
+        try:
+            self._queue.put_nowait((system_prompt, prompt, future))
+        except asyncio.QueueFull:
+            # The model server is already this far behind; don't wait for it
+            self.fallbacks += 1
+            return fallback
+        try:
+            completion = await asyncio.wait_for(future, timeout=self.timeout)
+        except Exception:
+            # Timeouts and server errors both degrade to the template answer
+            self.fallbacks += 1
+            return fallback
+        return completion or fallback
+
+    async def _collect_batches(self):
+        """Group prompts that arrive within batch_window into one request"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Different system prompts cannot share a request
+            groups: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+            for system_prompt, prompt, future in batch:
+                groups.setdefault(system_prompt, []).append((prompt, future))
+            for system_prompt, items in groups.items():
+                task = asyncio.create_task(self._send(system_prompt, items))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, system_prompt: str, items: List[Tuple[str, asyncio.Future]]):
+        async with self._semaphore:
+            # Callers that timed out while the batch waited for a slot are already answered
+            items = [(prompt, future) for prompt, future in items if not future.done()]
+            if not items:
+                return
+            self.batches += 1
+            self.batched += len(items)
+            try:
+                response = await self._get_client().post("/v1/batch", json={
+                    "system": system_prompt,
+                    "prompts": [prompt for prompt, _ in items],
+                    "max_tokens": self.max_tokens
+                })
+                response.raise_for_status()
+                completions = response.json()["completions"]
+                if len(completions) != len(items):
+                    raise ValueError("Model server returned a mismatched batch")
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for (_, future), completion in zip(items, completions):
+            if not future.done():
+                future.set_result(completion)
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.name,
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched / self.batches, 2) if self.batches else 0.0,
+            "fallbacks": self.fallbacks
+        }
+
+    async def aclose(self):
+        if self._batcher is not None:
+            self._batcher.cancel()
+        for task in list(self._inflight):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_backend(backend: str, **options) -> LLMBackend:
+    """Build the backend selected by configuration ("template" or "http")"""
+    if backend == "http":
+        return HTTPBackend(**options)
+    if backend == "template":
+        return TemplateBackend()
+    raise ValueError(f"Unknown LLM backend: {backend}")
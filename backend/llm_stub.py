@@ -0,0 +1,43 @@
+"""
+LLM Stub Server - Local stand-in for a model server, for development and tests
+Implements the HTTPBackend wire format with deterministic completions and an
+optional artificial latency. Run with: python llm_stub.py
+"""
+import asyncio
+import os
+from typing import List
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+
+class BatchRequest(BaseModel):
+    system: str = ""
+    prompts: List[str]
+    max_tokens: int = 800
+
+
+def create_stub_app(delay: float = 0.0) -> FastAPI:
+    app = FastAPI(title="LLM Stub Server")
+    app.state.batch_sizes = []
+
+    @app.post("/v1/batch")
+    async def batch(request: BatchRequest):
+        app.state.batch_sizes.append(len(request.prompts))
+        await asyncio.sleep(delay)
+        completions = []
+        for prompt in request.prompts:
+            # Echo the user's last line so callers can check prompt/completion pairing
+            last_line = prompt.strip().splitlines()[-1] if prompt.strip() else ""
+            completions.append(f"[stub completion] {last_line}"[:request.max_tokens * 4])
+        return {"completions": completions}
+
+    return app
+
+
+app = create_stub_app(delay=float(os.environ.get("LLM_STUB_DELAY", "0")))
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="127.0.0.1", port=int(os.environ.get("LLM_STUB_PORT", "8001")))
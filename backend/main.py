@@ -2,26 +2,94 @@
 FastAPI Backend - AI Career Mentor Platform
 Main application with all API endpoints
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, File, Form, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from typing import List, Optional, Tuple
+import hmac
+import json
 import uuid
+import zipfile
+
+import config
 
 from models import (
     ResumeData, ResumeAnalysis, ChatRequest, ChatMessage,
-    ProfileInput, CareerPath, SkillGap, LearningRoadmap
-)
-from resume_parser import parse_resume
-from career_analyzer import (
-    analyze_resume, detect_skill_gaps,
-    match_career_paths, generate_learning_roadmap
+    ProfileInput, CareerPath, SkillGap, LearningRoadmap, AnalysisJob, JobStatus
 )
+from extraction_pool import ExtractionPool, ExtractionQueueFull, ExtractionTimeout
+from upload_ingest import spool_upload, UploadTooLarge, UnsupportedContent
+from parse_cache import ParseCache, content_hasher, stream_digest
+from batch_ingest import BatchIngestor, ALLOWED_EXTENSIONS, file_extension, iter_zip_members
+from resume_store import create_store
+from analysis_cache import AnalysisCache
+from job_queue import JobQueue, JobQueueFull, create_broker
 from ai_engine import ai_mentor
+from startup import start_warmup, warm_extraction, warm_mentor, warmup_status
+import metrics
+from json_response import JSONBytesResponse, json_bytes, json_object
+from request_profiler import ProfilerMiddleware, SlowRequestProfiler
+
+extraction_pool = ExtractionPool(
+    workers=config.EXTRACTION_WORKERS,
+    queue_size=config.EXTRACTION_QUEUE_SIZE,
+    timeout=config.EXTRACTION_TIMEOUT,
+    initializer=warm_extraction if config.WARMUP_ON_STARTUP else None,
+    profile_interval=config.SLOW_PROFILE_INTERVAL if config.SLOW_PROFILE_THRESHOLD > 0 else 0
+)
+
+request_profiler = SlowRequestProfiler(
+    threshold=config.SLOW_PROFILE_THRESHOLD,
+    interval=config.SLOW_PROFILE_INTERVAL,
+    max_profiles=config.SLOW_PROFILE_RETAINED
+) if config.SLOW_PROFILE_THRESHOLD > 0 else None
+
+parse_cache = ParseCache(max_entries=config.PARSE_CACHE_ENTRIES)
+analysis_cache = AnalysisCache(
+    max_entries=config.ANALYSIS_CACHE_ENTRIES,
+    max_json_bytes=config.ANALYSIS_JSON_CACHE_BYTES
+)
+
+resume_store = create_store(
+    config.RESUME_STORE_BACKEND,
+    path=config.RESUME_STORE_PATH,
+    max_entries=config.RESUME_STORE_MAX_ENTRIES,
+    ttl_seconds=config.RESUME_STORE_TTL
+)
+
+
+job_queue = JobQueue(
+    create_broker(config.JOB_BROKER_BACKEND, path=config.JOB_BROKER_PATH, max_jobs=config.JOB_RETAINED,
+                  lease_seconds=config.JOB_LEASE_SECONDS, max_queued_bytes=config.JOB_MAX_QUEUED_BYTES),
+    concurrency=config.JOB_CONCURRENCY,
+    poll_interval=config.JOB_POLL_INTERVAL,
+    non_retryable=(UploadTooLarge, UnsupportedContent, LookupError),
+    deferrable=(ExtractionQueueFull,)
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    extraction_pool.start()
+    job_queue.start()
+    if config.WARMUP_ON_STARTUP:
+        # The mentor's caches belong to the event loop: warm them here, before serving
+        warm_mentor()
+        # Serve immediately; parsers and indexes warm up in the background
+        start_warmup()
+    yield
+    await job_queue.stop()
+    await ai_mentor.backend.aclose()
+    extraction_pool.shutdown()
+    resume_store.close()
+
 
 app = FastAPI(
     title="AI Career Mentor Platform",
     description="AI-powered career guidance and resume analysis platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -33,9 +101,99 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory storage
-resumes_store: Dict[str, ResumeData] = {}
-profiles_store: Dict[str, ProfileInput] = {}
+if config.METRICS_ENABLED:
+    # Outermost, so latency includes CORS handling; app.routes is the live route list
+    app.add_middleware(
+        metrics.MetricsMiddleware,
+        registry=metrics.registry,
+        routes=app.routes,
+        server_timing_header=config.SERVER_TIMING_HEADER
+    )
+
+if request_profiler is not None:
+    app.add_middleware(ProfilerMiddleware, profiler=request_profiler)
+
+
+async def ingest_resume(upload, filename: str, digest: str) -> Tuple[ResumeData, bool]:
+    """Parse a spooled upload, reusing the stored resume for content seen before"""
+    resume_data = parse_cache.get(digest, resume_store.get)
+    if resume_data is not None:
+        return resume_data, True
+    with metrics.span("extraction"):
+        # Text extraction and field parsing both run in the pool, off the event loop
+        resume_data = await extraction_pool.parse(upload, filename)
+    resume_store.put(resume_data)
+    analysis_cache.invalidate(resume_data.id)
+    parse_cache.put(digest, resume_data.id)
+    return resume_data, False
+
+
+async def ingest_batch_member(upload, filename: str) -> dict:
+    resume_data, deduplicated = await ingest_resume(upload, filename, stream_digest(upload, file_extension(filename)))
+    return {
+        "filename": filename,
+        "status": "success",
+        "resume_id": resume_data.id,
+        "deduplicated": deduplicated,
+        "skills_found": len(resume_data.skills)
+    }
+
+
+batch_ingestor = BatchIngestor(
+    ingest_batch_member,
+    concurrency=config.BATCH_CONCURRENCY,
+    max_jobs=config.BATCH_JOBS_RETAINED
+)
+
+
+def get_resume_or_404(resume_id: str, with_raw_text: bool = True) -> ResumeData:
+    resume = resume_store.get(resume_id, with_raw_text=with_raw_text)
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return resume
+
+
+def build_dashboard(resume: ResumeData, target_career: str = "") -> dict:
+    """Full analysis bundle for a resume: analysis, gaps, paths and roadmap"""
+    analysis = analysis_cache.analysis(resume)
+    gaps = analysis_cache.skill_gaps(resume, target_career)
+    paths = analysis_cache.career_paths(resume)
+    roadmap = analysis_cache.roadmap(resume, target_career)
+
+    return {
+        "resume": resume.model_dump(mode="json"),
+        "analysis": analysis.model_dump(mode="json"),
+        "skill_gaps": [g.model_dump(mode="json") for g in gaps],
+        "career_paths": [p.model_dump(mode="json") for p in paths],
+        "learning_roadmap": roadmap.model_dump(mode="json")
+    }
+
+
+def dashboard_json(resume: ResumeData, target_career: str = "") -> bytes:
+    """build_dashboard as response bytes, spliced from the cached JSON of each part"""
+    return json_object(
+        resume=json_bytes(resume),
+        analysis=analysis_cache.analysis_json(resume),
+        skill_gaps=analysis_cache.skill_gaps_json(resume, target_career),
+        career_paths=analysis_cache.career_paths_json(resume),
+        learning_roadmap=analysis_cache.roadmap_json(resume, target_career)
+    )
+
+
+async def run_analysis_job(job: AnalysisJob, data: Optional[bytes]) -> dict:
+    """Job handler: parse (if a file was submitted), then analyze -> gaps -> paths -> roadmap"""
+    if data is not None:
+        hasher = content_hasher(file_extension(job.payload["filename"]))
+        hasher.update(data)
+        resume, _ = await ingest_resume(data, job.payload["filename"], hasher.hexdigest())
+    else:
+        resume = resume_store.get(job.payload["resume_id"])
+        if resume is None:
+            raise LookupError("Resume not found")
+    return build_dashboard(resume, job.payload.get("target_career", ""))
+
+
+job_queue.register("analysis", run_analysis_job)
 
 
 @app.get("/")
@@ -45,7 +203,7 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
+    return {"status": "healthy", "warmup": warmup_status["state"]}
 
 
 @app.post("/api/upload-resume")
@@ -54,129 +212,404 @@ async def upload_resume(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file uploaded")
 
-    allowed_extensions = ['.pdf', '.docx', '.doc', '.txt']
-    file_ext = '.' + file.filename.rsplit('.', 1)[-1].lower() if '.' in file.filename else ''
-    if file_ext not in allowed_extensions:
+    file_ext = file_extension(file.filename)
+    if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
     try:
-        file_bytes = await file.read()
-        resume_data = parse_resume(file_bytes, file.filename)
-        resumes_store[resume_data.id] = resume_data
-
-        return {
-            "success": True,
-            "resume_id": resume_data.id,
-            "resume": resume_data.dict(),
-            "message": f"Resume parsed successfully. Found {len(resume_data.skills)} skills and {len(resume_data.experience)} experience entries."
-        }
+        hasher = content_hasher(file_ext)
+        with await spool_upload(
+            file, file_ext,
+            max_bytes=config.MAX_UPLOAD_BYTES,
+            chunk_size=config.UPLOAD_CHUNK_SIZE,
+            spool_bytes=config.UPLOAD_SPOOL_BYTES,
+            hasher=hasher
+        ) as upload:
+            resume_data, deduplicated = await ingest_resume(upload, file.filename, hasher.hexdigest())
+
+        return JSONBytesResponse(json_object(
+            success=b"true",
+            resume_id=json_bytes(resume_data.id),
+            resume=json_bytes(resume_data),
+            deduplicated=json_bytes(deduplicated),
+            message=json_bytes(f"Resume parsed successfully. Found {len(resume_data.skills)} skills and {len(resume_data.experience)} experience entries.")
+        ))
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedContent as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ExtractionQueueFull:
+        raise HTTPException(status_code=429, detail="Server is busy processing other resumes. Please retry shortly.")
+    except ExtractionTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
 
+@app.post("/api/upload-resumes/batch", status_code=202)
+async def upload_resumes_batch(files: List[UploadFile] = File(...)):
+    """Upload a zip archive or several resume files for background parsing"""
+    if len(files) == 1 and file_extension(files[0].filename or "") == ".zip":
+        try:
+            archive = await spool_upload(
+                files[0], ".zip",
+                max_bytes=config.MAX_BATCH_UPLOAD_BYTES,
+                chunk_size=config.UPLOAD_CHUNK_SIZE,
+                spool_bytes=config.UPLOAD_SPOOL_BYTES
+            )
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnsupportedContent as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        if not zipfile.is_zipfile(archive):
+            archive.close()
+            raise HTTPException(status_code=415, detail="File content is not a valid .zip archive")
+
+        def members():
+            with archive:
+                yield from iter_zip_members(
+                    archive,
+                    max_members=config.BATCH_MAX_FILES,
+                    max_bytes=config.MAX_UPLOAD_BYTES,
+                    chunk_size=config.UPLOAD_CHUNK_SIZE,
+                    spool_bytes=config.UPLOAD_SPOOL_BYTES
+                )
+
+        job = batch_ingestor.submit(members())
+    else:
+        # Multipart uploads are closed once this request returns, so spool them now,
+        # bounded in total like a zip archive
+        items = []
+        remaining = config.MAX_BATCH_UPLOAD_BYTES
+        for count, file in enumerate(files):
+            filename = file.filename or ""
+            file_ext = file_extension(filename)
+            if count >= config.BATCH_MAX_FILES:
+                items.append((None, filename, f"Batch exceeds the {config.BATCH_MAX_FILES} file limit"))
+            elif file_ext not in ALLOWED_EXTENSIONS:
+                items.append((None, filename, f"Unsupported file type: {file_ext or 'none'}"))
+            else:
+                try:
+                    spool = await spool_upload(
+                        file, file_ext,
+                        max_bytes=min(config.MAX_UPLOAD_BYTES, remaining),
+                        chunk_size=config.UPLOAD_CHUNK_SIZE,
+                        spool_bytes=config.UPLOAD_SPOOL_BYTES
+                    )
+                except UploadTooLarge as e:
+                    if remaining < config.MAX_UPLOAD_BYTES:
+                        for member, _, _ in items:
+                            if member is not None:
+                                member[0].close()
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"Batch exceeds the {config.MAX_BATCH_UPLOAD_BYTES / (1024 * 1024):g} MB upload limit"
+                        )
+                    items.append((None, filename, str(e)))
+                except UnsupportedContent as e:
+                    items.append((None, filename, str(e)))
+                else:
+                    remaining -= spool.seek(0, 2)
+                    spool.seek(0)
+                    items.append(((spool, filename), filename, None))
+        job = batch_ingestor.submit(iter(items), total=len(items))
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/upload-resumes/batch/{job.id}",
+        "stream_url": f"/api/upload-resumes/batch/{job.id}/stream"
+    }
+
+
+@app.get("/api/upload-resumes/batch/{job_id}")
+async def get_batch_status(job_id: str, include_results: bool = True):
+    """Poll a batch upload for progress, throughput and per-file results"""
+    job = batch_ingestor.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job.summary(include_results=include_results)
+
+
+@app.get("/api/upload-resumes/batch/{job_id}/stream")
+async def stream_batch_results(job_id: str):
+    """Stream per-file results as newline-delimited JSON, ending with the job summary"""
+    job = batch_ingestor.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+
+    async def lines():
+        async for result in job.stream_results():
+            yield json.dumps(result) + "\n"
+        yield json.dumps(job.summary(include_results=False)) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/jobs/analyze", status_code=202)
+async def submit_analysis_job(
+    file: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    target_career: str = Form(""),
+    priority: int = Form(0)
+):
+    """Queue the full parse and analysis pipeline for a new file or a stored resume"""
+    payload = {"target_career": target_career}
+    data = None
+    if file is not None and file.filename:
+        file_ext = file_extension(file.filename)
+        if file_ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+            )
+        try:
+            with await spool_upload(
+                file, file_ext,
+                max_bytes=config.MAX_UPLOAD_BYTES,
+                chunk_size=config.UPLOAD_CHUNK_SIZE,
+                spool_bytes=config.UPLOAD_SPOOL_BYTES
+            ) as upload:
+                data = upload.read()
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnsupportedContent as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        payload["filename"] = file.filename
+    elif resume_id:
+        get_resume_or_404(resume_id, with_raw_text=False)
+        payload["resume_id"] = resume_id
+    else:
+        raise HTTPException(status_code=400, detail="Provide a file or a resume_id")
+
+    try:
+        job = job_queue.submit("analysis", payload, data=data, priority=priority, max_retries=config.JOB_MAX_RETRIES)
+    except JobQueueFull:
+        raise HTTPException(status_code=429, detail="Too many analysis jobs are queued. Please retry shortly.")
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.id}",
+        "result_url": f"/api/jobs/{job.id}/result"
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Status, attempts and timing of a background job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.dict(exclude={"result"})
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Result of a completed job; 202 while it is still pending"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=f"Job failed: {job.error}")
+    if job.status != JobStatus.COMPLETED:
+        return JSONResponse(status_code=202, content={"job_id": job.id, "status": job.status.value})
+    return job.result
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Request and pipeline stage metrics in Prometheus text format"""
+    if not config.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
+
+def require_profiler(token: Optional[str]) -> SlowRequestProfiler:
+    if request_profiler is None:
+        raise HTTPException(status_code=404, detail="Slow-request profiling is disabled")
+    # Profiles expose internal file and function names: never serve them without a token
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints require ADMIN_TOKEN to be configured")
+    if not hmac.compare_digest((token or "").encode(), config.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    return request_profiler
+
+
+@app.get("/api/admin/profiles")
+async def list_profiles(x_admin_token: Optional[str] = Header(None)):
+    """Recent slow-request profiles, newest first"""
+    profiler = require_profiler(x_admin_token)
+    return {"profiles": profiler.list(), "stats": profiler.stats()}
+
+
+@app.get("/api/admin/profiles/{profile_id}")
+async def download_profile(profile_id: int, x_admin_token: Optional[str] = Header(None)):
+    """One profile as collapsed stacks (flamegraph.pl / speedscope input)"""
+    profile = require_profiler(x_admin_token).get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(
+        profile.folded(),
+        media_type="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'}
+    )
+
+
+@app.get("/api/cache-stats")
+async def cache_stats():
+    """Hit/miss counters for the server-side caches"""
+    return {"parse_cache": parse_cache.stats(), "analysis_cache": analysis_cache.stats()}
+
+
 @app.post("/api/profile")
 async def save_profile(profile: ProfileInput):
     """Save user profile data"""
     profile_id = str(uuid.uuid4())
-    profiles_store[profile_id] = profile
+    resume_store.put_profile(profile_id, profile)
     return {"success": True, "profile_id": profile_id, "profile": profile.dict()}
 
 
 @app.get("/api/resume/{resume_id}")
 async def get_resume(resume_id: str):
     """Get parsed resume data"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
-    return resumes_store[resume_id].dict()
+    return JSONBytesResponse(json_bytes(get_resume_or_404(resume_id)))
 
 
 @app.get("/api/analyze/{resume_id}")
 async def analyze(resume_id: str):
     """Analyze resume quality and structure"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    resume = resumes_store[resume_id]
-    analysis = analyze_resume(resume)
-    return analysis.dict()
+    resume = get_resume_or_404(resume_id)
+    return JSONBytesResponse(analysis_cache.analysis_json(resume))
 
 
 @app.get("/api/skill-gaps/{resume_id}")
 async def get_skill_gaps(resume_id: str, target_role: Optional[str] = None):
     """Detect skill gaps for target role"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    resume = resumes_store[resume_id]
-    gaps = detect_skill_gaps(resume, target_role or "")
-    return {"gaps": [g.dict() for g in gaps], "total": len(gaps)}
+    resume = get_resume_or_404(resume_id)
+    gaps = analysis_cache.skill_gaps(resume, target_role or "")
+    return JSONBytesResponse(json_object(
+        gaps=analysis_cache.skill_gaps_json(resume, target_role or ""),
+        total=json_bytes(len(gaps))
+    ))
 
 
 @app.get("/api/career-paths/{resume_id}")
 async def get_career_paths(resume_id: str):
     """Get matched career paths"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    resume = resumes_store[resume_id]
-    paths = match_career_paths(resume)
-    return {"paths": [p.dict() for p in paths]}
+    resume = get_resume_or_404(resume_id)
+    return JSONBytesResponse(json_object(paths=analysis_cache.career_paths_json(resume)))
 
 
 @app.get("/api/learning-roadmap/{resume_id}")
 async def get_learning_roadmap(resume_id: str, target_career: Optional[str] = None):
     """Generate personalized learning roadmap"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    resume = get_resume_or_404(resume_id)
+    return JSONBytesResponse(analysis_cache.roadmap_json(resume, target_career or ""))
+
+
+def chat_resume(request: ChatRequest) -> Optional[ResumeData]:
+    if not request.resume_id:
+        return None
+    # The mentor works from structured fields, so skip loading raw_text
+    return resume_store.get(request.resume_id, with_raw_text=False)
 
-    resume = resumes_store[resume_id]
-    roadmap = generate_learning_roadmap(resume, target_career or "")
-    return roadmap.dict()
+
+def sse_event(data: dict, event: Optional[str] = None) -> str:
+    """Format one Server-Sent Event; JSON keeps multi-line markdown on one data line"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
 
 
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
     """Interactive AI mentorship chat"""
-    resume_data = None
-    if request.resume_id and request.resume_id in resumes_store:
-        resume_data = resumes_store[request.resume_id]
+    resume_data = chat_resume(request)
 
-    response = ai_mentor.generate_response(
+    # Conversations without a session id start a new one the client can reuse
+    session_id = request.session_id or str(uuid.uuid4())
+    response = await ai_mentor.generate_response_async(
         user_message=request.message,
         resume_data=resume_data,
-        context=request.context or ""
+        context=request.context or "",
+        session_id=session_id
     )
 
     return {
         "response": response,
+        "session_id": session_id,
         "timestamp": ChatMessage(role="assistant", content=response).timestamp
     }
 
 
-@app.get("/api/dashboard/{resume_id}")
-async def get_dashboard(resume_id: str):
-    """Get complete dashboard data"""
-    if resume_id not in resumes_store:
-        raise HTTPException(status_code=404, detail="Resume not found")
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """Interactive AI mentorship chat, streamed incrementally as Server-Sent Events"""
+    resume_data = chat_resume(request)
+    session_id = request.session_id or str(uuid.uuid4())
+
+    async def events():
+        yield sse_event({"session_id": session_id}, event="start")
+        chunks = ai_mentor.stream_response(
+            user_message=request.message,
+            resume_data=resume_data,
+            context=request.context or "",
+            session_id=session_id
+        )
+        try:
+            async for chunk in chunks:
+                if await http_request.is_disconnected():
+                    break
+                yield sse_event({"delta": chunk})
+            else:
+                yield sse_event({"timestamp": ChatMessage(role="assistant", content="").timestamp}, event="done")
+        finally:
+            # Stop generation promptly on disconnect/cancellation
+            await chunks.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-    resume = resumes_store[resume_id]
-    analysis = analyze_resume(resume)
-    gaps = detect_skill_gaps(resume)
-    paths = match_career_paths(resume)
-    roadmap = generate_learning_roadmap(resume)
 
+@app.get("/api/chat/stats")
+async def chat_stats():
+    """Session memory usage and intent classification cost"""
     return {
-        "resume": resume.dict(),
-        "analysis": analysis.dict(),
-        "skill_gaps": [g.dict() for g in gaps],
-        "career_paths": [p.dict() for p in paths],
-        "learning_roadmap": roadmap.dict()
+        "sessions": ai_mentor.memory.stats(),
+        "intent_router": ai_mentor.router.stats(),
+        "llm_backend": ai_mentor.backend.stats(),
+        "response_cache": ai_mentor.response_cache.stats() if ai_mentor.response_cache else None,
+        "template_fragments": ai_mentor.fragments.stats()
     }
 
 
+@app.get("/api/chat/{session_id}/history")
+async def get_chat_history(session_id: str):
+    """Recent messages of a chat session"""
+    return {"session_id": session_id, "messages": [m.dict() for m in ai_mentor.memory.history(session_id)]}
+
+
+@app.delete("/api/chat/{session_id}")
+async def clear_chat_session(session_id: str):
+    """Forget a chat session's history"""
+    ai_mentor.memory.clear(session_id)
+    return {"success": True}
+
+
+@app.get("/api/dashboard/{resume_id}")
+async def get_dashboard(resume_id: str):
+    """Get complete dashboard data"""
+    resume = get_resume_or_404(resume_id)
+    with metrics.span("serialize"):
+        body = dashboard_json(resume)
+    return JSONBytesResponse(body)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,386 @@
+"""
+Mentor Templates - Precompiled advice templates for the AI mentor
+Each template is split once, at import, into static text runs and named slots,
+so rendering is a single join. Per-resume fragments (name, top skills, the
+skill-specific blocks) are built once per resume and shared by every intent.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from models import ResumeData
+
+
+class AdviceTemplate:
+    """Text with {slot} placeholders, pre-split into static runs"""
+
+    _SLOT = re.compile(r'\{(\w+)\}')
+
+    def __init__(self, source: str):
+        parts = self._SLOT.split(source)
+        self._static = parts[0::2]
+        self.slots = tuple(parts[1::2])
+
+    def render(self, **values: str) -> str:
+        pieces = [self._static[0]]
+        for slot, text in zip(self.slots, self._static[1:]):
+            pieces.append(values[slot])
+            pieces.append(text)
+        return "".join(pieces)
+
+
+GREETING_SKILLS = AdviceTemplate("\n\nI can see from your profile that you have experience with **{top_skills}**. That's a great foundation!")
+
+GREETING = AdviceTemplate("""👋 **Hello {name}! Welcome to CareerMentor AI!**
+
+I'm your personal AI career advisor, here to help you navigate your professional journey. {skills_block}
+
+Here's what I can help you with:
+
+🎯 **Career Strategy** — Explore career paths, plan transitions, and set goals
+📄 **Resume Optimization** — Get actionable feedback to improve your resume
+🎓 **Skill Development** — Personalized learning recommendations
+💼 **Interview Prep** — Practice questions and strategies for your target roles
+💰 **Salary Insights** — Compensation benchmarks and negotiation tips
+🚀 **Project Ideas** — Portfolio projects to showcase your abilities
+
+**What would you like to focus on today?** Just ask me anything about your career!""")
+
+RESUME_ADVICE_GENERIC = """📄 **Resume Improvement Tips**
+
+I'd love to help you optimize your resume! Here are some universal best practices:
+
+1. **Use a clean, ATS-friendly format** — Simple layouts with standard headings
+2. **Lead with action verbs** — "Developed", "Architected", "Optimized", "Led"
+3. **Quantify achievements** — "Increased performance by 40%" beats "Improved performance"
+4. **Tailor for each role** — Match keywords from the job description
+5. **Keep it concise** — 1-2 pages max, prioritize recent experience
+
+💡 **Upload your resume** for a personalized analysis with specific recommendations!"""
+
+RESUME_ADVICE = AdviceTemplate("""📄 **Personalized Resume Analysis for {name}**
+
+Based on my review of your resume, here are my recommendations:
+
+**✅ What's Working:**
+- You have **{skill_count} technical skills** identified, including: {top_skills_long}
+- Your experience section covers {experience_count} role(s)
+
+**🔧 Key Improvements:**
+
+1. **Strengthen Your Summary** — Write a compelling 2-3 line professional summary that highlights your unique value proposition and target role
+   
+2. **Quantify Your Impact** — Transform descriptions like "worked on projects" to "Led a team of 4 to deliver a microservices platform serving 10K+ users"
+
+3. **Optimize for ATS** — Ensure your skills section includes exact keywords from target job descriptions
+
+4. **Add Projects Section** — Include 2-3 standout projects with:
+   - Problem you solved
+   - Technologies used
+   - Measurable outcomes
+
+5. **Professional Formatting** — Use consistent formatting, clear section headers, and bullet points
+
+Would you like me to help you craft a better summary, or dive deeper into any of these areas?""")
+
+INTERVIEW_SKILLS = AdviceTemplate("""
+**🎯 Based on your skills ({top_skills}), prepare for:**
+
+- **Technical Deep Dives:** Be ready to explain your experience with each technology in detail
+- **System Design:** Practice designing systems using your tech stack
+- **Coding Challenges:** Focus on data structures, algorithms, and {first_skill}""")
+
+INTERVIEW_ADVICE = AdviceTemplate("""🎤 **Interview Preparation Guide**
+
+Here's a comprehensive prep strategy:
+
+**📋 Common Behavioral Questions (STAR Method):**
+- "Tell me about a challenging project you led"
+- "Describe a time you had to learn a new technology quickly"  
+- "How do you handle disagreements with team members?"
+- "What's your biggest professional achievement?"
+{skills_block}
+
+**💡 Preparation Checklist:**
+1. ✅ Research the company's tech stack, culture, and recent news
+2. ✅ Prepare 5-7 STAR-format stories from your experience
+3. ✅ Practice with mock interviews (use platforms like Pramp or interviewing.io)
+4. ✅ Prepare thoughtful questions to ask the interviewer
+5. ✅ Review your resume and be ready to discuss every point
+
+**🏆 Pro Tips:**
+- Start answers with the impact/result, then explain how
+- Show enthusiasm for the role and company
+- Ask about team culture, growth opportunities, and expectations
+
+What specific type of interview would you like to prepare for?""")
+
+SALARY_ADVICE = """💰 **Salary & Compensation Guide**
+
+**📊 Negotiation Framework:**
+
+1. **Research Phase:**
+   - Use Levels.fyi, Glassdoor, and Blind for comp data
+   - Filter by role, experience level, location, and company size
+   - Understand total compensation (base + bonus + equity)
+
+2. **Preparation:**
+   - Know your minimum acceptable number
+   - Prepare your value proposition with quantified achievements
+   - Research the company's compensation philosophy
+
+3. **Negotiation Tactics:**
+   - Never give the first number if possible
+   - Use competing offers as leverage (professionally)
+   - Negotiate the entire package (PTO, remote work, signing bonus, equity)
+   - Always get offers in writing
+
+**💡 Key Phrases to Use:**
+- "Based on my research and experience, I'm targeting a range of..."
+- "I'm excited about this opportunity. Can we discuss the total compensation package?"
+- "I have other offers I'm considering, and I want to make sure we're aligned"
+
+**⚠️ Common Mistakes:**
+- Accepting the first offer without negotiating
+- Focusing only on base salary
+- Not considering cost of living differences
+- Being confrontational instead of collaborative
+
+Would you like role-specific salary benchmarks based on your profile?"""
+
+LEARNING_SKILLS = AdviceTemplate("""
+**📊 Based on your current skills ({top_skills}):**
+
+**Priority Learning Areas:**
+1. 🔴 **High Priority:** Advanced topics in your strongest skills + in-demand complementary technologies
+2. 🟡 **Medium Priority:** Industry certifications (AWS, Google Cloud, etc.)
+3. 🟢 **Growth Areas:** System design, architecture patterns, and soft skills""")
+
+LEARNING_ADVICE = AdviceTemplate("""🎓 **Personalized Learning Strategy**
+{skills_block}
+
+**🏗️ Recommended Learning Path:**
+
+**Month 1-2: Foundation**
+- Solidify fundamentals in your primary tech stack
+- Complete one certification course
+- Build one project demonstrating new skills
+
+**Month 3-4: Expansion**
+- Learn complementary technologies
+- Contribute to open-source projects
+- Start a technical blog or YouTube channel
+
+**Month 5-6: Mastery**
+- Build a capstone project
+- Get certified
+- Network at virtual/in-person meetups
+
+**📚 Top Learning Platforms:**
+- **Coursera/edX** — University-level courses with certificates
+- **Udemy** — Practical, project-based learning
+- **freeCodeCamp** — Free, comprehensive web development
+- **LeetCode/HackerRank** — Algorithm and coding practice
+- **YouTube** — Free tutorials from industry experts
+
+What specific skill would you like a detailed learning plan for?""")
+
+CAREER_SKILLS = AdviceTemplate('\n\nBased on your profile with skills in **{top_skills}**, you have several exciting career paths available!')
+
+CAREER_ADVICE = AdviceTemplate("""🎯 **Career Path Strategy**{skills_block}
+
+**🗺️ Career Planning Framework:**
+
+1. **Self-Assessment:**
+   - What problems do you love solving?
+   - Do you prefer depth (specialist) or breadth (generalist)?
+   - What's your ideal work environment?
+   - What are your non-negotiables? (remote, salary, culture)
+
+2. **Market Research:**
+   - Identify roles that align with your skills and interests
+   - Research growth trends and demand
+   - Connect with people in target roles (LinkedIn, meetups)
+
+3. **Gap Analysis:**
+   - Compare your current skills with target role requirements
+   - Identify 3-5 key skills to develop
+   - Create a 6-month learning plan
+
+4. **Strategic Positioning:**
+   - Build projects that demonstrate target role skills
+   - Create content (blogs, talks) in your target domain
+   - Optimize LinkedIn and resume for target roles
+
+**🔥 High-Growth Career Paths in 2025-2026:**
+- AI/ML Engineering (50%+ growth)
+- Cloud Architecture (28% growth)
+- Cybersecurity (32% growth)
+- Data Engineering (30% growth)
+- Full Stack Development (22% growth)
+
+Would you like me to do a detailed analysis of a specific career path for you?""")
+
+PROJECT_SKILLS = AdviceTemplate(' using your skills in {top_skills}')
+
+PROJECT_ADVICE = AdviceTemplate("""🚀 **Portfolio Project Ideas{name_suffix}**
+
+Here are impactful projects you can build{skills_block}:
+
+**🏆 Standout Portfolio Projects:**
+
+1. **AI-Powered Application** 
+   - Build a chatbot, recommendation system, or content generator
+   - Shows: AI/ML skills, API integration, full-stack ability
+
+2. **Real-Time Dashboard**
+   - Create a live data visualization platform
+   - Shows: Frontend skills, data processing, WebSockets
+
+3. **Microservices Platform**
+   - Build a scalable e-commerce or social platform
+   - Shows: System design, DevOps, backend architecture
+
+4. **Developer Tool/CLI**
+   - Build a tool that solves a real developer pain point
+   - Shows: Problem-solving, open-source contribution
+
+5. **Mobile/Cross-Platform App**
+   - Build a productivity or fitness tracking app
+   - Shows: Mobile development, UX design
+
+**💡 Project Best Practices:**
+- Write clean, well-documented code with README
+- Deploy to production (Vercel, AWS, Railway)
+- Include tests and CI/CD pipeline
+- Add a demo video or live preview
+
+Which project type interests you most? I can help you plan it!""")
+
+JOB_SEARCH_ADVICE = """🔍 **Job Search Strategy**
+
+**📋 Optimized Job Search Process:**
+
+1. **Preparation Phase (Week 1-2):**
+   - Polish resume and LinkedIn profile
+   - Prepare your portfolio/GitHub
+   - Set up job alerts on key platforms
+   - Research target companies
+
+2. **Active Search (Ongoing):**
+   - Apply to 5-10 targeted positions per week
+   - Customize resume for each application
+   - Write tailored cover letters for top choices
+   - Track all applications in a spreadsheet
+
+3. **Networking (Continuous):**
+   - Connect with recruiters in your target industry
+   - Attend virtual meetups and conferences
+   - Engage on Twitter/X and LinkedIn
+   - Ask for referrals from connections
+
+**🎯 Top Job Platforms:**
+- **LinkedIn** — Best for networking + job search
+- **Indeed** — Largest job board
+- **Wellfound** — Startup-focused
+- **Dice** — Tech-specific
+- **Company Websites** — Direct applications often prioritized
+
+**⚡ Pro Tips:**
+- Apply within the first 48 hours of a posting
+- Follow up after 1 week if no response
+- Keep a consistent daily job search routine
+- Don't neglect the "hidden job market" (networking referrals)
+
+Want me to help you create a targeted search strategy for a specific role?"""
+
+GENERAL_ADVICE = """🤖 **Great question!**
+
+I'd be happy to help with that. Here's my perspective:
+
+Based on current industry trends and best practices, here are some thoughts:
+
+**Key Considerations:**
+1. **Stay Current** — The tech industry evolves rapidly. Continuous learning is essential.
+2. **Build in Public** — Share your journey through blogs, social media, or open-source contributions.
+3. **Network Strategically** — Quality connections matter more than quantity.
+4. **Focus on Impact** — Employers value results over credentials.
+
+**I'm most helpful when you ask me about:**
+- 📄 Resume reviews and optimization
+- 🎯 Career path exploration
+- 🎓 Skill development strategies
+- 🎤 Interview preparation
+- 💰 Salary negotiation
+- 🚀 Project recommendations
+- 🔍 Job search strategies
+
+Feel free to ask me anything specific about your career goals! The more context you provide, the better advice I can give."""
+
+
+class ResumeFragments:
+    """Resume-specific pieces of the advice templates, computed once"""
+
+    __slots__ = ("name", "resume_name", "project_name", "skill_count", "experience_count",
+                 "top_skills", "top_skills_long", "greeting_skills", "interview_skills",
+                 "learning_skills", "career_skills", "project_skills")
+
+    def __init__(self, resume_data: Optional[ResumeData]):
+        name = resume_data.name if resume_data else ""
+        skills = [s.name for s in resume_data.skills[:8]] if resume_data else []
+        top_skills = ", ".join(skills[:5])
+        self.name = name or "there"
+        self.resume_name = name or "You"
+        self.project_name = f" ({name})" if name else ""
+        self.skill_count = str(len(resume_data.skills)) if resume_data else "0"
+        self.experience_count = str(len(resume_data.experience)) if resume_data else "0"
+        self.top_skills = top_skills
+        self.top_skills_long = ", ".join(skills)
+        if skills:
+            self.greeting_skills = GREETING_SKILLS.render(top_skills=top_skills)
+            self.interview_skills = INTERVIEW_SKILLS.render(top_skills=top_skills, first_skill=skills[0])
+            self.learning_skills = LEARNING_SKILLS.render(top_skills=top_skills)
+            self.career_skills = CAREER_SKILLS.render(top_skills=top_skills)
+            self.project_skills = PROJECT_SKILLS.render(top_skills=top_skills)
+        else:
+            self.greeting_skills = self.interview_skills = self.learning_skills = ""
+            self.career_skills = self.project_skills = ""
+
+
+NO_RESUME = ResumeFragments(None)
+
+
+class FragmentCache:
+    """Bounded LRU of ResumeFragments by resume id (resumes are immutable once stored)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max(max_entries, 1)
+        self._entries: "OrderedDict[str, ResumeFragments]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, resume_data: Optional[ResumeData]) -> ResumeFragments:
+        if resume_data is None:
+            return NO_RESUME
+        with self._lock:
+            fragments = self._entries.get(resume_data.id)
+            if fragments is not None:
+                self._entries.move_to_end(resume_data.id)
+                self.hits += 1
+                return fragments
+            self.misses += 1
+        fragments = ResumeFragments(resume_data)
+        with self._lock:
+            self._entries[resume_data.id] = fragments
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fragments
+
+    def invalidate(self, resume_id: str):
+        with self._lock:
+            self._entries.pop(resume_id, None)
+
+    def stats(self) -> Dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
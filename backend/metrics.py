@@ -0,0 +1,264 @@
+"""
+Metrics - Request timing, pipeline stage spans and a Prometheus text exporter
+An ASGI middleware records per-route latency histograms, the in-flight count and
+request/response sizes; pipeline stages (extraction, skills, analysis, gaps,
+career matching, roadmap, chat intent) record spans that feed a stage histogram
+and the request's Server-Timing header. With METRICS_ENABLED=0 the middleware
+is not installed and ``timed``/``span`` return the plain function / a no-op.
+"""
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import config
+
+ENABLED = config.METRICS_ENABLED
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# (stage, seconds) spans of the request being handled, None outside a request
+_request_spans: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "request_spans", default=None
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        rows, running = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            rows.append((f"{bound:g}", running))
+        rows.append(("+Inf", self.count))
+        return rows
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Request and stage metrics of this process, rendered in Prometheus text format"""
+
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+                 size_buckets: Sequence[float] = SIZE_BUCKETS):
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self._lock = threading.Lock()
+        # (method, route, status class) -> latency
+        self._latency: Dict[Tuple[str, str, str], Histogram] = {}
+        # (method, route) -> payload sizes
+        self._request_size: Dict[Tuple[str, str], Histogram] = {}
+        self._response_size: Dict[Tuple[str, str], Histogram] = {}
+        self._in_flight = 0
+        self._stages: Dict[str, Histogram] = {}
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, method: str, route: str, status: int, seconds: float,
+                         request_bytes: int, response_bytes: int):
+        status_class = f"{status // 100}xx"
+        key = (method, route)
+        with self._lock:
+            self._in_flight -= 1
+            histogram = self._latency.get(key + (status_class,))
+            if histogram is None:
+                histogram = self._latency[key + (status_class,)] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+            for sizes, value in ((self._request_size, request_bytes), (self._response_size, response_bytes)):
+                histogram = sizes.get(key)
+                if histogram is None:
+                    histogram = sizes[key] = Histogram(self.size_buckets)
+                histogram.observe(value)
+
+    def observe_stage(self, stage: str, seconds: float):
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            self._render_histograms(lines, "http_request_duration_seconds", "Request latency by route",
+                                    ("method", "route", "status"), self._latency)
+            lines.append("# HELP http_requests_in_flight Requests currently being handled")
+            lines.append("# TYPE http_requests_in_flight gauge")
+            lines.append(f"http_requests_in_flight {self._in_flight}")
+            self._render_histograms(lines, "http_request_size_bytes", "Request body size by route",
+                                    ("method", "route"), self._request_size)
+            self._render_histograms(lines, "http_response_size_bytes", "Response body size by route",
+                                    ("method", "route"), self._response_size)
+            self._render_histograms(lines, "pipeline_stage_duration_seconds", "Time spent in pipeline stages",
+                                    ("stage",), {(stage,): h for stage, h in self._stages.items()})
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(lines: List[str], name: str, help_text: str, label_names: Sequence[str],
+                           histograms: Dict[Tuple, Histogram]):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for values, histogram in sorted(histograms.items()):
+            for bound, count in histogram.cumulative():
+                bucket_labels = _labels(label_names, values, 'le="%s"' % bound)
+                lines.append(f"{name}_bucket{bucket_labels} {count}")
+            lines.append(f"{name}_sum{_labels(label_names, values)} {histogram.sum:.6g}")
+            lines.append(f"{name}_count{_labels(label_names, values)} {histogram.count}")
+
+
+registry = MetricsRegistry()
+
+
+class _Span:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record_span(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+_NO_SPAN = nullcontext()
+
+
+def record_span(stage: str, seconds: float):
+    registry.observe_stage(stage, seconds)
+    spans = _request_spans.get()
+    if spans is not None:
+        spans.append((stage, seconds))
+
+
+def span(stage: str):
+    """Context manager timing one pipeline stage (a shared no-op when metrics are off)"""
+    return _Span(stage) if ENABLED else _NO_SPAN
+
+
+def timed(stage: str) -> Callable[[Callable], Callable]:
+    """Decorator form of ``span``; returns the function unchanged when metrics are off"""
+    def decorate(fn: Callable) -> Callable:
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_span(stage, time.perf_counter() - start)
+
+        return wrapper
+    return decorate
+
+
+def server_timing(spans: List[Tuple[str, float]], total: float) -> str:
+    """Server-Timing header value: spans summed per stage in first-seen order, then the total"""
+    durations: Dict[str, float] = {}
+    for stage, seconds in spans:
+        durations[stage] = durations.get(stage, 0.0) + seconds
+    parts = [f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in durations.items()]
+    parts.append(f"app;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware buffering) feeding a MetricsRegistry
+
+    Routes are labelled by their path template, looked up from the endpoint the
+    router resolved; unknown paths share one label so cardinality stays bounded. The Server-Timing header covers spans finished
+    before the response starts, so a streamed body's own time is not in it.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry, routes: Sequence = (),
+                 server_timing_header: bool = True):
+        self.app = app
+        self.registry = registry
+        self.routes = routes
+        self.server_timing_header = server_timing_header
+        self._paths: Dict[Callable, str] = {}
+
+    def route_label(self, scope) -> str:
+        # The router stores the matched endpoint in the (shared) scope
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._paths.get(endpoint)
+        if path is None:
+            # Routes can be added after the middleware; rebuild on a miss
+            self._paths = {route.endpoint: route.path for route in self.routes if hasattr(route, "endpoint")}
+            path = self._paths.get(endpoint, "unmatched")
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans: List[Tuple[str, float]] = []
+        token = _request_spans.set(spans)
+        start = time.perf_counter()
+        sizes = [0, 0]
+        status = 500
+
+        async def counting_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes[0] += len(message.get("body", b""))
+            return message
+
+        async def timing_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing_header:
+                    header = server_timing(spans, time.perf_counter() - start)
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header.encode())]
+            elif message["type"] == "http.response.body":
+                sizes[1] += len(message.get("body", b""))
+            await send(message)
+
+        self.registry.request_started()
+        try:
+            await self.app(scope, counting_receive, timing_send)
+        finally:
+            _request_spans.reset(token)
+            self.registry.request_finished(scope["method"], self.route_label(scope), status,
+                                           time.perf_counter() - start, sizes[0], sizes[1])
@@ -45,6 +45,8 @@ class ResumeData(BaseModel):
     skills: List[Skill] = []
     experience: List[Experience] = []
     education: List[Education] = []
+    # Section headings found when the resume was parsed (canonical names, document order)
+    sections: List[str] = []
     raw_text: str = ""
     uploaded_at: str = Field(default_factory=lambda: datetime.now().isoformat())
 
@@ -106,6 +108,7 @@ class ChatRequest(BaseModel):
     message: str
     resume_id: Optional[str] = None
     context: Optional[str] = None
+    session_id: Optional[str] = None
 
 
 class ProfileInput(BaseModel):
@@ -116,3 +119,26 @@ class ProfileInput(BaseModel):
     current_role: str = ""
     interests: List[str] = []
     preferred_industry: str = ""
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    RETRYING = "retrying"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AnalysisJob(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: str
+    status: JobStatus = JobStatus.QUEUED
+    priority: int = 0
+    attempts: int = 0
+    max_retries: int = 2
+    payload: Dict = {}
+    result: Optional[Dict] = None
+    error: str = ""
+    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
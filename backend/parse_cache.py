@@ -0,0 +1,70 @@
+"""
+Parse Cache - Deduplicates repeat uploads by content hash
+Maps a BLAKE2 digest of the uploaded bytes (salted with the parser version and
+the file extension, which selects the text extractor) to the resume that was
+parsed from them, so identical files are only parsed once
+"""
+import hashlib
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Dict, Optional
+
+from models import ResumeData
+from resume_parser import PARSER_VERSION
+
+
+def content_hasher(file_ext: str):
+    """Incremental hasher for upload bytes; parser version and extension are part of the key
+
+    The same bytes named .pdf and .txt go through different extractors, so they
+    must not share a cached parse.
+    """
+    hasher = hashlib.blake2b(PARSER_VERSION.encode(), digest_size=20)
+    hasher.update(file_ext.lower().encode() + b"\0")
+    return hasher
+
+
+def stream_digest(stream: BinaryIO, file_ext: str, chunk_size: int = 64 * 1024) -> str:
+    """Digest of an already-spooled file, read in chunks from the start"""
+    hasher = content_hasher(file_ext)
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        hasher.update(chunk)
+    stream.seek(0)
+    return hasher.hexdigest()
+
+
+class ParseCache:
+    """Bounded LRU map of content digest -> resume id, with hit/miss counters"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(max_entries, 1)
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str, resolve: Callable[[str], Optional[ResumeData]]) -> Optional[ResumeData]:
+        """Return the resume previously parsed from this content, if still stored"""
+        resume_id = self._entries.get(digest)
+        resume = resolve(resume_id) if resume_id else None
+        if resume is None:
+            self._entries.pop(digest, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return resume
+
+    def put(self, digest: str, resume_id: str):
+        self._entries[digest] = resume_id
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,248 @@
+"""
+Request Profiler - Opt-in stack sampling for slow requests
+While requests are in flight a daemon thread samples every thread's Python
+stack at a fixed interval into a short timeline. When a request finishes over
+the latency threshold, the samples taken during it (plus any sent back by the
+extraction worker processes) are folded into a flame-graph profile and kept in
+a ring buffer; faster requests cost nothing beyond the sampling itself.
+Profiles use the collapsed-stack format ("frame;frame;frame count") that
+flamegraph.pl and speedscope read.
+"""
+import contextvars
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+# (file, function) leaves of threads that are waiting, not working
+IDLE_LEAVES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("thread.py", "_worker"),
+    ("queue.py", "get"),
+}
+MAX_STACK_DEPTH = 64
+
+_labels: Dict[object, str] = {}
+
+# Worker-process samples returned to the request being handled
+_request_samples: contextvars.ContextVar[Optional[Counter]] = contextvars.ContextVar(
+    "request_samples", default=None
+)
+
+
+def _frame_label(code) -> str:
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+    return label
+
+
+def folded_stack(frame) -> Optional[str]:
+    """Root-to-leaf "file:function" frames joined with ';', None for an idle thread"""
+    code = frame.f_code
+    if (os.path.basename(code.co_filename), code.co_name) in IDLE_LEAVES:
+        return None
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """Samples the stacks of this process's busy threads until stopped (used in extraction workers)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            # Includes the PDF page threads the extraction fans out to
+            for thread_id, frame in sys._current_frames().items():
+                stack = folded_stack(frame) if thread_id != own else None
+                if stack:
+                    self.samples[stack] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+def profiled_parse_resume(source, filename: str, interval: float) -> Tuple[object, Dict[str, int]]:
+    """parse_resume plus the stack samples taken while it ran (extraction worker entry point)"""
+    from resume_parser import parse_resume
+    with StackSampler(interval) as sampler:
+        resume = parse_resume(source, filename)
+    return resume, dict(sampler.samples)
+
+
+def attach_samples(samples: Dict[str, int], root: str = "extraction-worker"):
+    """Add samples taken elsewhere (a worker process) to the current request's profile"""
+    collected = _request_samples.get()
+    if collected is not None:
+        for stack, count in samples.items():
+            collected[f"{root};{stack}"] += count
+
+
+class SlowProfile:
+    """Folded stack samples of one slow request"""
+
+    __slots__ = ("id", "method", "path", "seconds", "started_at", "samples")
+
+    def __init__(self, profile_id: int, method: str, path: str, seconds: float, started_at: float,
+                 samples: Counter):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.seconds = seconds
+        self.started_at = started_at
+        self.samples = samples
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "ms": round(self.seconds * 1000, 1),
+            "started_at": self.started_at,
+            "samples": sum(self.samples.values()),
+        }
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class SlowRequestProfiler:
+    """Samples stacks while requests run and keeps profiles of those over the threshold
+
+    Samples cannot be attributed to one coroutine, so a slow request's profile
+    also holds whatever ran concurrently on the event loop or worker threads.
+    """
+
+    def __init__(self, threshold: float, interval: float = 0.01, max_profiles: int = 20,
+                 max_samples: int = 50000):
+        self.threshold = threshold
+        self.interval = interval
+        self.max_samples = max_samples
+        self.profiles: Deque[SlowProfile] = deque(maxlen=max(max_profiles, 1))
+        # (monotonic time, folded stack) for every busy thread at every tick
+        self._timeline: Deque[Tuple[float, str]] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._ids = itertools.count(1)
+        self.requests = 0
+
+    def _run(self):
+        own = threading.get_ident()
+        while True:
+            self._active.wait()
+            now = time.monotonic()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = folded_stack(frame)
+                if stack:
+                    self._timeline.append((now, stack))
+            time.sleep(self.interval)
+
+    def begin(self) -> Tuple[float, contextvars.Token]:
+        with self._lock:
+            if self._thread is None:
+                # Started lazily, after any worker processes have been forked
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+            self._in_flight += 1
+            self._active.set()
+        return time.monotonic(), _request_samples.set(Counter())
+
+    def release(self) -> float:
+        """Leave the sampled window (the sampler idles once no request is in it); returns the time"""
+        with self._lock:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._active.clear()
+        return time.monotonic()
+
+    def end(self, token: Tuple[float, contextvars.Token], method: str, path: str,
+            released_at: Optional[float] = None) -> Optional[SlowProfile]:
+        """Close a request's window; pass released_at if release() was already called for it"""
+        start, samples_token = token
+        end = self.release() if released_at is None else released_at
+        worker_samples = _request_samples.get()
+        _request_samples.reset(samples_token)
+        with self._lock:
+            self.requests += 1
+        if end - start < self.threshold:
+            return None
+
+        samples = Counter(stack for at, stack in list(self._timeline) if start <= at <= end)
+        samples.update(worker_samples)
+        profile = SlowProfile(next(self._ids), method, path, end - start, time.time() - (end - start), samples)
+        with self._lock:
+            self.profiles.append(profile)
+        return profile
+
+    def get(self, profile_id: int) -> Optional[SlowProfile]:
+        with self._lock:
+            return next((p for p in self.profiles if p.id == profile_id), None)
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            return [profile.summary() for profile in reversed(self.profiles)]
+
+    def stats(self) -> Dict:
+        return {
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "interval_ms": round(self.interval * 1000, 1),
+            "requests": self.requests,
+            "profiles": len(self.profiles),
+            "timeline_samples": len(self._timeline),
+        }
+
+
+class ProfilerMiddleware:
+    """Pure ASGI middleware wrapping each HTTP request in a profiler window
+
+    The window closes when the response starts: a streamed body (SSE, NDJSON)
+    can stay open for minutes and would otherwise keep the sampler running and
+    fill the ring buffer with idle streams.
+    """
+
+    def __init__(self, app, profiler: SlowRequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = self.profiler.begin()
+        released_at = None
+
+        async def send_and_release(message):
+            nonlocal released_at
+            if message["type"] == "http.response.start" and released_at is None:
+                released_at = self.profiler.release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            self.profiler.end(token, scope["method"], scope["path"], released_at)
@@ -0,0 +1,143 @@
+"""
+Response Cache - Semantic cache for mentor chat responses
+Responses are keyed by normalized message + intent + a fingerprint of the resume
+fields the answer depends on. Besides exact hits, near-duplicate prompts can be
+served by a nearest-neighbour lookup over hashed character n-gram vectors.
+"""
+import hashlib
+import math
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from models import ResumeData
+
+
+_NON_WORD = re.compile(r'[^a-z0-9+#\s]+')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return _SPACES.sub(' ', _NON_WORD.sub(' ', message.lower())).strip()
+
+
+def resume_fingerprint(resume_data: Optional[ResumeData], context: str = "") -> str:
+    """Stable digest of everything a templated answer reads from the resume"""
+    if resume_data is None and not context:
+        return ""
+    parts = [normalize_message(context)]
+    if resume_data is not None:
+        parts.append(resume_data.name)
+        parts.append(f"{len(resume_data.skills)}/{len(resume_data.experience)}")
+        parts.extend(f"{s.name}:{s.level.value}" for s in resume_data.skills[:8])
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=12).hexdigest()
+
+
+def ngram_vector(text: str, n: int = 3, dims: int = 1024) -> Dict[int, float]:
+    """L2-normalized hashed character n-gram counts (sparse)"""
+    padded = f" {text} "
+    counts: Dict[int, float] = {}
+    for i in range(max(len(padded) - n + 1, 1)):
+        bucket = zlib.crc32(padded[i:i + n].encode()) % dims
+        counts[bucket] = counts.get(bucket, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in counts.values())) or 1.0
+    return {k: v / norm for k, v in counts.items()}
+
+
+def cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+class ResponseCache:
+    """LRU + TTL response cache with optional near-duplicate matching"""
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 3600,
+                 similarity_threshold: float = 0.9, ngram: int = 3, dims: int = 1024):
+        self.max_entries = max(max_entries, 1)
+        self.ttl_seconds = ttl_seconds
+        # 0 disables the nearest-neighbour lookup
+        self.similarity_threshold = similarity_threshold
+        self.ngram = ngram
+        self.dims = dims
+        # (intent, fingerprint, normalized message) -> (response, vector, stored at)
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[str, Dict[int, float], float]]" = OrderedDict()
+        # Near-duplicate candidates only come from the same intent and resume
+        self._buckets: Dict[Tuple[str, str], Set[str]] = {}
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def get(self, message: str, intent: Optional[str], fingerprint: str) -> Optional[str]:
+        normalized = normalize_message(message)
+        bucket = (intent or "", fingerprint)
+        now = time.monotonic()
+        with self._lock:
+            key = bucket + (normalized,)
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry, now):
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                return entry[0]
+            if entry is not None:
+                self._discard(key)
+
+            if self.similarity_threshold > 0 and self._buckets.get(bucket):
+                vector = ngram_vector(normalized, self.ngram, self.dims)
+                best_key, best_score = None, self.similarity_threshold
+                for candidate in list(self._buckets[bucket]):
+                    candidate_key = bucket + (candidate,)
+                    candidate_entry = self._entries[candidate_key]
+                    if self._expired(candidate_entry, now):
+                        self._discard(candidate_key)
+                        continue
+                    score = cosine(vector, candidate_entry[1])
+                    if score >= best_score:
+                        best_key, best_score = candidate_key, score
+                if best_key is not None:
+                    self._entries.move_to_end(best_key)
+                    self.near_hits += 1
+                    return self._entries[best_key][0]
+
+            self.misses += 1
+            return None
+
+    def put(self, message: str, intent: Optional[str], fingerprint: str, response: str):
+        normalized = normalize_message(message)
+        bucket = (intent or "", fingerprint)
+        key = bucket + (normalized,)
+        vector = ngram_vector(normalized, self.ngram, self.dims) if self.similarity_threshold > 0 else {}
+        with self._lock:
+            self._entries[key] = (response, vector, time.monotonic())
+            self._entries.move_to_end(key)
+            self._buckets.setdefault(bucket, set()).add(normalized)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def _expired(self, entry, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - entry[2] > self.ttl_seconds
+
+    def _discard(self, key: Tuple[str, str, str]):
+        self._entries.pop(key, None)
+        bucket = self._buckets.get(key[:2])
+        if bucket is not None:
+            bucket.discard(key[2])
+            if not bucket:
+                del self._buckets[key[:2]]
+
+    def stats(self) -> Dict:
+        hits = self.exact_hits + self.near_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0
+        }
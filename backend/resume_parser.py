@@ -1,10 +1,20 @@
 """
 Resume Parser - Extracts structured data from uploaded resume files
 """
+import io
+import itertools
 import re
-from typing import Optional
+import time
+from typing import BinaryIO, Optional, Union
 from models import ResumeData, Skill, Experience, Education, SkillLevel
+from skill_matcher import SkillMatcher, scan_keywords
+from pdf_extractor import extract_pdf_pages
+from resume_sections import Sections, leading_lines, segment_sections
+from metrics import timed
+import config
 
+# Bump whenever extraction output changes so cached parses are not reused
+PARSER_VERSION = "5"
 
 # Common tech skills database for recognition
 SKILL_DATABASE = {
@@ -17,28 +27,96 @@ SKILL_DATABASE = {
     "soft_skills": ["leadership", "communication", "teamwork", "problem solving", "project management", "mentoring", "presentation", "analytical", "critical thinking", "time management"]
 }
 
-
-def extract_text_from_pdf(file_bytes: bytes) -> str:
-    """Extract text from PDF file bytes"""
-    try:
-        from PyPDF2 import PdfReader
-        import io
-        reader = PdfReader(io.BytesIO(file_bytes))
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        print(f"PDF extraction error: {e}")
-        return ""
-
-
-def extract_text_from_docx(file_bytes: bytes) -> str:
-    """Extract text from DOCX file bytes"""
+SKILL_MATCHER = SkillMatcher(SKILL_DATABASE)
+
+# Context words that hint at proficiency, matched as plain substrings
+LEVEL_KEYWORDS_PATTERN = re.compile(
+    r'(?P<advanced>expert|advanced|extensive|deep|senior|lead|proficient|strong|experienced)'
+    r'|(?P<beginner>basic|fundamental|beginner|learning|familiar)'
+)
+SKILL_CONTEXT_WINDOW = 100
+
+# Field patterns, compiled once. Every repetition is bounded and matches can only
+# start at a token boundary, so scans stay linear on long or adversarial input.
+EMAIL_PATTERN = re.compile(
+    r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]{1,64}@(?:[a-zA-Z0-9-]{1,63}\.){1,8}[a-zA-Z]{2,24}'
+)
+# Starts only on a possible first character and not inside a digit run, so
+# failing positions (long text without numbers, digit runs) are rejected at once
+PHONE_PATTERN = re.compile(r'(?=[+(0-9])(?<![0-9])\+?\(?[0-9]{1,4}\)?[-\s./0-9]{7,15}')
+NAME_EXCLUDE_PATTERN = re.compile(r'@|http|www|phone|email|address|resume|cv|curriculum')
+ROLE_SUFFIX_PATTERN = re.compile(
+    r'Engineer|Developer|Manager|Analyst|Designer|Lead|Director|Architect|Consultant|Specialist|Intern|Associate'
+)
+# Title on one line, company until a year or the end of the (next) line
+ROLE_PATTERN = re.compile(
+    r'(?<![A-Za-z])([A-Z][a-zA-Z \t]{1,60}(?:' + ROLE_SUFFIX_PATTERN.pattern + r'))'
+    r'[ \t]*(?:at|@|-|–|,|\|)?\s{0,4}([A-Za-z\s&.]{1,80}?)(?:\d{4}|\n)'
+)
+DEGREE_PATTERN = re.compile(
+    r"\b((?:Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?Tech|M\.?Tech|B\.?E\.?|M\.?E\.?|MBA|B\.?A\.?|M\.?A\.?|Associate|Diploma)[^,\n]*)",
+    re.IGNORECASE
+)
+# Role lines longer than this are descriptions, not "Title at Company" headers
+MAX_ROLE_LINE = 160
+# Fields are searched in newline-aligned chunks so the time budget is checked often
+SCAN_CHUNK = 64 * 1024
+
+
+class TimeBudget:
+    """Cooperative deadline for one extraction step; work stops once it is spent"""
+
+    def __init__(self, seconds: float):
+        self.deadline = time.perf_counter() + seconds if seconds > 0 else float("inf")
+
+    @property
+    def spent(self) -> bool:
+        return time.perf_counter() > self.deadline
+
+
+def _search(pattern: re.Pattern, text: str, budget: TimeBudget) -> Optional[re.Match]:
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + SCAN_CHUNK)
+        end = len(text) if end == -1 else end + 1
+        match = pattern.search(text, start, end)
+        if match or budget.spent:
+            return match
+        start = end
+    return None
+
+
+# Raw upload content: bytes, or a seekable binary file handle (e.g. a spooled upload)
+ResumeSource = Union[bytes, BinaryIO]
+
+
+def _as_stream(source: ResumeSource) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def _decode(source: ResumeSource) -> str:
+    data = source if isinstance(source, (bytes, bytearray, memoryview)) else _as_stream(source).read()
+    return bytes(data).decode('utf-8', errors='ignore')
+
+
+def extract_text_from_pdf(file_bytes: ResumeSource) -> str:
+    """Extract text from PDF file bytes or file handle, pages in parallel"""
+    return extract_pdf_pages(
+        file_bytes,
+        max_pages=config.PDF_MAX_PAGES,
+        page_timeout=config.PDF_PAGE_TIMEOUT,
+        workers=config.PDF_PAGE_WORKERS
+    ).text
+
+
+def extract_text_from_docx(file_bytes: ResumeSource) -> str:
+    """Extract text from DOCX file bytes or file handle"""
     try:
         from docx import Document
-        import io
-        doc = Document(io.BytesIO(file_bytes))
+        doc = Document(_as_stream(file_bytes))
         text = "\n".join([para.text for para in doc.paragraphs])
         return text.strip()
     except Exception as e:
@@ -46,75 +124,92 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
         return ""
 
 
-def extract_email(text: str) -> str:
+def extract_email(text: str, budget: Optional[TimeBudget] = None) -> str:
     """Extract email from text"""
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(pattern, text)
+    match = _search(EMAIL_PATTERN, text, budget or TimeBudget(config.PARSE_FIELD_BUDGET))
     return match.group(0) if match else ""
 
 
-def extract_phone(text: str) -> str:
+def extract_phone(text: str, budget: Optional[TimeBudget] = None) -> str:
     """Extract phone number from text"""
-    pattern = r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\./0-9]{7,15}'
-    match = re.search(pattern, text)
+    match = _search(PHONE_PATTERN, text, budget or TimeBudget(config.PARSE_FIELD_BUDGET))
     return match.group(0).strip() if match else ""
 
 
-def extract_name(text: str) -> str:
+def extract_name(text: str, sections: Optional[Sections] = None) -> str:
     """Extract name (usually first line of resume)"""
-    lines = text.strip().split('\n')
-    for line in lines[:5]:
+    for line in sections.leading_lines(5) if sections else leading_lines(text, 5):
         line = line.strip()
-        if line and not re.search(r'@|http|www|phone|email|address|resume|cv|curriculum', line.lower()):
+        if line and not NAME_EXCLUDE_PATTERN.search(line.lower()):
             if len(line.split()) <= 5 and len(line) < 50:
                 return line
     return ""
 
 
+def skill_relevance(level: SkillLevel) -> float:
+    return round(0.5 + (0.5 if level in [SkillLevel.ADVANCED, SkillLevel.EXPERT] else 0.2), 2)
+
+
+@timed("skills")
 def extract_skills(text: str) -> list:
     """Extract skills from resume text"""
     found_skills = []
     text_lower = text.lower()
 
-    for category, skills in SKILL_DATABASE.items():
-        for skill in skills:
-            if skill.lower() in text_lower:
-                # Determine level based on context
-                level = SkillLevel.INTERMEDIATE
-                skill_context = text_lower[max(0, text_lower.find(skill.lower()) - 100):text_lower.find(skill.lower()) + 100]
-
-                if any(word in skill_context for word in ["expert", "advanced", "extensive", "deep", "senior", "lead"]):
-                    level = SkillLevel.ADVANCED
-                elif any(word in skill_context for word in ["proficient", "strong", "experienced"]):
-                    level = SkillLevel.ADVANCED
-                elif any(word in skill_context for word in ["basic", "fundamental", "beginner", "learning", "familiar"]):
-                    level = SkillLevel.BEGINNER
-
-                found_skills.append(Skill(
-                    name=skill.title(),
-                    level=level,
-                    category=category,
-                    relevance_score=round(0.5 + (0.5 if level in [SkillLevel.ADVANCED, SkillLevel.EXPERT] else 0.2), 2)
-                ))
+    found = SKILL_MATCHER.find(text_lower)
+    if not found:
+        return found_skills
+    level_hits = scan_keywords(LEVEL_KEYWORDS_PATTERN, text_lower)
+
+    for skill, category, offset in SKILL_MATCHER.categorize(found):
+        # Determine level based on context around the first mention
+        level = SkillLevel.INTERMEDIATE
+        lo, hi = max(0, offset - SKILL_CONTEXT_WINDOW), offset + SKILL_CONTEXT_WINDOW
+
+        if level_hits["advanced"].any_within(lo, hi):
+            level = SkillLevel.ADVANCED
+        elif level_hits["beginner"].any_within(lo, hi):
+            level = SkillLevel.BEGINNER
+
+        found_skills.append(Skill(
+            name=skill.title(),
+            level=level,
+            category=category,
+            relevance_score=skill_relevance(level)
+        ))
 
     return found_skills
 
 
-def extract_experience(text: str) -> list:
+def find_roles(exp_text: str, budget: TimeBudget, limit: int = 5) -> list:
+    """(title, company) pairs from short lines that name a role"""
+    roles = []
+    lines = exp_text.split("\n")
+    for i, line in enumerate(lines):
+        if len(roles) >= limit or budget.spent:
+            break
+        if len(line) > MAX_ROLE_LINE or not ROLE_SUFFIX_PATTERN.search(line):
+            continue
+        # The company may sit on the following line
+        window = line + "\n" + (lines[i + 1][:MAX_ROLE_LINE] + "\n" if i + 1 < len(lines) else "")
+        for match in ROLE_PATTERN.finditer(window):
+            if match.start() >= len(line):
+                break
+            roles.append(match.groups())
+    return roles[:limit]
+
+
+def extract_experience(text: str, sections: Optional[Sections] = None, budget: Optional[TimeBudget] = None) -> list:
     """Extract work experience sections"""
     experiences = []
-    # Look for experience section
-    exp_pattern = r'(?:experience|work history|employment|professional background)(.*?)(?:education|skills|projects|certifications|$)'
-    exp_match = re.search(exp_pattern, text, re.IGNORECASE | re.DOTALL)
+    budget = budget or TimeBudget(config.PARSE_FIELD_BUDGET)
+    sections = sections or segment_sections(text, budget)
+    exp_text = sections.body("experience")
 
-    if exp_match:
-        exp_text = exp_match.group(1)
+    if exp_text:
         # Try to find individual roles
-        role_patterns = re.findall(
-            r'([A-Z][a-zA-Z\s]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director|Architect|Consultant|Specialist|Intern|Associate))\s*(?:at|@|-|–|,|\|)?\s*([A-Za-z\s&.]+?)(?:\d{4}|\n)',
-            exp_text
-        )
-        for title, company in role_patterns[:5]:
+        role_patterns = find_roles(exp_text, budget)
+        for title, company in role_patterns:
             experiences.append(Experience(
                 title=title.strip(),
                 company=company.strip(),
@@ -133,55 +228,56 @@ def extract_experience(text: str) -> list:
     return experiences
 
 
-def extract_education(text: str) -> list:
+def extract_education(text: str, sections: Optional[Sections] = None) -> list:
     """Extract education information"""
     educations = []
-    edu_pattern = r'(?:education|academic|qualification)(.*?)(?:experience|skills|projects|$)'
-    edu_match = re.search(edu_pattern, text, re.IGNORECASE | re.DOTALL)
-
-    if edu_match:
-        edu_text = edu_match.group(1)
-        degree_patterns = [
-            r"((?:Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?Tech|M\.?Tech|B\.?E\.?|M\.?E\.?|MBA|B\.?A\.?|M\.?A\.?|Associate|Diploma)[^,\n]*)",
-        ]
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, edu_text, re.IGNORECASE)
-            for match in matches[:3]:
-                educations.append(Education(
-                    degree=match.strip(),
-                    institution="",
-                    year="",
-                    field=""
-                ))
+    sections = sections or segment_sections(text, TimeBudget(config.PARSE_FIELD_BUDGET))
+    edu_text = sections.body("education")
+
+    if edu_text:
+        for match in itertools.islice(DEGREE_PATTERN.finditer(edu_text), 3):
+            educations.append(Education(
+                degree=match.group(1).strip(),
+                institution="",
+                year="",
+                field=""
+            ))
 
     return educations
 
 
-def parse_resume(file_bytes: bytes, filename: str) -> ResumeData:
-    """Main resume parsing function"""
-    # Extract text based on file type
+def extract_text(file_bytes: ResumeSource, filename: str) -> str:
+    """Extract plain text based on file type, falling back to a UTF-8 decode"""
     if filename.lower().endswith('.pdf'):
         text = extract_text_from_pdf(file_bytes)
     elif filename.lower().endswith(('.docx', '.doc')):
         text = extract_text_from_docx(file_bytes)
-    elif filename.lower().endswith('.txt'):
-        text = file_bytes.decode('utf-8', errors='ignore')
     else:
-        text = file_bytes.decode('utf-8', errors='ignore')
+        # Plain text: decode once, a second decode could not produce more text
+        return _decode(file_bytes)
 
     if not text:
-        text = file_bytes.decode('utf-8', errors='ignore')
+        text = _decode(file_bytes)
 
-    # Extract components
-    resume = ResumeData(
-        name=extract_name(text),
+    return text
+
+
+def build_resume(text: str) -> ResumeData:
+    """Build structured resume data from already-extracted text"""
+    sections = segment_sections(text, TimeBudget(config.PARSE_FIELD_BUDGET))
+    return ResumeData(
+        name=extract_name(text, sections),
         email=extract_email(text),
         phone=extract_phone(text),
         skills=extract_skills(text),
-        experience=extract_experience(text),
-        education=extract_education(text),
+        experience=extract_experience(text, sections),
+        education=extract_education(text, sections),
+        sections=sections.names(),
         raw_text=text[:5000],
         summary=text[:500] if text else ""
     )
 
-    return resume
+
+def parse_resume(file_bytes: ResumeSource, filename: str) -> ResumeData:
+    """Main resume parsing function"""
+    return build_resume(extract_text(file_bytes, filename))
@@ -0,0 +1,157 @@
+"""
+Resume Sections - Single-pass section segmentation of resume text
+The text is split into lines once; short lines that read like a section
+heading ("Work Experience", "EDUCATION:", "Technical Skills") start a new
+section. The resulting Sections structure keeps character offsets so
+extractors work on section slices instead of rescanning the whole document,
+and nothing backtracks across sections. Segmentation considers at most
+MAX_SECTION_LINES lines and MAX_SECTIONS headings and stops early once its
+time budget is spent; the last section found then runs to the end of the text.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# Canonical section -> heading phrases (normalized: lowercase, letters and spaces)
+SECTION_HEADINGS = {
+    "experience": ["experience", "experiences", "work history", "employment", "employment history",
+                   "professional background", "internships", "internship"],
+    "education": ["education", "academic background", "academics", "academic", "qualifications",
+                  "qualification", "academic qualifications"],
+    "skills": ["skills", "skill", "skill set", "skillset", "competencies", "technologies", "tech stack"],
+    "summary": ["summary", "profile", "objective", "about me", "about"],
+    "projects": ["projects", "project", "portfolio"],
+    "certifications": ["certifications", "certification", "certificates", "licenses"],
+}
+
+# Words allowed around a heading phrase ("Relevant Work Experience", "Skills & Tools")
+HEADING_MODIFIERS = {
+    "work", "professional", "relevant", "technical", "key", "core", "personal", "academic", "selected",
+    "other", "additional", "and", "career", "industry", "training", "tools", "my", "notable", "recent",
+    "licenses", "awards", "courses", "coursework", "highlights", "research", "side", "software", "history",
+}
+
+MAX_HEADING_CHARS = 48
+MAX_HEADING_WORDS = 5
+# Bounds on one segmentation pass; real resumes have a few hundred lines and < 20 headings
+MAX_SECTION_LINES = 10000
+MAX_SECTIONS = 32
+# Lines between time budget checks
+BUDGET_CHECK_LINES = 256
+
+# Inside these sections a "Label: text" line directly under other text belongs to
+# the entry ("Technologies: Python" under a role); it only starts a new section
+# on a line of its own or after a blank line
+ENTRY_SECTIONS = {"experience", "projects"}
+
+_HEADING_PHRASES = {phrase: name for name, phrases in SECTION_HEADINGS.items() for phrase in phrases}
+_HEADING_WORDS = {word for phrase in _HEADING_PHRASES for word in phrase.split()}
+_NORMALIZE = re.compile(r'[^a-z]+')
+
+
+def heading_section(line: str) -> Optional[str]:
+    """Canonical section name if the line (or its "Label:" prefix) is a heading"""
+    label = line.strip()
+    if not label or len(label) > MAX_HEADING_CHARS and ":" not in label[:MAX_HEADING_CHARS]:
+        return None
+    colon = label.find(":")
+    if colon != -1:
+        label = label[:colon]
+    elif label.endswith("."):
+        # Sentences are not headings
+        return None
+    if len(label) > MAX_HEADING_CHARS:
+        return None
+    words = _NORMALIZE.sub(" ", label.lower()).split()
+    if not words or len(words) > MAX_HEADING_WORDS or _HEADING_WORDS.isdisjoint(words):
+        return None
+    # Longest heading phrase inside the label; every other word must be a modifier
+    for size in (3, 2, 1):
+        for i in range(len(words) - size + 1):
+            name = _HEADING_PHRASES.get(" ".join(words[i:i + size]))
+            if name and all(w in HEADING_MODIFIERS for w in words[:i] + words[i + size:]):
+                return name
+    return None
+
+
+class Section:
+    """One detected section: its heading and the body's character span"""
+
+    __slots__ = ("name", "heading", "offset", "start", "end")
+
+    def __init__(self, name: str, heading: str, offset: int, start: int, end: int):
+        self.name = name
+        self.heading = heading
+        # Offset of the heading line; the body runs from start to end
+        self.offset = offset
+        self.start = start
+        self.end = end
+
+
+class Sections:
+    """Section headings of a resume with character offsets, found in one pass over its lines"""
+
+    def __init__(self, text: str, budget=None):
+        """budget: optional deadline with a ``spent`` flag (resume_parser.TimeBudget)"""
+        self.text = text
+        # Every heading in document order; the first of each name is the canonical one
+        self.order: List[Section] = []
+        self._by_name: Dict[str, Section] = {}
+
+        current: Optional[Section] = None
+        offset = 0
+        previous = ""
+        lines = text.split("\n", MAX_SECTION_LINES)[:MAX_SECTION_LINES]
+        for number, line in enumerate(lines):
+            if len(self.order) >= MAX_SECTIONS or (
+                    budget is not None and number % BUDGET_CHECK_LINES == 0 and budget.spent):
+                break
+            start, offset = offset, offset + len(line) + 1
+            after_text, previous = bool(previous.strip()), line
+            # Cheap pre-filter: headings are short, or short before a colon
+            if len(line) > MAX_HEADING_CHARS and ":" not in line[:MAX_HEADING_CHARS]:
+                continue
+            name = heading_section(line)
+            if name is None:
+                continue
+            colon = line.find(":")
+            # "Skills: Python, SQL" carries its body on the heading line
+            inline = colon != -1 and bool(line[colon + 1:].strip())
+            if inline and after_text and current is not None and current.name in ENTRY_SECTIONS:
+                continue
+            if current is not None:
+                current.end = start
+            body_start = start + colon + 1 if inline else offset
+            current = Section(name, line.strip(), start, min(body_start, len(text)), len(text))
+            self.order.append(current)
+            self._by_name.setdefault(name, current)
+
+    def has(self, name: str) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> Optional[Section]:
+        return self._by_name.get(name)
+
+    def body(self, name: str) -> str:
+        """Text of every section with this name ("Experience" and "Internships"), empty if there is none"""
+        if name not in self._by_name:
+            return ""
+        return "\n".join(self.text[s.start:s.end] for s in self.order if s.name == name)
+
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    def leading_lines(self, count: int) -> List[str]:
+        return leading_lines(self.text, count)
+
+    def spans(self) -> List[Tuple[str, int, int]]:
+        return [(section.name, section.start, section.end) for section in self.order]
+
+
+def leading_lines(text: str, count: int) -> List[str]:
+    """First ``count`` lines after any leading blank lines (where a name usually is)"""
+    return text.lstrip().split("\n", count)[:count]
+
+
+def segment_sections(text: str, budget=None) -> Sections:
+    return Sections(text, budget)
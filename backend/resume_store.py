@@ -0,0 +1,242 @@
+"""
+Resume Store - Pluggable persistence for parsed resumes and user profiles
+Provides a bounded in-memory LRU/TTL store and a SQLite (WAL) store that can be
+shared across worker processes. raw_text is kept zlib-compressed and only
+decompressed when a caller asks for it; the memory store holds CompactResume
+records and builds ResumeData on read.
+"""
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from models import ResumeData, ProfileInput
+from compact_resume import CompactResume, compress_text, decompress_text
+
+
+class ResumeStore(ABC):
+    """Storage interface used by the API for resumes and profiles"""
+
+    @abstractmethod
+    def get(self, resume_id: str, with_raw_text: bool = True) -> Optional[ResumeData]:
+        """Return a stored resume, or None; raw_text is left empty unless requested"""
+
+    @abstractmethod
+    def put(self, resume: ResumeData):
+        """Insert or replace a resume"""
+
+    @abstractmethod
+    def delete(self, resume_id: str):
+        """Remove a resume if present"""
+
+    @abstractmethod
+    def get_profile(self, profile_id: str) -> Optional[ProfileInput]:
+        """Return a stored profile, or None"""
+
+    @abstractmethod
+    def put_profile(self, profile_id: str, profile: ProfileInput):
+        """Insert or replace a profile"""
+
+    def __contains__(self, resume_id: str) -> bool:
+        return self.get(resume_id, with_raw_text=False) is not None
+
+    def close(self):
+        pass
+
+
+class MemoryResumeStore(ResumeStore):
+    """Per-process store bounded by entry count (LRU) and optional idle TTL"""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 0):
+        self.max_entries = max(max_entries, 1)
+        self.ttl_seconds = ttl_seconds
+        # resume_id -> (compact resume, last access)
+        self._resumes: "OrderedDict[str, Tuple[CompactResume, float]]" = OrderedDict()
+        self._profiles: "OrderedDict[str, Tuple[ProfileInput, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expired(self, touched: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - touched > self.ttl_seconds
+
+    def _trim(self, entries: OrderedDict):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get(self, resume_id: str, with_raw_text: bool = True) -> Optional[ResumeData]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._resumes.get(resume_id)
+            if entry is None:
+                return None
+            compact, touched = entry
+            if self._expired(touched, now):
+                del self._resumes[resume_id]
+                return None
+            self._resumes[resume_id] = (compact, now)
+            self._resumes.move_to_end(resume_id)
+        return compact.to_resume(with_raw_text)
+
+    def put(self, resume: ResumeData):
+        entry = (CompactResume(resume), time.monotonic())
+        with self._lock:
+            self._resumes[resume.id] = entry
+            self._resumes.move_to_end(resume.id)
+            self._trim(self._resumes)
+
+    def delete(self, resume_id: str):
+        with self._lock:
+            self._resumes.pop(resume_id, None)
+
+    def get_profile(self, profile_id: str) -> Optional[ProfileInput]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._profiles.get(profile_id)
+            if entry is None:
+                return None
+            if self._expired(entry[1], now):
+                del self._profiles[profile_id]
+                return None
+            self._profiles[profile_id] = (entry[0], now)
+            self._profiles.move_to_end(profile_id)
+            return entry[0]
+
+    def put_profile(self, profile_id: str, profile: ProfileInput):
+        with self._lock:
+            self._profiles[profile_id] = (profile, time.monotonic())
+            self._profiles.move_to_end(profile_id)
+            self._trim(self._profiles)
+
+    def __len__(self) -> int:
+        return len(self._resumes)
+
+
+class SQLiteResumeStore(ResumeStore):
+    """Durable store in a single SQLite file (WAL mode), shareable across workers
+
+    Like the memory store, entries expire after ttl_seconds without access and
+    the least recently used rows beyond max_entries are evicted. Reads refresh
+    an entry's timestamp at most once per TOUCH_INTERVAL, and eviction runs
+    from put() every PURGE_EVERY writes or PURGE_INTERVAL seconds, so both
+    limits are approximate between purges.
+    """
+
+    TOUCH_INTERVAL = 1.0
+    PURGE_EVERY = 100
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl_seconds: float = 0):
+        self.path = path
+        self.max_entries = max(max_entries, 1)
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._last_purge = time.monotonic()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            # updated_at is the last access or write (wall clock, shared across processes)
+            for table, columns in (("resumes", "data TEXT NOT NULL, raw_text BLOB"),
+                                   ("profiles", "data TEXT NOT NULL")):
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, {columns}, updated_at REAL NOT NULL)"
+                )
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_updated_at ON {table} (updated_at)")
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds if self.ttl_seconds else 0.0
+
+    def _touch(self, table: str, row_id: str, updated_at: float):
+        now = time.time()
+        if now - updated_at >= self.TOUCH_INTERVAL:
+            with self._lock:
+                self._conn.execute(f"UPDATE {table} SET updated_at = ? WHERE id = ?", (now, row_id))
+
+    def _wrote(self):
+        self._writes += 1
+        if self._writes >= self.PURGE_EVERY or time.monotonic() - self._last_purge >= self.PURGE_INTERVAL:
+            self.purge()
+
+    def get(self, resume_id: str, with_raw_text: bool = True) -> Optional[ResumeData]:
+        # Only pull the compressed raw_text column when the caller needs it
+        columns = "updated_at, data, raw_text" if with_raw_text else "updated_at, data"
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {columns} FROM resumes WHERE id = ? AND updated_at >= ?",
+                (resume_id, self._cutoff())
+            ).fetchone()
+        if row is None:
+            return None
+        self._touch("resumes", resume_id, row[0])
+        resume = ResumeData.model_validate_json(row[1])
+        if with_raw_text:
+            resume.raw_text = decompress_text(row[2])
+        return resume
+
+    def put(self, resume: ResumeData):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumes (id, data, raw_text, updated_at) VALUES (?, ?, ?, ?)",
+                (resume.id, resume.model_dump_json(exclude={"raw_text"}), compress_text(resume.raw_text), time.time())
+            )
+        self._wrote()
+
+    def delete(self, resume_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
+
+    def get_profile(self, profile_id: str) -> Optional[ProfileInput]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at, data FROM profiles WHERE id = ? AND updated_at >= ?",
+                (profile_id, self._cutoff())
+            ).fetchone()
+        if row is None:
+            return None
+        self._touch("profiles", profile_id, row[0])
+        return ProfileInput.model_validate_json(row[1])
+
+    def put_profile(self, profile_id: str, profile: ProfileInput):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (id, data, updated_at) VALUES (?, ?, ?)",
+                (profile_id, profile.model_dump_json(), time.time())
+            )
+        self._wrote()
+
+    def purge(self) -> int:
+        """Delete expired rows and evict beyond max_entries; returns the number of resumes removed"""
+        cutoff = self._cutoff()
+        removed = 0
+        with self._lock:
+            self._writes = 0
+            self._last_purge = time.monotonic()
+            for table in ("resumes", "profiles"):
+                count = self._conn.execute(f"DELETE FROM {table} WHERE updated_at < ?", (cutoff,)).rowcount
+                count += self._conn.execute(
+                    f"DELETE FROM {table} WHERE id IN ("
+                    f"SELECT id FROM {table} ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+                if table == "resumes":
+                    removed = count
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_store(backend: str, path: str = "", max_entries: int = 10000, ttl_seconds: float = 0) -> ResumeStore:
+    """Build the store selected by configuration ("memory" or "sqlite")"""
+    if backend == "sqlite":
+        return SQLiteResumeStore(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if backend == "memory":
+        return MemoryResumeStore(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown resume store backend: {backend}")
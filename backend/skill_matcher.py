@@ -0,0 +1,129 @@
+"""
+Skill Matcher - Single-pass, word-boundary-aware skill recognition
+Compiles a skill taxonomy into one trie-shaped regex so every skill occurrence
+is found in a single scan of the resume text, regardless of taxonomy size.
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+
+# A skill must not be glued to other letters/digits ("go" in "good", "java" in "javascript")
+_LEFT_BOUNDARY = r'(?<![a-z0-9])'
+_RIGHT_BOUNDARY = r'(?![a-z0-9])'
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _build_trie(terms: List[str]) -> dict:
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return trie
+
+
+def _trie_to_pattern(node: dict) -> str:
+    """Render a trie as a regex that prefers the longest term at each position"""
+    terminal = '' in node
+    branches = [re.escape(ch) + _trie_to_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if terminal:
+        # Greedy optional: try the longer term first, backtrack to this one
+        return '(?:' + body + ')?' if len(branches) == 1 else body + '?'
+    return body
+
+
+class TermScanner:
+    """Finds every occurrence of a fixed set of terms in one regex pass
+
+    With ``word_boundary`` terms must stand alone ("go" does not match "good");
+    without it they match anywhere, like a plain substring test.
+    """
+
+    def __init__(self, terms, word_boundary: bool = True):
+        self.word_boundary = word_boundary
+        self._terms = set(terms)
+        trie = _trie_to_pattern(_build_trie(sorted(self._terms)))
+        left, right = (_LEFT_BOUNDARY, _RIGHT_BOUNDARY) if word_boundary else ('', '')
+        # Zero-width lookahead so overlapping terms ("rest api" / "api design") are
+        # all reported; each start position yields the longest term beginning there.
+        self._pattern = re.compile(left + '(?=(' + trie + ')' + right + ')') if self._terms else None
+
+        # Shorter terms sharing a start with a longer one ("react" / "react native")
+        # are resolved once, at build time.
+        self._prefixes: Dict[str, List[str]] = {term: self._prefix_terms(term) for term in self._terms}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _prefix_terms(self, term: str) -> List[str]:
+        return [term[:end] for end in range(1, len(term))
+                if not (self.word_boundary and _is_word_char(term[end])) and term[:end] in self._terms]
+
+    def find(self, text_lower: str) -> Dict[str, int]:
+        """Return {term: offset of first occurrence} for every term in the text"""
+        found: Dict[str, int] = {}
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text_lower):
+            term, offset = match.group(1), match.start()
+            if term not in found:
+                found[term] = offset
+            for prefix in self._prefixes[term]:
+                if prefix not in found:
+                    found[prefix] = offset
+        return found
+
+
+class SkillMatcher(TermScanner):
+    """Precompiled word-boundary matcher over a {category: [skill, ...]} taxonomy"""
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        # term -> [(taxonomy order, category)], preserving declaration order
+        self._entries: Dict[str, List[Tuple[int, str]]] = {}
+        order = 0
+        for category, skills in taxonomy.items():
+            for skill in skills:
+                self._entries.setdefault(skill.lower(), []).append((order, category))
+                order += 1
+        super().__init__(self._entries, word_boundary=True)
+
+    def categorize(self, found: Dict[str, int]) -> List[Tuple[str, str, int]]:
+        """Expand found terms into (term, category, offset) in taxonomy order"""
+        hits = [(order, term, category, offset)
+                for term, offset in found.items()
+                for order, category in self._entries[term]]
+        hits.sort()
+        return [(term, category, offset) for _, term, category, offset in hits]
+
+
+class KeywordOffsets:
+    """Sorted occurrence offsets of a keyword group, for fast window queries"""
+
+    def __init__(self, spans: List[Tuple[int, int]]):
+        self._starts = [start for start, _ in spans]
+        self._ends = [end for _, end in spans]
+
+    def any_within(self, lo: int, hi: int) -> bool:
+        """True if some occurrence lies entirely inside text[lo:hi]"""
+        i = bisect_left(self._starts, lo)
+        while i < len(self._starts) and self._starts[i] < hi:
+            if self._ends[i] <= hi:
+                return True
+            i += 1
+        return False
+
+
+def scan_keywords(pattern: re.Pattern, text_lower: str) -> Dict[str, KeywordOffsets]:
+    """Scan once for a named-group keyword pattern, bucketing spans by group name"""
+    spans: Dict[str, List[Tuple[int, int]]] = {name: [] for name in pattern.groupindex}
+    for match in pattern.finditer(text_lower):
+        spans[match.lastgroup].append(match.span())
+    return {name: KeywordOffsets(group) for name, group in spans.items()}
@@ -0,0 +1,126 @@
+"""
+Startup - Background warm-up and an import-time startup profile
+Heavy parser dependencies (PyPDF2, python-docx) stay lazily imported so the
+app starts fast; once it is ready, a background thread imports them and runs
+the parsing/analysis hot paths once so the first real request does not pay
+for it. The mentor is warmed on the event loop before serving instead, since
+its caches are not thread-safe.
+Run ``python startup.py`` for an import-time breakdown of the app.
+"""
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+WARMUP_TEXT = """Jane Doe
+jane.doe@example.com | (555) 123-4567
+Experience
+Senior Software Engineer at Example Corp
+Built Python and React services on AWS with Docker and Kubernetes
+Education
+Bachelor of Science in Computer Science, Example University
+"""
+
+# state: pending -> running -> done | failed
+warmup_status: Dict = {"state": "pending", "seconds": 0.0, "error": ""}
+
+
+def warm_extraction():
+    """Import the document parsers; also used as the extraction worker initializer"""
+    import PyPDF2  # noqa: F401
+    import docx  # noqa: F401
+    from resume_parser import extract_text
+    extract_text(WARMUP_TEXT.encode(), "warmup.txt")
+
+
+def warm_analysis():
+    """Run one resume through parsing and analysis"""
+    from resume_parser import build_resume
+    from career_analyzer import (
+        LEARNING_RESOURCES_DB, analyze_resume, learning_resources_for, match_career_paths
+    )
+
+    resume = build_resume(WARMUP_TEXT)
+    analyze_resume(resume)
+    match_career_paths(resume)
+    for skill_key in LEARNING_RESOURCES_DB:
+        learning_resources_for(skill_key)
+
+
+def warm_mentor():
+    """Render the mentor's answers once; call on the event loop, before serving"""
+    from resume_parser import build_resume
+    from ai_engine import ai_mentor
+
+    ai_mentor.warm_up(build_resume(WARMUP_TEXT))
+
+
+def start_warmup(steps: Tuple[Callable[[], None], ...] = (warm_extraction, warm_analysis)) -> threading.Thread:
+    """Run the warm-up steps once in a daemon thread"""
+    def run():
+        warmup_status["state"] = "running"
+        start = time.perf_counter()
+        try:
+            for step in steps:
+                step()
+        except Exception as e:
+            warmup_status.update(state="failed", error=str(e) or type(e).__name__)
+        else:
+            warmup_status["state"] = "done"
+        warmup_status["seconds"] = round(time.perf_counter() - start, 3)
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def import_profile(module: str = "main") -> List[Tuple[str, float, float, int]]:
+    """(module, self ms, cumulative ms, depth) for a fresh interpreter importing ``module``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us) / 1000, int(cumulative_us) / 1000, (len(indent) - 1) // 2))
+    return rows
+
+
+def print_import_profile(module: str = "main", top: int = 15):
+    rows = import_profile(module)
+    by_package: Dict[str, float] = {}
+    for name, self_ms, _, _ in rows:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + self_ms
+    total = next((cumulative for name, _, cumulative, _ in rows if name == module), 0.0)
+    print(f"import {module}: {total:.1f} ms")
+    print("\nBy top-level package (self time):")
+    for package, ms in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {ms:8.1f} ms  {package}")
+    print(f"\nSlowest direct imports of {module} (cumulative):")
+    # importtime lists children before their parent: walk back from the module's row
+    end = next((i for i, row in enumerate(rows) if row[0] == module and row[3] == 0), len(rows))
+    first = end
+    while first > 0 and rows[first - 1][3] > 0:
+        first -= 1
+    direct = [row for row in rows[first:end] if row[3] == 1]
+    for name, _, cumulative, _ in sorted(direct, key=lambda row: -row[2])[:top]:
+        print(f"  {cumulative:8.1f} ms  {name}")
+
+    start = time.perf_counter()
+    warm_extraction()
+    warm_analysis()
+    warm_mentor()
+    print(f"\nWarm-up (first parse + analysis in this process): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    print_import_profile(sys.argv[1] if len(sys.argv) > 1 else "main")
@@ -0,0 +1,40 @@
+"""
+Token Stream - Incremental delivery of mentor responses
+Defines the async token-generator interface used for streaming chat, plus a
+local fake generator that replays a finished response token by token
+"""
+import asyncio
+import re
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+# A token is a word with its trailing whitespace, or a run of leading whitespace
+_TOKEN_PATTERN = re.compile(r'\S+\s*|\s+')
+
+
+class TokenGenerator(ABC):
+    """Turns a prompt or finished text into an async stream of text chunks"""
+
+    @abstractmethod
+    def stream(self, text: str) -> AsyncIterator[str]:
+        """Yield the response to text as successive chunks"""
+
+
+class FakeTokenGenerator(TokenGenerator):
+    """Replays text in word-sized chunks with an optional per-chunk delay
+
+    Stands in for a real model during development and tests: chunk boundaries
+    and pacing look like model output while the content stays deterministic.
+    """
+
+    def __init__(self, delay: float = 0.0, tokens_per_chunk: int = 1):
+        self.delay = delay
+        self.tokens_per_chunk = max(tokens_per_chunk, 1)
+
+    async def stream(self, text: str) -> AsyncIterator[str]:
+        tokens = _TOKEN_PATTERN.findall(text)
+        for i in range(0, len(tokens), self.tokens_per_chunk):
+            # Always yield control so a disconnect can cancel between chunks
+            await asyncio.sleep(self.delay)
+            yield ''.join(tokens[i:i + self.tokens_per_chunk])
@@ -0,0 +1,106 @@
+"""
+Upload Ingestion - Streams uploaded files into a size-capped spool
+Content is sniffed from its first bytes so mislabelled files are rejected before being buffered
+"""
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
+from fastapi import UploadFile
+
+
+# Leading bytes that identify each supported container format
+MAGIC_BYTES = {
+    '.pdf': (b'%PDF-',),
+    '.docx': (b'PK\x03\x04',),
+    '.doc': (b'PK\x03\x04', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),
+    '.zip': (b'PK\x03\x04',),
+}
+SNIFF_BYTES = 8
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+class UnsupportedContent(Exception):
+    """Raised when an upload's content does not match its declared file type"""
+
+
+def sniff_content(head: bytes, file_ext: str):
+    """Validate the first bytes of an upload against its extension"""
+    signatures = MAGIC_BYTES.get(file_ext)
+    if signatures is not None:
+        if not head.startswith(signatures):
+            raise UnsupportedContent(f"File content is not a valid {file_ext} document")
+    elif b'\x00' in head:
+        # Plain text never contains NUL bytes; this is a binary file with a .txt name
+        raise UnsupportedContent("File content is not plain text")
+
+
+class SpoolWriter:
+    """Accumulates chunks into a SpooledTemporaryFile, enforcing type and size limits
+
+    If a hashlib-style ``hasher`` is given it is fed every chunk as it streams in.
+    """
+
+    def __init__(self, file_ext: str, max_bytes: int, spool_bytes: int, hasher=None):
+        self.file_ext = file_ext
+        self.max_bytes = max_bytes
+        self.hasher = hasher
+        self.spool = SpooledTemporaryFile(max_size=spool_bytes)
+        self.size = 0
+        self._head = b''
+
+    def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(f"File exceeds the {self.max_bytes / (1024 * 1024):g} MB upload limit")
+        if len(self._head) < SNIFF_BYTES:
+            self._head += chunk[:SNIFF_BYTES - len(self._head)]
+            if len(self._head) >= SNIFF_BYTES:
+                sniff_content(self._head, self.file_ext)
+        if self.file_ext not in MAGIC_BYTES and b'\x00' in chunk:
+            # Plain text has no NUL anywhere, not just in its first bytes
+            raise UnsupportedContent("File content is not plain text")
+        self.spool.write(chunk)
+        if self.hasher is not None:
+            self.hasher.update(chunk)
+
+    def finish(self) -> SpooledTemporaryFile:
+        if not self.size:
+            raise UnsupportedContent("Uploaded file is empty")
+        if len(self._head) < SNIFF_BYTES:
+            sniff_content(self._head, self.file_ext)
+        self.spool.seek(0)
+        return self.spool
+
+
+async def spool_upload(file: UploadFile, file_ext: str, max_bytes: int,
+                       chunk_size: int, spool_bytes: int, hasher=None) -> SpooledTemporaryFile:
+    """Copy an upload chunk by chunk into a spooled file, enforcing type and size limits"""
+    writer = SpoolWriter(file_ext, max_bytes, spool_bytes, hasher)
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            writer.write(chunk)
+        return writer.finish()
+    except Exception:
+        writer.spool.close()
+        raise
+
+
+def spool_stream(stream: BinaryIO, file_ext: str, max_bytes: int,
+                 chunk_size: int, spool_bytes: int, hasher=None) -> SpooledTemporaryFile:
+    """Blocking counterpart of spool_upload for local streams such as archive members"""
+    writer = SpoolWriter(file_ext, max_bytes, spool_bytes, hasher)
+    try:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            writer.write(chunk)
+        return writer.finish()
+    except Exception:
+        writer.spool.close()
+        raise